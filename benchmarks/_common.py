@@ -0,0 +1,142 @@
+import functools
+import sys
+from pathlib import Path
+from typing import NamedTuple, Optional
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# Benchmarks are run as `python -m benchmarks.<name>`, the application imports itself as `src`
+sys.path.insert(0, str(ROOT_DIR))
+
+from loguru import logger  # noqa: E402
+
+from src.utils.config_reader import get_config, CacheConfig  # noqa: E402
+
+logger.remove()
+
+
+ATTRIBUTE_NAMES = ("placeholder", "title", "tooltip", "aria-label")
+
+
+class TreeShape(NamedTuple):
+    """
+    Shape of a synthetic locales tree. Shares are fractions of the messages of a
+    file, spread evenly over it.
+    """
+
+    languages: int = 4
+    files: int = 20
+    # Messages per file
+    keys: int = 200
+    attributes: int = 1
+    # Messages with a plural select expression instead of a one-line value
+    selects: float = 0.0
+    # Messages with a value over two lines
+    multiline: float = 0.0
+    # Terms at the top of each file, referenced by the one-line values
+    terms: int = 0
+    # Messages left out of every language but the first one
+    missing: float = 0.0
+
+
+# Mixes of entries modelled on example_locales, from a quick run to a large project
+SHAPES = {
+    "small": TreeShape(2, 5, 100, selects=0.1, multiline=0.1, terms=2, missing=0.05),
+    "medium": TreeShape(4, 20, 100, selects=0.1, multiline=0.1, terms=2, missing=0.05),
+    "large": TreeShape(8, 40, 200, selects=0.1, multiline=0.1, terms=2, missing=0.05),
+    "attributes": TreeShape(4, 10, 200, attributes=4, selects=0.05, multiline=0.2),
+}
+
+
+def _picked(share: float, index: int, phase: float = 0.0) -> bool:
+    """
+    Whether the index-th item falls in a share, spreading the picks evenly. Different
+    phases (0 to 1) keep the picks of different shares apart.
+    """
+    return int((index + 1) * share + phase) != int(index * share + phase)
+
+
+def _entry(shape: TreeShape, name: str, lang: str, key_index: int, terms: list) -> str:
+    lines = [f"# Comment for {name}"]
+    if _picked(shape.selects, key_index):
+        lines += [
+            f"{name} =",
+            "    { $count ->",
+            f"        [one] One item of {name} in {lang}",
+            f"       *[other] {{ $count }} items of {name} in {lang}",
+            "    }",
+        ]
+    elif _picked(shape.multiline, key_index, 0.5):
+        lines += [
+            f"{name} =",
+            f"    First line of {name} in {lang}",
+            "    second line with { $count } items",
+        ]
+    else:
+        term = f" for {{ {terms[key_index % len(terms)]} }}" if terms else ""
+        lines.append(f"{name} = Value {{ $count }} of {name} in {lang}{term}")
+    for attribute_index in range(shape.attributes):
+        attribute = ATTRIBUTE_NAMES[attribute_index % len(ATTRIBUTE_NAMES)]
+        if attribute_index >= len(ATTRIBUTE_NAMES):
+            attribute += str(attribute_index)
+        lines.append(f"    .{attribute} = {attribute.capitalize()} for {name}")
+    return "\n".join(lines) + "\n"
+
+
+def make_locale_tree(
+    root: Path,
+    languages: int = 4,
+    files: int = 20,
+    keys: int = 200,
+    shape: Optional[TreeShape] = None,
+) -> Path:
+    """
+    Writes a synthetic locales tree (root/<lang>/file_<n>.ftl) and returns its root.
+
+    :param root: Directory to create the tree in.
+    :param languages: Number of locale folders.
+    :param files: Number of .ftl files per locale.
+    :param keys: Number of messages per file.
+    :param shape: Full shape of the tree; replaces the three counts when given.
+        By default every message has a one-line value and one attribute.
+    """
+    shape = shape or TreeShape(languages, files, keys)
+    for lang_index in range(shape.languages):
+        lang = f"lang{lang_index}"
+        lang_dir = root / lang
+        lang_dir.mkdir(parents=True, exist_ok=True)
+        for file_index in range(shape.files):
+            terms = [f"-term-{file_index}-{n}" for n in range(shape.terms)]
+            entries = [f"{term} = Term {term} in {lang}\n" for term in terms]
+            entries += [
+                _entry(shape, f"key-{file_index}-{key_index}", lang, key_index, terms)
+                for key_index in range(shape.keys)
+                if not (lang_index and _picked(shape.missing, key_index, 0.25))
+            ]
+            (lang_dir / f"file_{file_index}.ftl").write_text(
+                "".join(entries), encoding="utf-8"
+            )
+    return root
+
+
+def no_cache() -> CacheConfig:
+    """Parse cache settings with the cache off, so every load parses the files."""
+    return get_config(CacheConfig, root_key="cache").model_copy(
+        update={"enabled": False}
+    )
+
+
+def use_editor_without_cache() -> None:
+    """Makes the editor open projects without the parse cache, for this process."""
+    from src import editor as editor_module
+    from src.fluent_api.FluentAPI import FluentAPI
+
+    editor_module.FluentAPI = functools.partial(FluentAPI, cache_config=no_cache())
+
+
+def wait_until_loaded(app, editor) -> None:
+    """Runs the event loop until the editor has loaded its folder in the background."""
+    from PyQt6.QtCore import QEventLoop
+
+    while editor.loader:
+        app.processEvents(QEventLoop.ProcessEventsFlag.WaitForMoreEvents)
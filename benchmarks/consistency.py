@@ -0,0 +1,77 @@
+"""
+Measures the cross-language consistency check on a large in-memory project, serial
+and in a process pool, and the incremental re-check after an edit.
+
+Usage: python -m benchmarks.consistency [--languages 4] [--keys 500000] [--workers 0]
+"""
+
+import argparse
+import os
+import time
+
+import benchmarks._common  # noqa: F401
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.base_type.translations import Translation
+from src.fluent_api.consistency import ConsistencyChecker, check_project
+
+# Pattern shapes in the proportions of a typical project, {n} is the key number
+SHAPES = [
+    "Plain text number {n}",
+    "Plain text number {n}",
+    "Plain text number {n}",
+    "Hello, {{ $user }}! You have {{ $count }} messages ({n})",
+    "Welcome to {{ -brand-name }} ({n})",
+    "{{ $count ->\n    [one] One file ({n})\n   *[other] {{ $count }} files\n}}",
+    'Updated {{ DATETIME($date, month: "long") }} ({n})',
+]
+
+
+def make_translations(fluent_api: FluentAPI, languages: int, keys: int) -> None:
+    """Fills the project in memory; one key in a hundred drops a placeable in a translation."""
+    for lang_index in range(languages):
+        language = f"lang{lang_index}"
+        fluent_api.bundles[language] = []
+        for n in range(keys):
+            value = SHAPES[n % len(SHAPES)].format(n=n)
+            if lang_index and n % 100 == 0:
+                value = f"Translated without placeables {n}"
+            fluent_api.translations.setdefault(f"key-{n}", {})[language] = Translation(
+                value=value, attributes={".title": f"Title {n}"}
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=500_000)
+    parser.add_argument("--workers", type=int, default=0, help="0 - one per CPU core")
+    args = parser.parse_args()
+
+    fluent_api = FluentAPI(None, load=False)
+    make_translations(fluent_api, args.languages, args.keys)
+    source = fluent_api.get_languages()[0]
+    entries = args.languages * args.keys
+    workers = args.workers or os.cpu_count() or 1
+
+    for name, count in (("serial", 1), (f"{workers} workers", workers)):
+        started = time.perf_counter()
+        problems = check_project(fluent_api, source, workers=count)
+        seconds = time.perf_counter() - started
+        print(
+            f"{name:>12}: {entries:,} entries in {seconds:.2f} s "
+            f"({entries / seconds:,.0f} entries/s), {len(problems):,} problems"
+        )
+
+    checker = ConsistencyChecker(fluent_api, source)
+    variable = "key-3"  # A message with placeables
+    target = fluent_api.get_languages()[-1]
+    started = time.perf_counter()
+    fluent_api.update(variable, target, "value", "Dropped the placeable")
+    print(
+        f"edit + incremental re-check: {(time.perf_counter() - started) * 1e3:.2f} ms, "
+        f"{len(checker.problems(variable))} problem(s) on the edited key"
+    )
+
+
+if __name__ == "__main__":
+    main()
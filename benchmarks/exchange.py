@@ -0,0 +1,113 @@
+"""
+Measures export and import throughput in rows per second for the CSV, JSONL and
+XLIFF exchange formats, and the peak memory of reading each file.
+
+Usage: python -m benchmarks.exchange [--languages 4] [--files 50] [--keys 1000]
+"""
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from benchmarks._common import make_locale_tree, no_cache
+from src.fluent_api import exchange
+from src.fluent_api.FluentAPI import FluentAPI
+
+
+def revised(rows, language: str):
+    """Changes every value of a language, so each imported row is an edit."""
+    for row in rows:
+        if language in row.values:
+            row.values[language] += " (rev)"
+        yield row
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        locales = make_locale_tree(
+            tmp / "locales", args.languages, args.files, args.keys
+        )
+        fluent_api = FluentAPI(locales, cache_config=no_cache())
+        languages = fluent_api.get_languages()
+        source, target = languages[0], languages[-1]
+
+        formats = {
+            "csv": (
+                lambda rows, file: exchange.write_csv(rows, file, languages),
+                exchange.read_csv,
+                {"encoding": "utf-8-sig", "newline": ""},
+            ),
+            "jsonl": (exchange.write_jsonl, exchange.read_jsonl, {"encoding": "utf-8"}),
+            "xliff": (
+                lambda rows, file: exchange.write_xliff(rows, file, source, target),
+                None,
+                {"encoding": "utf-8"},
+            ),
+        }
+
+        for name, (write, read, open_args) in formats.items():
+            path = tmp / f"export.{name}"
+            row_languages = [source, target] if name == "xliff" else languages
+
+            started = time.perf_counter()
+            with open(path, "w", **open_args) as file:
+                rows = write(exchange.iter_rows(fluent_api, row_languages), file)
+            export_seconds = time.perf_counter() - started
+
+            def read_rows(file_path: Path):
+                if read is None:
+                    return exchange.read_xliff(str(file_path)), None
+                file = open(file_path, **open_args)
+                return read(file), file
+
+            # Memory of reading alone, without the project changing
+            tracemalloc.start()
+            rows_read, file = read_rows(path)
+            for _ in rows_read:
+                pass
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            if file:
+                file.close()
+
+            started = time.perf_counter()
+            rows_read, file = read_rows(path)
+            unchanged = exchange.import_rows(fluent_api, rows_read)
+            unchanged_seconds = time.perf_counter() - started
+            if file:
+                file.close()
+
+            revised_path = tmp / f"revised.{name}"
+            rows_read, file = read_rows(path)
+            with open(revised_path, "w", **open_args) as revised_file:
+                write(revised(rows_read, target), revised_file)
+            if file:
+                file.close()
+
+            started = time.perf_counter()
+            rows_read, file = read_rows(revised_path)
+            changed = exchange.import_rows(fluent_api, rows_read)
+            changed_seconds = time.perf_counter() - started
+            if file:
+                file.close()
+
+            print(
+                f"{name:>5}: {rows} rows, {path.stat().st_size / 1e6:.1f} MB, "
+                f"read peak {peak / 1e6:.2f} MB | export {rows / export_seconds:,.0f} rows/s, "
+                f"import unchanged {unchanged.rows / unchanged_seconds:,.0f} rows/s, "
+                f"import edited {changed.rows / changed_seconds:,.0f} rows/s "
+                f"({changed.changed} changes)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Measures switching the table between the filtered views (missing, not checked,
+commented, changed) on a large project, compared with repopulating the table.
+
+Usage: python -m benchmarks.filter_views [--languages 4] [--files 50] [--keys 1000]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks._common import make_locale_tree, wait_until_loaded  # noqa: E402
+from benchmarks._common import use_editor_without_cache  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from src.editor import FluentusEditor  # noqa: E402
+from src.fluent_api.filter_index import FilterIndex  # noqa: E402
+
+
+def timed(app: QApplication, action) -> float:
+    started = time.perf_counter()
+    action()
+    app.processEvents()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=1000)
+    args = parser.parse_args()
+
+    use_editor_without_cache()
+    app = QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, args.files, args.keys)
+        editor = FluentusEditor(folder=str(locales))
+        editor.show()
+        wait_until_loaded(app, editor)
+        fluent_api = editor.fluent_api
+        language = editor.filter_language.currentText()
+
+        started = time.perf_counter()
+        editor.filter_index = FilterIndex(fluent_api)
+        print(f"build: {time.perf_counter() - started:.2f} s")
+
+        # Some work in progress: every 10th key emptied, every 3rd checked
+        variables = list(fluent_api.translations)
+        started = time.perf_counter()
+        for variable in variables[::10]:
+            fluent_api.update(variable, language, "value", "")
+        for variable in variables[::3]:
+            fluent_api.update(variable, language, "check", True)
+        edits = len(variables[::10]) + len(variables[::3])
+        print(
+            f"{edits} edits with incremental updates: "
+            f"{(time.perf_counter() - started) * 1e3:.0f} ms"
+        )
+
+        populate = timed(app, editor.table_manager.populate_table)
+        print(f"populate_table: {populate * 1e3:.0f} ms for {len(variables)} rows")
+        for row in range(1, editor.filter_combo.count()):
+            toggle = timed(app, lambda: editor.filter_combo.setCurrentIndex(row))
+            print(
+                f"{editor.filter_combo.itemText(row)!r:>17} {language}: "
+                f"{editor.table_manager.model.rowCount():>6} rows in {toggle * 1e3:.0f} ms"
+            )
+        toggle = timed(app, lambda: editor.filter_combo.setCurrentIndex(0))
+        print(f"{'back to all':>20}: {toggle * 1e3:.0f} ms")
+
+        fluent_api.dirty.clear()
+        fluent_api.edited = False
+        editor.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures keystroke-to-paint latency while typing into a long multi-line message,
+with the value normalised on every keystroke (as before) and once typing pauses.
+
+Usage: python -m benchmarks.keystroke_latency [--lines 80] [--keystrokes 200]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks._common import make_locale_tree, wait_until_loaded  # noqa: E402
+from benchmarks._common import use_editor_without_cache  # noqa: E402
+from PyQt6.QtGui import QTextCursor  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from src import editor as editor_module  # noqa: E402
+
+
+class ImmediateEditor(editor_module.FluentusEditor):
+    """Normalises the value in the same event loop pass as the keystroke."""
+
+    NORMALIZE_DELAY = 0
+
+
+def measure(app: QApplication, editor_class, locales: Path, args) -> list:
+    editor = editor_class(folder=str(locales))
+    editor.show()
+    wait_until_loaded(app, editor)
+    editor.table_manager.select(editor.table_manager.model.variables()[args.keys // 2])
+    editor.value_1.setPlainText(
+        "\n".join(
+            f"Line {n} with a {{ $count }} placeable and a {{ -term }} reference"
+            for n in range(args.lines)
+        )
+    )
+    editor.value_1.moveCursor(QTextCursor.MoveOperation.End)
+    editor.normalize_pending()
+    app.processEvents()
+
+    latencies = []
+    for _ in range(args.keystrokes):
+        started = time.perf_counter()
+        editor.value_1.insertPlainText("a")
+        app.processEvents()
+        editor.value_1.viewport().repaint()
+        editor.table.viewport().repaint()
+        latencies.append(time.perf_counter() - started)
+
+    editor.normalize_pending()
+    editor.hide()
+    editor.deleteLater()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--lines", type=int, default=80)
+    parser.add_argument("--keystrokes", type=int, default=200)
+    args = parser.parse_args()
+
+    use_editor_without_cache()
+    app = QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, 1, args.keys)
+        for name, editor_class in (
+            ("every keystroke", ImmediateEditor),
+            ("debounced", editor_module.FluentusEditor),
+        ):
+            latencies = measure(app, editor_class, locales, args)
+            print(
+                f"{name:>15}: keystroke-to-paint mean {statistics.mean(latencies) * 1e3:.2f} ms, "
+                f"p95 {sorted(latencies)[int(len(latencies) * 0.95)] * 1e3:.2f} ms "
+                f"({args.lines} lines)"
+            )
+
+
+if __name__ == "__main__":
+    main()
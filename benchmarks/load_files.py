@@ -0,0 +1,64 @@
+"""
+Compares serial, parallel and cached loading of a synthetic locales tree.
+
+Usage: python -m benchmarks.load_files [--languages 8] [--files 40] [--keys 200] [--workers 0]
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._common import make_locale_tree, no_cache
+from src.fluent_api.FluentAPI import FluentAPI
+from src.utils.config_reader import get_config, LoaderConfig, CacheConfig
+
+
+def measure(
+    locales: Path, workers: int, repeat: int, cache_config: CacheConfig
+) -> float:
+    loader_config = get_config(LoaderConfig, root_key="loader").model_copy(
+        update={"workers": workers}
+    )
+
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        FluentAPI(locales, loader_config=loader_config, cache_config=cache_config)
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=8)
+    parser.add_argument("--files", type=int, default=40)
+    parser.add_argument("--keys", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=0, help="0 - one per CPU")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, args.files, args.keys)
+        workers = args.workers or os.cpu_count() or 1
+
+        serial = measure(locales, 1, args.repeat, no_cache())
+        parallel = measure(locales, workers, args.repeat, no_cache())
+
+        # Cache database lives in the temporary folder, the first run fills it
+        cache_config = get_config(CacheConfig, root_key="cache").model_copy(
+            update={"enabled": True, "name": str(Path(tmp) / "cache")}
+        )
+        measure(locales, 1, 1, cache_config)
+        cached = measure(locales, 1, args.repeat, cache_config)
+
+    total = args.languages * args.files
+    print(f"files: {total}, messages: {total * args.keys}")
+    print(f"serial:              {serial:.3f} s")
+    print(f"parallel ({workers:>2} proc): {parallel:.3f} s  (x{serial / parallel:.2f})")
+    print(f"warm parse cache:    {cached:.3f} s  (x{serial / cached:.2f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Measures serialization of a whole project on save: unchanged entries written from
+their source text, and every entry rebuilt with the parser called for every value,
+with the plain-text fast path, and with the fast path and a warm parse memo.
+
+Usage: python -m benchmarks.parse_memo [--languages 4] [--files 20] [--keys 200]
+"""
+
+import argparse
+import re
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._common import make_locale_tree, no_cache
+from src.fluent_api.FluentAPI import FluentAPI
+
+
+def save_seconds(fluent_api: FluentAPI, target: Path) -> float:
+    snapshot = fluent_api.snapshot_changes(str(target))
+    started = time.perf_counter()
+    fluent_api.write_snapshot(snapshot)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--files", type=int, default=20)
+    parser.add_argument("--keys", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, args.files, args.keys)
+        fluent_api = FluentAPI(locales, cache_config=no_cache())
+        target = Path(tmp) / "saved"
+        plain_text = FluentAPI.RE_PLAIN_TEXT
+
+        print(f"    source reused: {save_seconds(fluent_api, target):.3f} s")
+
+        # Rebuild every entry, as if all of them were edited
+        for languages in fluent_api.translations.values():
+            for translation in languages.values():
+                translation.source = None
+
+        FluentAPI.RE_PLAIN_TEXT = re.compile(r"(?!)")
+        FluentAPI.AST_MEMO.resize(0)
+        print(f"      parser only: {save_seconds(fluent_api, target):.3f} s")
+
+        FluentAPI.RE_PLAIN_TEXT = plain_text
+        print(f"   with fast path: {save_seconds(fluent_api, target):.3f} s")
+
+        FluentAPI.AST_MEMO.resize(10**6)
+        save_seconds(fluent_api, target)
+        print(f"   with warm memo: {save_seconds(fluent_api, target):.3f} s")
+        print(f"   {FluentAPI.memo_stats()['parse_str_to_ast']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Measures saving a single large .ftl file after a growing number of edits: untouched
+entries and the text between them are copied, only edited entries are serialized.
+
+Usage: python -m benchmarks.patch_save [--keys 50000] [--edits 1 100 1000 10000]
+"""
+
+import argparse
+import tempfile
+from pathlib import Path
+
+from benchmarks._common import make_locale_tree, no_cache
+from src.fluent_api.FluentAPI import FluentAPI
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--keys", type=int, default=50000)
+    parser.add_argument("--edits", type=int, nargs="+", default=[1, 100, 1000, 10000])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), 1, 1, args.keys)
+        ftl_file = next(locales.rglob("*.ftl"))
+        size_mb = ftl_file.stat().st_size / 2**20
+        fluent_api = FluentAPI(locales, cache_config=no_cache())
+        language = fluent_api.get_languages()[0]
+        variables = list(fluent_api.translations)
+
+        for run, edits in enumerate(args.edits):
+            # Values unique to the run, so entries edited by earlier runs change again
+            edited = sum(
+                fluent_api.update(variable, language, "value", f"Edited {run}.{n}")
+                for n, variable in enumerate(variables[:edits])
+            )
+            report = fluent_api.save_all_files()
+            print(
+                f"{edited:>6} edits: {report.seconds * 1e3:8.1f} ms "
+                f"({size_mb:.1f} MB file, {args.keys} entries)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Measures building the search index over a synthetic project and the latency of
+queries typed character by character, compared with scanning every translation.
+
+Usage: python -m benchmarks.search_index [--languages 4] [--files 50] [--keys 1000]
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from benchmarks._common import make_locale_tree, no_cache
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.search_index import SearchIndex
+
+QUERIES = ["key-7-42", "placeholder for key-3", "count", "lang2", "zzz"]
+
+
+def scan(fluent_api: FluentAPI, query: str) -> set:
+    query = query.casefold()
+    return {
+        variable
+        for variable, languages in fluent_api.translations.items()
+        if query in variable.casefold()
+        or any(
+            query in (translation.value or "").casefold()
+            or any(query in text.casefold() for text in translation.attributes.values())
+            or query in (translation.comment or "").casefold()
+            for translation in languages.values()
+        )
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=4)
+    parser.add_argument("--files", type=int, default=50)
+    parser.add_argument("--keys", type=int, default=1000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, args.files, args.keys)
+        fluent_api = FluentAPI(locales, cache_config=no_cache())
+
+        started = time.perf_counter()
+        index = SearchIndex(fluent_api)
+        print(
+            f"build: {time.perf_counter() - started:.2f} s for {len(index)} variables "
+            f"x {args.languages} languages"
+        )
+
+        for query in QUERIES:
+            # Every prefix, as the query is typed into the search field
+            latencies = []
+            for length in range(1, len(query) + 1):
+                started = time.perf_counter()
+                results = index.search(query[:length])
+                latencies.append(time.perf_counter() - started)
+
+            started = time.perf_counter()
+            expected = scan(fluent_api, query)
+            scan_seconds = time.perf_counter() - started
+            assert results == expected, query
+
+            print(
+                f"{query!r:>26}: {len(results):>6} results, per keystroke mean "
+                f"{statistics.mean(latencies) * 1e3:.1f} ms, max {max(latencies) * 1e3:.1f} ms "
+                f"(full scan {scan_seconds * 1e3:.0f} ms)"
+            )
+
+        started = time.perf_counter()
+        fluent_api.update(
+            next(iter(fluent_api.translations)),
+            fluent_api.get_languages()[0],
+            "value",
+            "New text",
+        )
+        print(
+            f"incremental update: {(time.perf_counter() - started) * 1e3:.2f} ms (including the edit)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+"""
+Times the hot paths on synthetic locales trees and writes the results as JSON, so
+runs on two commits can be compared.
+
+For every shape (see benchmarks._common.SHAPES): loading the folder, update(),
+save_all_files() after the edits and to a new folder, TableManager.populate_table()
+with offscreen Qt, and the peak memory of a load.
+
+Usage:
+    python -m benchmarks.suite [--shapes small medium] [--output results.json]
+    python -m benchmarks.suite --compare before.json after.json [--threshold 10]
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks._common import ROOT_DIR, SHAPES, no_cache  # noqa: E402
+from benchmarks._common import TreeShape, make_locale_tree  # noqa: E402
+from src.fluent_api.FluentAPI import FluentAPI  # noqa: E402
+from src.utils.config_reader import get_config, LoaderConfig  # noqa: E402
+
+FORMAT_VERSION = 1
+
+
+def best_of(repeat: int, action: Callable[[], Any]) -> float:
+    """Returns the shortest of several runs, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        action()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def load(locales: Path, loader_config: LoaderConfig) -> FluentAPI:
+    # Parse results are memoised across instances, every run starts cold
+    FluentAPI.AST_MEMO.clear()
+    FluentAPI.BEAUTIFUL_MEMO.clear()
+    return FluentAPI(locales, loader_config=loader_config, cache_config=no_cache())
+
+
+def measure_memory(locales: Path, loader_config: LoaderConfig) -> Dict[str, float]:
+    """Peak and retained Python memory of a load, in MiB (tracemalloc, so slower)."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fluent_api = load(locales, loader_config)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del fluent_api
+    return {"load_peak_mib": peak / 2**20, "load_retained_mib": current / 2**20}
+
+
+def measure_updates(fluent_api: FluentAPI, edits: int) -> Dict[str, float]:
+    """Edits values spread over all files and languages, then saves them."""
+    languages = fluent_api.get_languages()
+    variables = list(fluent_api.translations)
+    step = max(1, len(variables) // edits)
+    targets = [
+        (variables[index], languages[n % len(languages)])
+        for n, index in enumerate(range(0, len(variables), step))
+    ][:edits]
+
+    started = time.perf_counter()
+    for n, (variable, language) in enumerate(targets):
+        fluent_api.update(variable, language, "value", f"Edited {n} {{ $count }}")
+    update_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    report = fluent_api.save_all_files()
+    save_seconds = time.perf_counter() - started
+    return {
+        "update_us": update_seconds / max(1, len(targets)) * 1e6,
+        "save_edited_s": save_seconds,
+        "save_edited_files": report.files_written,
+    }
+
+
+def measure_table(fluent_api: FluentAPI, repeat: int) -> Optional[float]:
+    """Seconds to fill the table and lay out the view, None without Qt."""
+    try:
+        from PyQt6.QtWidgets import QApplication, QTreeView
+        from src.widgets.table_manager import TableManager
+    except ImportError:
+        return None
+
+    app = QApplication.instance() or QApplication([])
+    view = QTreeView()
+    view.resize(1200, 800)
+    view.show()
+    table_manager = TableManager(view, fluent_api)
+
+    def populate() -> None:
+        table_manager.populate_table()
+        app.processEvents()
+
+    seconds = best_of(repeat, populate)
+    view.close()
+    view.deleteLater()
+    app.processEvents()
+    return seconds
+
+
+def run_shape(
+    shape: TreeShape, repeat: int, edits: int, loader_config: LoaderConfig
+) -> Dict[str, Any]:
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp) / "locales", shape=shape)
+        files = list(locales.rglob("*.ftl"))
+        metrics: Dict[str, Any] = {
+            "files": len(files),
+            "bytes": sum(ftl_file.stat().st_size for ftl_file in files),
+        }
+
+        metrics["load_s"] = best_of(repeat, lambda: load(locales, loader_config))
+        metrics.update(measure_memory(locales, loader_config))
+
+        fluent_api = load(locales, loader_config)
+        metrics["keys"] = len(fluent_api.translations)
+        metrics["entries"] = sum(
+            len(translations) for translations in fluent_api.translations.values()
+        )
+        metrics["populate_table_s"] = measure_table(fluent_api, repeat)
+        metrics.update(measure_updates(fluent_api, edits))
+
+        target = Path(tmp) / "copy"
+        metrics["save_all_s"] = best_of(
+            repeat, lambda: fluent_api.save_all_files(str(target))
+        )
+
+    return {"shape": shape._asdict(), "metrics": metrics}
+
+
+def max_rss_mib() -> Optional[float]:
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10
+
+
+def git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=ROOT_DIR,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_suite(args: argparse.Namespace) -> Dict[str, Any]:
+    loader_config = get_config(LoaderConfig, root_key="loader").model_copy(
+        update={"lazy": False, "workers": args.workers}
+    )
+
+    results = {}
+    for name in args.shapes:
+        print(f"{name}: {SHAPES[name]}", file=sys.stderr)
+        results[name] = run_shape(SHAPES[name], args.repeat, args.edits, loader_config)
+        for metric, value in results[name]["metrics"].items():
+            print(f"  {metric:>20}: {format_value(value)}", file=sys.stderr)
+
+    return {
+        "format": FORMAT_VERSION,
+        "commit": git_commit(),
+        "date": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "workers": args.workers,
+        "repeat": args.repeat,
+        "max_rss_mib": max_rss_mib(),
+        "results": results,
+    }
+
+
+def format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return f"{value:.4g}"
+    return str(value)
+
+
+# Metrics where a larger value is worse; the others describe the tree
+COMPARED_SUFFIXES = ("_s", "_us", "_mib")
+
+
+def compare(before: Dict[str, Any], after: Dict[str, Any], threshold: float) -> int:
+    """
+    Prints the change of every timing and memory metric between two result files.
+
+    :param threshold: Slowdown in percent reported as a regression.
+    :return: Number of regressions.
+    """
+    print(f"before: {before.get('commit')} ({before.get('date')})")
+    print(f"after:  {after.get('commit')} ({after.get('date')})")
+    regressions = 0
+    for name, result in after["results"].items():
+        old = before["results"].get(name)
+        if old is None:
+            continue
+        if old["shape"] != result["shape"]:
+            print(f"{name}: the shape changed, not compared")
+            continue
+        print(name)
+        for metric, value in result["metrics"].items():
+            old_value = old["metrics"].get(metric)
+            if not metric.endswith(COMPARED_SUFFIXES) or not old_value or value is None:
+                continue
+            change = (value - old_value) / old_value * 100
+            flag = ""
+            if change > threshold:
+                flag = "  REGRESSION"
+                regressions += 1
+            print(
+                f"  {metric:>20}: {format_value(old_value):>10} -> "
+                f"{format_value(value):>10}  {change:+6.1f}%{flag}"
+            )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "--shapes", nargs="+", choices=list(SHAPES), default=["small", "medium"]
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--edits", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1, help="Parser processes.")
+    parser.add_argument("--output", help="JSON file to write (default: stdout).")
+    parser.add_argument(
+        "--compare", nargs=2, metavar=("BEFORE", "AFTER"), help="Compare two results."
+    )
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=10.0,
+        help="Slowdown in percent counted as a regression (default: 10).",
+    )
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        before, after = (
+            json.loads(Path(path).read_text(encoding="utf-8")) for path in args.compare
+        )
+        return 1 if compare(before, after, args.threshold) else 0
+
+    report = run_suite(args)
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n", encoding="utf-8")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""
+Compares memory use and assignment latency of Translation with the former pydantic model.
+
+Usage: python -m benchmarks.translation_store [--records 200000]
+"""
+
+import argparse
+import time
+import tracemalloc
+from collections import defaultdict
+from pathlib import Path
+from typing import Optional, DefaultDict, Callable, Tuple
+
+from pydantic import BaseModel, ConfigDict, Field
+
+import benchmarks._common  # noqa: F401
+from src.fluent_api.base_type.translations import Translation
+
+
+class PydanticTranslation(BaseModel):
+    """Translation model used before the __slots__ record."""
+
+    value: Optional[str] = Field(default_factory=str)
+    attributes: DefaultDict[str, str] = Field(default_factory=lambda: defaultdict(str))
+    comment: Optional[str] = None
+    check: bool = False
+    filepath: Optional[Path] = None
+
+    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
+
+
+def build(factory: Callable, records: int) -> Tuple[list, float, int]:
+    filepath = Path("en/main.ftl")
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    store = [
+        factory(
+            value=f"Value {index}",
+            attributes={".placeholder": f"Placeholder {index}"},
+            comment=None,
+            check=False,
+            filepath=filepath,
+        )
+        for index in range(records)
+    ]
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return store, elapsed, peak
+
+
+def assignment_latency(store: list, updates: int) -> float:
+    started = time.perf_counter()
+    for index in range(updates):
+        translation = store[index % len(store)]
+        translation.value = "Edited value"
+        translation.check = True
+    return (time.perf_counter() - started) / updates
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--updates", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"records: {args.records}")
+    for name, factory in (
+        ("pydantic", PydanticTranslation),
+        ("__slots__", Translation),
+    ):
+        store, elapsed, peak = build(factory, args.records)
+        latency = assignment_latency(store, args.updates)
+        print(
+            f"{name:>10}: build {elapsed:.3f} s, "
+            f"memory {peak / 2**20:.1f} MiB ({peak / args.records:.0f} B/record), "
+            f"assignment {latency * 1e6:.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
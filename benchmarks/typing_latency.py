@@ -0,0 +1,97 @@
+"""
+Measures the editor's per-keystroke latency on a project with many languages,
+with column lookups by header scan (as before) and by the column maps.
+
+Usage: python -m benchmarks.typing_latency [--languages 60] [--keystrokes 300]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+from typing import Optional
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from benchmarks._common import make_locale_tree, wait_until_loaded  # noqa: E402
+from benchmarks._common import use_editor_without_cache  # noqa: E402
+from PyQt6.QtCore import QItemSelectionModel  # noqa: E402
+from PyQt6.QtWidgets import QApplication  # noqa: E402
+from src import editor as editor_module  # noqa: E402
+from src.widgets.table_manager import TableManager  # noqa: E402
+
+
+class HeaderScanTableManager(TableManager):
+    """Looks columns up by scanning the header labels, like the table did before."""
+
+    def _find_language_column(self, language_code: str) -> Optional[int]:
+        # Plain labels: the displayed language headers end with the coverage percentage
+        header_name = f"{self.table_config.translation} — {language_code}"
+        for index, label in enumerate(self.model._headers):
+            if label == header_name:
+                return index
+        return None
+
+
+def measure(app: QApplication, locales: Path, keystrokes: int) -> tuple:
+    editor = editor_module.FluentusEditor(folder=str(locales))
+    editor.show()
+    wait_until_loaded(app, editor)
+    model = editor.table.model()
+    editor.table.selectionModel().setCurrentIndex(
+        model.index(model.rowCount() // 2, 0),
+        QItemSelectionModel.SelectionFlag.ClearAndSelect
+        | QItemSelectionModel.SelectionFlag.Rows,
+    )
+    app.processEvents()
+
+    latencies = []
+    for _ in range(keystrokes):
+        started = time.perf_counter()
+        editor.value_1.insertPlainText("a")
+        app.processEvents()
+        latencies.append(time.perf_counter() - started)
+
+    # Table work done per keystroke: locating the row and the language column
+    language = editor.lang_1.currentText()
+    started = time.perf_counter()
+    for _ in range(keystrokes):
+        editor.table_manager.get_selected_names()
+        editor.table_manager.set_current_item(language)
+    table_latency = (time.perf_counter() - started) / keystrokes
+
+    editor.hide()
+    editor.deleteLater()
+    return latencies, table_latency
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--languages", type=int, default=60)
+    parser.add_argument("--keys", type=int, default=500)
+    parser.add_argument("--keystrokes", type=int, default=300)
+    args = parser.parse_args()
+
+    use_editor_without_cache()
+    app = QApplication([])
+
+    with tempfile.TemporaryDirectory() as tmp:
+        locales = make_locale_tree(Path(tmp), args.languages, 1, args.keys)
+        for name, manager in (
+            ("header scan", HeaderScanTableManager),
+            ("column maps", TableManager),
+        ):
+            editor_module.TableManager = manager
+            latencies, table_latency = measure(app, locales, args.keystrokes)
+            print(
+                f"{name:>12}: keystroke mean {statistics.mean(latencies) * 1e3:.2f} ms, "
+                f"p95 {sorted(latencies)[int(len(latencies) * 0.95)] * 1e3:.2f} ms, "
+                f"table update {table_latency * 1e6:.0f} us "
+                f"({args.languages} languages)"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 
@@ -18,7 +19,8 @@ from loguru import logger
 from src.database.manager import DatabaseManager
 from src.editor import FluentusEditor
 from src.logger import configure_logger
-from src.utils.config_reader import get_config, DatabaseConfig
+from src.utils import instrumentation
+from src.utils.config_reader import get_config, DatabaseConfig, InstrumentationConfig
 from src.utils.icon_utils import get_tinted_icon
 from src.utils.resource_path import resource_path
 from src.widgets.drag_overlay import DragOverlay
@@ -217,7 +219,12 @@ class FluentusStart(QMainWindow):
 
 
 if __name__ == "__main__":
+    # Required for the process pool used by the parallel loader in frozen builds
+    multiprocessing.freeze_support()
     configure_logger()
+    instrumentation.configure(
+        get_config(InstrumentationConfig, root_key="instrumentation")
+    )
     app = QApplication(sys.argv)
     start = FluentusStart()
     start.show()
@@ -0,0 +1,426 @@
+"""
+Headless commands for CI and scripts, built on FluentAPI. Qt is never imported.
+
+Usage:
+    python -m src.cli check <locales folder> [--json] [--ignore-missing] [--source en]
+    python -m src.cli export <locales folder> <file.csv|.jsonl|.xlf> [--languages ...]
+    python -m src.cli import <locales folder> <file.csv|.jsonl|.xlf> [--dry-run]
+
+Exit status: 0 - success, 1 - problems found or invalid input, 2 - the folder could
+not be loaded.
+"""
+
+import argparse
+import json
+import multiprocessing
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from src.fluent_api import exchange
+from src.fluent_api.consistency import check_project
+from src.fluent_api.FluentAPI import FluentAPI
+from src.utils import instrumentation
+from src.utils.config_reader import (
+    get_config,
+    CacheConfig,
+    InstrumentationConfig,
+    LoaderConfig,
+)
+
+EXIT_OK = 0
+EXIT_PROBLEMS = 1
+EXIT_LOAD_FAILED = 2
+
+# Exchange formats by file extension
+FORMATS = {".csv": "csv", ".jsonl": "jsonl", ".xlf": "xliff", ".xliff": "xliff"}
+
+
+def load_folder(folder: str, workers: Optional[int] = None) -> FluentAPI:
+    """
+    Loads every file of a locales folder.
+
+    Files are always parsed: the parse cache keeps no Junk, and lazy loading would
+    leave files unchecked.
+
+    :param folder: Path to the locales folder.
+    :param workers: Number of parser processes, the configured number if None.
+    """
+    loader_overrides: Dict[str, Any] = {"lazy": False}
+    if workers is not None:
+        loader_overrides["workers"] = workers
+    # Copies, the shared configuration stays as read from config.toml
+    loader_config = get_config(LoaderConfig, root_key="loader").model_copy(
+        update=loader_overrides
+    )
+    cache_config = get_config(CacheConfig, root_key="cache").model_copy(
+        update={"enabled": False}
+    )
+    return FluentAPI(folder, loader_config=loader_config, cache_config=cache_config)
+
+
+def check_report(fluent_api: FluentAPI) -> Dict[str, Any]:
+    """
+    Collects the counts, missing keys and skipped entries of a loaded folder.
+
+    :return: A JSON-serialisable report.
+    """
+    languages = fluent_api.get_languages()
+    files = Counter(ftl_file.locale for ftl_file in fluent_api.files.values())
+    report: Dict[str, Any] = {
+        "folder": str(fluent_api.folder_path),
+        "keys": len(fluent_api.translations),
+        "languages": {
+            language: {
+                "files": files[language],
+                "messages": 0,
+                "terms": 0,
+                "missing": [],
+                "coverage": 1.0,
+            }
+            for language in languages
+        },
+        "skipped": [],
+    }
+
+    for variable, translations in fluent_api.translations.items():
+        kind = "terms" if variable.startswith("-") else "messages"
+        for language in translations:
+            report["languages"][language][kind] += 1
+    for language, stats in report["languages"].items():
+        # Translations without any text count as missing too
+        stats["missing"] = fluent_api.presence.missing(language)
+        stats["coverage"] = round(fluent_api.presence.coverage(language), 4)
+
+    for filepath, entries in sorted(fluent_api.skipped.items()):
+        for entry in entries:
+            report["skipped"].append(
+                {
+                    "file": filepath.as_posix(),
+                    "line": entry.line,
+                    "content": entry.content,
+                    "errors": list(entry.errors),
+                }
+            )
+    return report
+
+
+def consistency_report(
+    fluent_api: FluentAPI, source_language: str, workers: Optional[int]
+) -> List[Dict[str, Any]]:
+    """Lists the placeables, variant keys and attributes that differ from the source."""
+    return [
+        {
+            "key": problem.variable + (problem.attribute or ""),
+            "language": problem.language,
+            "kind": problem.kind,
+            "name": problem.name,
+            "message": problem.message,
+        }
+        for problem in check_project(
+            fluent_api, source_language, workers=1 if workers is None else workers
+        )
+    ]
+
+
+def count_problems(report: Dict[str, Any], ignore_missing: bool) -> int:
+    problems = len(report["skipped"]) + len(report["inconsistencies"])
+    if not ignore_missing:
+        problems += sum(len(stats["missing"]) for stats in report["languages"].values())
+    return problems
+
+
+def print_report(report: Dict[str, Any], max_listed: int) -> None:
+    print(
+        f"{report['folder']}: {len(report['languages'])} languages, "
+        f"{report['keys']} keys, loaded in {report['seconds']:.2f} s"
+    )
+    for language, stats in report["languages"].items():
+        missing: List[str] = stats["missing"]
+        print(
+            f"  {language}: {stats['files']} files, {stats['messages']} messages, "
+            f"{stats['terms']} terms, {len(missing)} missing "
+            f"({stats['coverage']:.1%} translated)"
+        )
+        for variable in missing[:max_listed]:
+            print(f"    missing: {variable}")
+        if len(missing) > max_listed:
+            print(f"    ... and {len(missing) - max_listed} more")
+
+    if report["skipped"]:
+        print(f"Junk and unparsed entries ({len(report['skipped'])}):")
+    for entry in report["skipped"][:max_listed]:
+        location = entry["file"] + (f":{entry['line']}" if entry["line"] else "")
+        errors = "; ".join(entry["errors"]) or "Junk"
+        first_line = (
+            entry["content"].strip().splitlines()[0] if entry["content"].strip() else ""
+        )
+        print(f"  {location}: {errors}")
+        print(f"    {first_line}")
+    if len(report["skipped"]) > max_listed:
+        print(f"  ... and {len(report['skipped']) - max_listed} more")
+
+    inconsistencies = report["inconsistencies"]
+    if inconsistencies:
+        print(
+            f"Differences with the source language {report['source']} "
+            f"({len(inconsistencies)}):"
+        )
+    for problem in inconsistencies[:max_listed]:
+        print(f"  {problem['key']} ({problem['language']}): {problem['message']}")
+    if len(inconsistencies) > max_listed:
+        print(f"  ... and {len(inconsistencies) - max_listed} more")
+
+
+def run_check(args: argparse.Namespace) -> int:
+    started = time.perf_counter()
+    try:
+        fluent_api = load_folder(args.folder, args.workers)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_LOAD_FAILED
+
+    report = check_report(fluent_api)
+    languages = fluent_api.get_languages()
+    if args.source and args.source not in languages:
+        print(f"error: Unknown language '{args.source}'.", file=sys.stderr)
+        return EXIT_PROBLEMS
+    report["source"] = args.source or (languages[0] if languages else None)
+    report["inconsistencies"] = (
+        consistency_report(fluent_api, report["source"], args.workers)
+        if report["source"] and not args.skip_consistency
+        else []
+    )
+    report["seconds"] = time.perf_counter() - started
+    problems = count_problems(report, args.ignore_missing)
+    report["problems"] = problems
+
+    if args.json:
+        json.dump(report, sys.stdout, ensure_ascii=False, indent=2)
+        print()
+    else:
+        print_report(report, args.max_listed)
+        print("OK" if not problems else f"{problems} problem(s) found")
+    return EXIT_PROBLEMS if problems else EXIT_OK
+
+
+def exchange_format(args: argparse.Namespace) -> str:
+    """
+    Returns the format given on the command line, or the one of the file extension.
+
+    :raises ValueError: If the extension is not known.
+    """
+    if args.format:
+        return args.format
+    file_format = FORMATS.get(Path(args.file).suffix.lower())
+    if file_format is None:
+        raise ValueError(
+            f"Unknown format of '{args.file}', use --format or one of: {', '.join(FORMATS)}."
+        )
+    return file_format
+
+
+def run_export(args: argparse.Namespace) -> int:
+    try:
+        fluent_api = load_folder(args.folder, args.workers)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_LOAD_FAILED
+
+    started = time.perf_counter()
+    try:
+        file_format = exchange_format(args)
+        known = fluent_api.get_languages()
+        requested = (args.languages or []) + [
+            language for language in (args.source, args.target) if language
+        ]
+        unknown = [language for language in requested if language not in known]
+        if unknown:
+            raise ValueError(f"Unknown language(s): {', '.join(unknown)}.")
+        if file_format == "xliff" and not args.target:
+            raise ValueError("XLIFF export needs a --target language.")
+    except ValueError as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_PROBLEMS
+
+    languages = args.languages or known
+    if file_format == "csv":
+        with open(args.file, "w", encoding="utf-8-sig", newline="") as file:
+            rows = exchange.write_csv(
+                exchange.iter_rows(fluent_api, languages), file, languages
+            )
+    elif file_format == "jsonl":
+        with open(args.file, "w", encoding="utf-8") as file:
+            rows = exchange.write_jsonl(exchange.iter_rows(fluent_api, languages), file)
+    else:
+        source = args.source or known[0]
+        with open(args.file, "w", encoding="utf-8") as file:
+            rows = exchange.write_xliff(
+                exchange.iter_rows(fluent_api, [source, args.target]),
+                file,
+                source,
+                args.target,
+                original=Path(args.folder).name,
+            )
+
+    print(
+        f"Exported {rows} rows to '{args.file}' in {time.perf_counter() - started:.2f} s"
+    )
+    return EXIT_OK
+
+
+def run_import(args: argparse.Namespace) -> int:
+    try:
+        fluent_api = load_folder(args.folder, args.workers)
+    except Exception as e:
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_LOAD_FAILED
+
+    started = time.perf_counter()
+    try:
+        file_format = exchange_format(args)
+        if file_format == "csv":
+            with open(args.file, encoding="utf-8-sig", newline="") as file:
+                report = exchange.import_rows(fluent_api, exchange.read_csv(file))
+        elif file_format == "jsonl":
+            with open(args.file, encoding="utf-8") as file:
+                report = exchange.import_rows(fluent_api, exchange.read_jsonl(file))
+        else:
+            report = exchange.import_rows(fluent_api, exchange.read_xliff(args.file))
+    except (OSError, ValueError, SyntaxError) as e:
+        # Nothing is saved when the file is not read to the end
+        print(f"error: {e}", file=sys.stderr)
+        return EXIT_PROBLEMS
+
+    print(
+        f"Imported {report.rows} rows from '{args.file}' in "
+        f"{time.perf_counter() - started:.2f} s: {report.changed} changes, "
+        f"{report.skipped} cells skipped (not in the project)"
+    )
+    if args.dry_run or not report.changed:
+        return EXIT_OK
+
+    save_report = fluent_api.save_all_files()
+    print(f"Saved {save_report.files_written} file(s)")
+    return EXIT_OK
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.cli", description="Fluentus command line tools."
+    )
+    parser.add_argument(
+        "-v",
+        "--verbose",
+        action="count",
+        default=0,
+        help="Show log messages (-vv for debug messages).",
+    )
+    parser.add_argument(
+        "--stats",
+        metavar="FILE",
+        help="Time the command and write the statistics to a JSON file.",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    check = commands.add_parser(
+        "check",
+        help="Load a locales folder and report Junk, missing keys and inconsistencies.",
+        description="Loads a locales folder and reports parse errors, Junk, "
+        "keys missing per language, translations whose placeables, variant keys "
+        "or attributes differ from the source language, and counts.",
+    )
+    check.add_argument("folder", help="Locales folder (<folder>/<language>/*.ftl).")
+    check.add_argument("--json", action="store_true", help="Print the report as JSON.")
+    check.add_argument(
+        "--ignore-missing",
+        action="store_true",
+        help="Report missing keys without failing.",
+    )
+    check.add_argument(
+        "--source",
+        help="Language the others are compared with (default: the first language).",
+    )
+    check.add_argument(
+        "--skip-consistency",
+        action="store_true",
+        help="Do not compare the translations with the source language.",
+    )
+    check.add_argument(
+        "--workers",
+        type=int,
+        help="Parser and checker processes: 1 - serial, 0 - one per CPU core "
+        "(default: config for parsing, serial checking).",
+    )
+    check.add_argument(
+        "--max-listed",
+        type=int,
+        default=20,
+        help="Missing keys and entries listed per section (default: 20).",
+    )
+    check.set_defaults(handler=run_check)
+
+    export = commands.add_parser(
+        "export",
+        help="Write the translations to a CSV, JSONL or XLIFF file.",
+        description="Streams the translations to an exchange file: one row per message "
+        "and attribute with a column per language, their comments and check flags.",
+    )
+    export.add_argument("folder", help="Locales folder.")
+    export.add_argument("file", help="File to write (.csv, .jsonl, .xlf).")
+    export.add_argument(
+        "--languages", nargs="+", help="Languages to export (default: all)."
+    )
+    export.add_argument(
+        "--source", help="XLIFF source language (default: the first language)."
+    )
+    export.add_argument("--target", help="XLIFF target language.")
+
+    import_ = commands.add_parser(
+        "import",
+        help="Apply the translations of a CSV, JSONL or XLIFF file and save them.",
+        description="Reads an exchange file row by row and applies its non-empty "
+        "cells to the translations, then saves the changed files.",
+    )
+    import_.add_argument("folder", help="Locales folder.")
+    import_.add_argument("file", help="File to read (.csv, .jsonl, .xlf).")
+    import_.add_argument(
+        "--dry-run", action="store_true", help="Report the changes without saving."
+    )
+
+    for command, handler in ((export, run_export), (import_, run_import)):
+        command.add_argument(
+            "--format", choices=sorted(set(FORMATS.values())), help="File format."
+        )
+        command.add_argument("--workers", type=int, help="Parser processes.")
+        command.set_defaults(handler=handler)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    logger.remove()
+    if args.verbose:
+        logger.add(sys.stderr, level="DEBUG" if args.verbose > 1 else "INFO")
+
+    config = get_config(InstrumentationConfig, root_key="instrumentation")
+    if args.stats:
+        # Written once the command is done, not at exit; a copy, the loaded config is shared
+        config = config.model_copy(update={"enabled": True, "dump_file": ""})
+    instrumentation.configure(config)
+    try:
+        return args.handler(args)
+    finally:
+        if args.stats:
+            instrumentation.dump(args.stats)
+
+
+if __name__ == "__main__":
+    # Required for the process pool used by the parallel loader in frozen builds
+    multiprocessing.freeze_support()
+    sys.exit(main())
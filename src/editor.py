@@ -1,8 +1,9 @@
 from functools import partial
-from typing import Optional, Union
+from typing import Optional, Union, Dict, Tuple, List
 
 from PyQt6 import uic
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+from PyQt6.QtGui import QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QWidget,
     QMessageBox,
@@ -10,12 +11,23 @@ from PyQt6.QtWidgets import (
     QPlainTextEdit,
     QCheckBox,
     QComboBox,
+    QApplication,
 )
 
+from loguru import logger
+
 from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.consistency import ConsistencyChecker
+from src.fluent_api.filter_index import FilterIndex
+from src.fluent_api.search_index import SearchIndex
 from src.utils.config_reader import get_config, Program
+from src.utils.instrumentation import timed
 from src.utils.resource_path import resource_path
 from src.widgets.add_press_key_filter import KeyPressFilter
+from src.widgets.background import FileLoadedNotifier, ProjectLoader, SaveWorker
+from src.widgets.diagnostics_dialog import DiagnosticsDialog
+from src.widgets.file_watcher import FtlFileWatcher
+from src.widgets.go_to_key_dialog import GoToKeyDialog
 from src.widgets.qt_close_dialog import CloseDialog
 from src.widgets.table_manager import TableManager
 
@@ -23,6 +35,15 @@ from src.widgets.table_manager import TableManager
 class FluentusEditor(QWidget):
     """Main application window for Fluent Localization Editor."""
 
+    # Delay for batching table refreshes of files loaded in the background (ms)
+    PREFETCH_REFRESH_INTERVAL = 200
+
+    # Idle time after the last keystroke before typed values are normalised (ms)
+    NORMALIZE_DELAY = 300
+
+    # Idle time after the last keystroke in the search field before the table is filtered (ms)
+    SEARCH_DELAY = 150
+
     def __init__(self, folder: Optional[str] = None):
         super().__init__()
 
@@ -30,6 +51,24 @@ class FluentusEditor(QWidget):
         self.fluent_api = None
         self.table_manager = None
 
+        # Projects are loaded off the GUI thread, one at a time
+        self.loader: Optional[ProjectLoader] = None
+        self.thread_pool = QThreadPool(self)
+        self.thread_pool.setMaxThreadCount(1)
+
+        # Saves are written in the background, in the order they were made
+        self.save_pool = QThreadPool(self)
+        self.save_pool.setMaxThreadCount(1)
+        self.save_workers: List[SaveWorker] = []
+
+        # Reloads files changed outside the editor once the folder is loaded
+        self.file_watcher: Optional[FtlFileWatcher] = None
+
+        # Built on the first search and kept up to date with the translations
+        self.search_index: Optional[SearchIndex] = None
+        self.filter_index: Optional[FilterIndex] = None
+        self.consistency: Optional[ConsistencyChecker] = None
+
         # Load UI
         uic.loadUi(resource_path("resource/ui/editor_window.ui"), self)
 
@@ -44,6 +83,26 @@ class FluentusEditor(QWidget):
 
         self.key_press_filter = KeyPressFilter()
 
+        # Rows of lazily loaded files are refreshed in batches
+        self.loaded_variables = set()
+        self.file_loaded_notifier = FileLoadedNotifier(self)
+        self.file_loaded_notifier.file_loaded.connect(self.on_file_loaded)
+        self.prefetch_refresh_timer = QTimer(self)
+        self.prefetch_refresh_timer.setSingleShot(True)
+        self.prefetch_refresh_timer.setInterval(self.PREFETCH_REFRESH_INTERVAL)
+        self.prefetch_refresh_timer.timeout.connect(self.refresh_loaded_variables)
+
+        # Typed values are stored as-is and reformatted by the parser once typing pauses:
+        # editor -> (variable, attribute, language, typed text)
+        self.pending_normalization: Dict[
+            QPlainTextEdit, Tuple[str, Optional[str], str, str]
+        ] = {}
+        self.normalize_timer = QTimer(self)
+        self.normalize_timer.setSingleShot(True)
+        self.normalize_timer.setInterval(self.NORMALIZE_DELAY)
+        self.normalize_timer.timeout.connect(self.normalize_pending)
+        QApplication.instance().focusChanged.connect(self.on_focus_changed)
+
         for editor, field, lang in self.editors:
             if isinstance(editor, QPlainTextEdit) and field == "value":
                 editor.installEventFilter(self.key_press_filter)
@@ -56,6 +115,26 @@ class FluentusEditor(QWidget):
         # Connect save button
         self.save_button.clicked.connect(self.save_all_changes)
 
+        self.cancel_load_button.clicked.connect(self.cancel_loading)
+        self._set_loading_visible(False)
+
+        shortcut_go_to_key = QShortcut(QKeySequence("Ctrl+G"), self)
+        shortcut_go_to_key.activated.connect(self.go_to_key)
+
+        # Hidden: timings recorded by src.utils.instrumentation
+        shortcut_diagnostics = QShortcut(QKeySequence("Ctrl+Shift+D"), self)
+        shortcut_diagnostics.activated.connect(self.show_diagnostics)
+
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(self.SEARCH_DELAY)
+        self.search_timer.timeout.connect(self.apply_filters)
+        self.search_edit.textChanged.connect(self.search_timer.start)
+        self.filter_combo.currentIndexChanged.connect(self.apply_filters)
+        self.filter_language.currentIndexChanged.connect(self.apply_filters)
+        shortcut_search = QShortcut(QKeySequence.StandardKey.Find, self)
+        shortcut_search.activated.connect(self.focus_search)
+
         # Connect editor signals dynamically
         for editor, field, lang in self.editors:
             if isinstance(editor, QPlainTextEdit):
@@ -74,10 +153,29 @@ class FluentusEditor(QWidget):
     def on_language_changed(self) -> None:
         """Handle language selection changes."""
         self.load_variable()
+        # Translations are compared with the language of the first column
+        if self.consistency and self.lang_1.currentText():
+            self.consistency.set_source_language(self.lang_1.currentText())
+            if self.filter_combo.currentIndex() > len(FilterIndex.FILTERS):
+                self.apply_filters()
 
     def _initialize_folder(self, folder: str) -> None:
-        """Initializes the editor with a specified folder."""
-        self.fluent_api = FluentAPI(folder)
+        """
+        Initializes the editor with a specified folder.
+
+        The files are loaded on the thread pool; the table fills in as locales finish
+        and editing is enabled once all of them are loaded.
+        """
+        self._stop_loader()
+        self._wait_for_saves()
+        self._stop_watcher()
+        if self.fluent_api:
+            self.normalize_pending()
+            self.fluent_api.stop_prefetch()
+        self.loaded_variables.clear()
+        self._reset_search()
+
+        self.fluent_api = FluentAPI(folder, load=False)
 
         # Initialize table manager
         self.table_manager = TableManager(
@@ -86,20 +184,303 @@ class FluentusEditor(QWidget):
 
         self.folder_text.setText(folder)
         self.refresh_editing_state()
-        self.set_language_selectors()
+        self._set_editing_enabled(False)
+
+        self.load_progress.setRange(0, 0)  # Busy indicator until the files are counted
+        self._set_loading_visible(True)
 
+        self.loader = ProjectLoader(self.fluent_api)
+        self.loader.signals.progress.connect(self.on_load_progress)
+        self.loader.signals.locale_loaded.connect(self.on_locale_loaded)
+        self.loader.signals.finished.connect(self.on_load_finished)
+        self.loader.signals.cancelled.connect(self.on_load_cancelled)
+        self.loader.signals.failed.connect(self.on_load_failed)
+        self.thread_pool.start(self.loader)
+
+    def _is_current_loader(self) -> bool:
+        """Whether the signal being handled comes from the loader of the current folder."""
+        return self.loader is not None and self.sender() is self.loader.signals
+
+    def on_load_progress(self, done: int, total: int, filepath: str) -> None:
+        if not self._is_current_loader():
+            return
+        self.load_progress.setRange(0, total)
+        self.load_progress.setValue(done)
+        self.load_progress.setToolTip(filepath)
+
+    def on_locale_loaded(self, locale: str) -> None:
+        """Shows the translations loaded so far."""
+        if not self._is_current_loader():
+            return
         self.table_manager.populate_table()
 
-    def save_all_changes(self):
-        """Save all changes and notify the user."""
-        if self.fluent_api.edited:
-            self.fluent_api.save_all_files()
-            QMessageBox.information(
-                self, "Save Changes", "All changes have been saved successfully!"
+    def on_load_finished(self) -> None:
+        """Enables editing once all files are loaded."""
+        if not self._is_current_loader():
+            return
+        self.loader = None
+        self._set_loading_visible(False)
+
+        self.set_language_selectors()
+        self.table_manager.populate_table()
+        self._set_editing_enabled(True)
+        self.load_variable()
+
+        # In lazy mode the remaining files are parsed in the background
+        self.fluent_api.on_file_loaded = self.file_loaded_notifier
+        self.fluent_api.start_prefetch()
+
+        self.file_watcher = FtlFileWatcher(self.fluent_api.folder_path, parent=self)
+        self.file_watcher.files_changed.connect(self.on_files_changed)
+
+    def _stop_watcher(self) -> None:
+        if self.file_watcher:
+            self.file_watcher.deleteLater()
+            self.file_watcher = None
+
+    def on_files_changed(self, ftl_files: list) -> None:
+        """Merges translation files changed outside the editor and refreshes their rows."""
+        if not self.fluent_api or self.sender() is not self.file_watcher:
+            return
+        self.normalize_pending()
+
+        languages = self.fluent_api.get_languages()
+        changed, conflicts, rows_changed = set(), [], False
+        for ftl_file in ftl_files:
+            if self.fluent_api.is_own_write(ftl_file):
+                continue
+            try:
+                report = self.fluent_api.reload_file(
+                    ftl_file.relative_to(self.fluent_api.folder_path)
+                )
+            except RuntimeError as e:
+                logger.warning(f"Skipped reloading '{ftl_file}': {e}")
+                continue
+            changed |= report.changed
+            conflicts += report.conflicts
+            rows_changed |= bool(report.added or report.removed)
+
+        if self.fluent_api.get_languages() != languages:
+            self.set_language_selectors()
+            rows_changed = True
+
+        if rows_changed:
+            self.table_manager.populate_table()
+            self.apply_filters()
+        elif changed:
+            self.table_manager.refresh_variables(changed)
+
+        if self.table_manager.get_selected_names()[0] in changed:
+            self.load_variable()
+
+        if conflicts:
+            keys = "\n".join(
+                f"{variable} ({language})" for variable, language in conflicts[:20]
             )
-            self.refresh_editing_state(False)
-        else:
+            QMessageBox.warning(
+                self,
+                "Files Changed",
+                f"These translations were changed on disk and have unsaved edits here; "
+                f"your edits were kept and will overwrite them on save:\n{keys}",
+            )
+
+    def on_load_cancelled(self) -> None:
+        if not self._is_current_loader():
+            return
+        self._unload_folder("Loading cancelled")
+
+    def on_load_failed(self, message: str) -> None:
+        if not self._is_current_loader():
+            return
+        self._unload_folder("Loading failed")
+        QMessageBox.critical(self, "Error", message)
+
+    def cancel_loading(self) -> None:
+        """Stops loading the folder; the editor is left without a folder."""
+        if self.loader:
+            self.cancel_load_button.setEnabled(False)
+            self.loader.cancel()
+
+    def _stop_loader(self) -> None:
+        """Cancels the running loader and waits for it to finish."""
+        if self.loader:
+            self.loader.cancel()
+            self.thread_pool.waitForDone()
+            self.loader = None
+
+    def _unload_folder(self, status: str) -> None:
+        """Drops a folder that was not loaded completely."""
+        self.loader = None
+        self._stop_watcher()
+        self._reset_search()
+        self._set_loading_visible(False)
+        self.fluent_api = None
+        self.table_manager = None
+        self.table.setModel(None)
+        self.lang_1.clear()
+        self.lang_2.clear()
+        self.folder_text.setText(status)
+        self.setWindowTitle(get_config(Program, "program").title)
+
+    def _set_loading_visible(self, visible: bool) -> None:
+        self.load_progress.setVisible(visible)
+        self.cancel_load_button.setVisible(visible)
+        self.cancel_load_button.setEnabled(True)
+
+    def _set_editing_enabled(self, enabled: bool) -> None:
+        """Enables or disables the controls that change translations."""
+        for editor, _, lang in self.editors:
+            editor.setEnabled(enabled)
+            lang.setEnabled(enabled)
+        self.save_button.setEnabled(enabled)
+        self.search_edit.setEnabled(enabled)
+        self.filter_combo.setEnabled(enabled)
+        self.filter_language.setEnabled(enabled)
+
+    def on_file_loaded(self, variables: list) -> None:
+        """Schedules a refresh of the rows defined by a file loaded on demand."""
+        self.loaded_variables.update(variables)
+        if not self.prefetch_refresh_timer.isActive():
+            self.prefetch_refresh_timer.start()
+
+    def refresh_loaded_variables(self) -> None:
+        """Refreshes the rows of the files loaded since the last refresh."""
+        variables, self.loaded_variables = self.loaded_variables, set()
+        self.table_manager.refresh_variables(variables)
+
+    def save_all_changes(self):
+        """Save all changes in the background; editing can go on while they are written."""
+        self.normalize_pending()
+        if not self.fluent_api.edited:
             QMessageBox.information(self, "No Changes", "No changes have been made.")
+            return
+
+        try:
+            snapshot = self.fluent_api.snapshot_changes()
+        except ValueError as e:
+            QMessageBox.critical(self, "Error", str(e))
+            return
+        self.refresh_editing_state()
+
+        worker = SaveWorker(self.fluent_api, snapshot)
+        worker.signals.finished.connect(self.on_save_finished)
+        worker.signals.failed.connect(self.on_save_failed)
+        self.save_workers.append(worker)
+        self.save_button.setText("Saving...")
+        self.save_pool.start(worker)
+
+    def on_save_finished(self, report) -> None:
+        self._save_done()
+        self.save_button.setToolTip(
+            f"Last save: {report.files_written} file(s) written in {report.seconds:.2f} s."
+        )
+
+    def on_save_failed(self, snapshot, message: str) -> None:
+        worker = self._save_done()
+        if worker.fluent_api is self.fluent_api:
+            self.fluent_api.restore_changes(snapshot)
+            self.refresh_editing_state()
+        QMessageBox.critical(self, "Error", f"Failed to save changes.\n{message}")
+
+    def _save_done(self) -> SaveWorker:
+        """Forgets the worker whose signal is being handled."""
+        worker = next(w for w in self.save_workers if w.signals is self.sender())
+        self.save_workers.remove(worker)
+        if not self.save_workers:
+            self.save_button.setText("Save")
+        return worker
+
+    def _wait_for_saves(self) -> None:
+        """Waits for the background saves and handles their results."""
+        if self.save_workers:
+            self.save_pool.waitForDone()
+            QApplication.sendPostedEvents()
+
+    def show_diagnostics(self) -> None:
+        DiagnosticsDialog(self).exec()
+
+    def go_to_key(self) -> None:
+        """Asks for a message ID and selects its row, clearing the filters hiding it."""
+        if not self.table_manager:
+            return
+
+        dialog = GoToKeyDialog(list(self.fluent_api.translations), self)
+        if not dialog.exec():
+            return
+
+        variable, attribute = dialog.key()
+        if not variable:
+            return
+        if (
+            variable in self.fluent_api.translations
+            and not self.table_manager.model.has_variable(variable)
+        ):
+            self._clear_filters()
+        if not self.table_manager.select(variable, attribute):
+            QMessageBox.warning(self, "Go to Key", f"Key '{variable}' was not found.")
+
+    def _clear_filters(self) -> None:
+        """Shows every key: clears the search field and selects the first filter entry."""
+        for widget in (self.search_edit, self.filter_combo):
+            widget.blockSignals(True)
+        self.search_edit.clear()
+        self.filter_combo.setCurrentIndex(0)
+        for widget in (self.search_edit, self.filter_combo):
+            widget.blockSignals(False)
+        self.apply_filters()
+
+    def focus_search(self) -> None:
+        self.search_edit.setFocus()
+        self.search_edit.selectAll()
+
+    def apply_filters(self) -> None:
+        """Shows only the rows matching the search field and the selected filter."""
+        self.search_timer.stop()
+        if not self.table_manager or self.loader:
+            return
+
+        query = self.search_edit.text()
+        if query.strip() and self.search_index is None:
+            self.search_index = SearchIndex(self.fluent_api)
+        visible = self.search_index.search(query) if self.search_index else None
+
+        # The first entry shows all keys, the next ones follow FilterIndex.FILTERS and
+        # the last one lists the differences with the language of the first column
+        filter_row = self.filter_combo.currentIndex()
+        language = self.filter_language.currentText()
+        if filter_row > len(FilterIndex.FILTERS) and language:
+            if self.consistency is None:
+                self.consistency = ConsistencyChecker(
+                    self.fluent_api, self.lang_1.currentText()
+                )
+            matching = self.consistency.variables(language)
+            visible = matching if visible is None else visible & matching
+        elif filter_row > 0 and language:
+            if self.filter_index is None:
+                self.filter_index = FilterIndex(self.fluent_api)
+            matching = self.filter_index.variables(
+                FilterIndex.FILTERS[filter_row - 1], language
+            )
+            visible = matching if visible is None else visible & matching
+
+        self.table_manager.set_visible_variables(visible)
+
+    def _reset_search(self) -> None:
+        """Drops the indexes of the previous folder and clears the search and filter."""
+        self.search_timer.stop()
+        for index in (self.search_index, self.filter_index, self.consistency):
+            if index:
+                index.close()
+        self.search_index = None
+        self.filter_index = None
+        self.consistency = None
+        for widget in (self.search_edit, self.filter_combo, self.filter_language):
+            widget.blockSignals(True)
+        self.search_edit.clear()
+        self.filter_combo.setCurrentIndex(0)
+        self.filter_language.clear()
+        for widget in (self.search_edit, self.filter_combo, self.filter_language):
+            widget.blockSignals(False)
 
     def select_folder(self):
         """Select folder and load .ftl files."""
@@ -119,12 +500,26 @@ class FluentusEditor(QWidget):
         self.lang_1.setCurrentIndex(0)
         self.lang_2.setCurrentIndex(1 if len(languages) >= 2 else 0)
 
+        # Filters default to the language being translated into
+        filter_language = (
+            self.filter_language.currentText() or self.lang_2.currentText()
+        )
+        self.filter_language.blockSignals(True)
+        self.filter_language.clear()
+        self.filter_language.addItems(languages)
+        self.filter_language.setCurrentText(filter_language)
+        self.filter_language.blockSignals(False)
+
     def load_table(self):
         """Update the table based on selected languages."""
 
         self.table_manager.populate_table()
 
+    @timed("editor.load_variable")
     def load_variable(self):
+        if not self.table_manager or self.loader:
+            return  # Translations are read once loading is finished
+
         variable, attribute = self.table_manager.get_selected_names()
         if not variable:
             return
@@ -134,7 +529,7 @@ class FluentusEditor(QWidget):
             data = self.fluent_api.get_translation(variable, language)
 
             if attribute and field == "value":
-                content = data.attributes[attribute]
+                content = data.attributes.get(attribute, "")
             else:
                 content = getattr(data, field, None)
 
@@ -183,6 +578,10 @@ class FluentusEditor(QWidget):
         if not variable:
             return
 
+        if isinstance(editor, QPlainTextEdit) and field == "value":
+            self.update_typed_value(editor, variable, attribute, lang.currentText())
+            return
+
         new_content = (
             editor.toPlainText()
             if isinstance(editor, QPlainTextEdit)
@@ -199,6 +598,77 @@ class FluentusEditor(QWidget):
         # Update title
         self.refresh_editing_state()
 
+    def update_typed_value(
+        self,
+        editor: QPlainTextEdit,
+        variable: str,
+        attribute: Optional[str],
+        language: str,
+    ) -> None:
+        """
+        Stores the typed text without parsing it and schedules its normalisation.
+
+        Keystrokes arriving within NORMALIZE_DELAY of each other are coalesced into
+        a single parse.
+        """
+        text = editor.toPlainText()
+        if self.fluent_api.update(
+            variable, language, "value", text, attribute, normalize=False
+        ):
+            self.table_manager.refresh_item(variable, language, attribute)
+            if self.lang_1.currentText() == self.lang_2.currentText():
+                self.load_variable()  # Both value editors show this translation
+
+        self.pending_normalization[editor] = (variable, attribute, language, text)
+        self.normalize_timer.start()
+
+        self.refresh_editing_state()
+
+    def normalize_pending(self) -> None:
+        """Stores the normalised form of the values typed since the last call."""
+        self.normalize_timer.stop()
+        pending, self.pending_normalization = self.pending_normalization, {}
+
+        for editor, (variable, attribute, language, text) in pending.items():
+            if not self.fluent_api.update(variable, language, "value", text, attribute):
+                continue
+            self.table_manager.refresh_item(variable, language, attribute)
+
+            # The editor may have moved on to another translation in the meantime
+            lang = next(lang for item, _, lang in self.editors if item is editor)
+            if (
+                self.table_manager.get_selected_names() == (variable, attribute)
+                and lang.currentText() == language
+                and editor.toPlainText() == text
+            ):
+                data = self.fluent_api.get_translation(variable, language)
+                value = data.attributes.get(attribute, "") if attribute else data.value
+                self._replace_text(editor, value or "")
+
+        self.refresh_editing_state()
+
+    def on_focus_changed(self, old: Optional[QWidget], new: Optional[QWidget]) -> None:
+        """Normalises a typed value as soon as its editor loses focus."""
+        if old in self.pending_normalization:
+            self.normalize_pending()
+
+    @staticmethod
+    def _replace_text(editor: QPlainTextEdit, text: str) -> None:
+        """Replaces the editor text, keeping the cursor at the same distance from the end."""
+        old_text = editor.toPlainText()
+        if old_text == text:
+            return
+
+        cursor = editor.textCursor()
+        position = len(text) - (len(old_text) - cursor.position())
+
+        editor.blockSignals(True)
+        editor.setPlainText(text)
+        editor.blockSignals(False)
+
+        cursor.setPosition(max(0, min(position, len(text))))
+        editor.setTextCursor(cursor)
+
     def refresh_editing_state(self, edit_status: Optional[bool] = None) -> None:
         """Refreshes the editing status in 'fluent_api' and updates the window title."""
 
@@ -219,6 +689,15 @@ class FluentusEditor(QWidget):
 
     def closeEvent(self, event):
         """Handle the close event with unsaved changes."""
+        self._stop_loader()
+        if not self.fluent_api:
+            self._open_start_window()
+            event.accept()
+            return
+
+        self.normalize_pending()
+        self._wait_for_saves()
+        self.fluent_api.stop_prefetch()
         if self.fluent_api.edited:
             dialog = CloseDialog(self)
             dialog.exec()
@@ -235,6 +714,7 @@ class FluentusEditor(QWidget):
                 self._open_start_window()
                 event.accept()
             else:
+                self.fluent_api.start_prefetch()
                 event.ignore()
         else:
             self._open_start_window()
@@ -1,9 +1,30 @@
+import os
 import re
+import sqlite3
+import sys
+import threading
+import time
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from itertools import repeat
 from pathlib import Path
-from typing import Union, List, Any, Set, Optional, DefaultDict
+from typing import (
+    Union,
+    List,
+    Any,
+    Set,
+    Optional,
+    Tuple,
+    Generator,
+    Dict,
+    DefaultDict,
+    Callable,
+    Iterator,
+    Iterable,
+)
 
-from fluent.syntax import parse, serialize, FluentParser, ParseError
+from fluent.syntax import parse, FluentParser, ParseError
 from fluent.syntax.ast import (
     Resource,
     TextElement,
@@ -17,13 +38,41 @@ from fluent.syntax.ast import (
     Identifier,
     Pattern,
 )
-from fluent.syntax.serializer import serialize_placeable
+from fluent.syntax.serializer import FluentSerializer, serialize_placeable
 from loguru import logger
 
 from src.fluent_api.base_type.elements import elements_type
-from src.fluent_api.base_type.translations import Translation, TranslationsType
+from src.fluent_api.base_type.files import (
+    FtlFile,
+    SaveReport,
+    SaveSnapshot,
+    ReloadReport,
+    SkippedEntry,
+    FILE_TABLE,
+)
+from src.fluent_api.base_type.translations import (
+    Translation,
+    TranslationsType,
+    intern_gap,
+)
+from src.fluent_api.parse_cache import ParseCache
+from src.fluent_api.presence import PresenceMatrix
+from src.fluent_api.utils.atomic_write import write_text_atomic
 from src.fluent_api.utils.bool_and_string import string_bool, bool_to_string
-from src.utils.config_reader import get_config, FtlFieldConfig
+from src.fluent_api.utils.lru_cache import LRUCache, CacheStats
+from src.utils.config_reader import (
+    get_config,
+    FtlFieldConfig,
+    LoaderConfig,
+    CacheConfig,
+    ParserConfig,
+)
+from src.utils.instrumentation import count, span, timed
+from src.utils.log_sampler import edit_log
+
+
+class LoadCancelled(Exception):
+    """Raised by FluentAPI.load() when loading is cancelled with cancel_load()."""
 
 
 class FluentAPI:
@@ -31,20 +80,99 @@ class FluentAPI:
     RE_LINE_SPLIT_PATTERN = re.compile(r"\n(?!\\\\)")
     RE_SEARCH_WHITESPACE = re.compile(r"(\s+)$")
     RE_SUB_IN_JUNK = re.compile(r"\n(?!\\\\)\s\s\s\s")
-
-    def __init__(self, folder_path: Optional[Path | str]):
+    RE_MESSAGE_ID = re.compile(r"^(-?[a-zA-Z][a-zA-Z0-9_-]*)[ \t]*=", re.MULTILINE)
+    # Single-line text the parser would return as is: no placeables, no special first
+    # character and no surrounding whitespace
+    RE_PLAIN_TEXT = re.compile(r"[^\s{}\[*.][^{}\r\n]*(?<!\s)")
+
+    # Parse results of recently used values, shared by all instances
+    AST_MEMO: LRUCache[tuple] = LRUCache(ParserConfig.model_fields["memo_size"].default)
+    BEAUTIFUL_MEMO: LRUCache[tuple] = LRUCache(
+        ParserConfig.model_fields["memo_size"].default
+    )
+
+    def __init__(
+        self,
+        folder_path: Optional[Path | str],
+        load: bool = True,
+        loader_config: Optional[LoaderConfig] = None,
+        cache_config: Optional[CacheConfig] = None,
+    ):
+        """
+        :param folder_path: Path to the locales directory.
+        :param load: Load the files now; otherwise call load() later, e.g. from a worker thread.
+        :param loader_config: Loader settings for this instance, the [loader] section if None.
+        :param cache_config: Parse cache settings for this instance, the [cache] section if None.
+        """
         self.config: FtlFieldConfig = get_config(FtlFieldConfig, root_key="ftl_field")
+        self.loader_config: LoaderConfig = loader_config or get_config(
+            LoaderConfig, root_key="loader"
+        )
+        self.cache_config: CacheConfig = cache_config or get_config(
+            CacheConfig, root_key="cache"
+        )
+        self.parser_config: ParserConfig = get_config(ParserConfig, root_key="parser")
+        self.AST_MEMO.resize(self.parser_config.memo_size)
+        self.BEAUTIFUL_MEMO.resize(self.parser_config.memo_size)
         self.bundles = defaultdict(
             list
         )  # Dictionary to store paths to .ftl files by language
-        self.translations: TranslationsType = defaultdict(
-            lambda: defaultdict(Translation)
-        )
+        self.translations: TranslationsType = {}
+        # Which variables have text in each language, kept with the translations
+        self.presence = PresenceMatrix()
+
+        # Loaded files by relative path and (variable, language) pairs changed since the last save
+        self.files: Dict[Path, FtlFile] = {}
+        self.dirty: Set[Tuple[str, str]] = set()
+        # Junk and unconvertible entries of the files parsed so far (files loaded from
+        # the parse cache are not parsed), kept in the files as text
+        self.skipped: Dict[Path, List[SkippedEntry]] = {}
 
         self.edited: bool = False
 
+        # Lazy loading: files waiting to be parsed and the files each scanned variable is in
+        self._pending: Dict[Path, Tuple[str, Path, str]] = {}
+        self._variable_files: DefaultDict[str, List[Path]] = defaultdict(list)
+        self._cache: Optional[ParseCache] = None
+        self._lock = threading.RLock()
+        self._prefetcher: Optional[threading.Thread] = None
+        self._stop_prefetch = threading.Event()
+        self.on_file_loaded: Optional[Callable[[Path, List[str]], None]] = None
+        # Called with the language when an edit changes its number of translated keys
+        self.on_coverage_changed: Optional[Callable[[str], None]] = None
+
+        # Called with the variables whose translations changed: edits, files loaded
+        # on demand and reloads. May be called from the prefetch thread.
+        self.change_listeners: List[Callable[[Iterable[str]], None]] = []
+
+        # Loading progress: (files done, files total, file) after each file and each finished locale
+        self.on_load_progress: Optional[Callable[[int, int, Path], None]] = None
+        self.on_locale_loaded: Optional[Callable[[str], None]] = None
+        self._cancel_load = threading.Event()
+
+        # (mtime, size) of the files written by the last saves, to tell them from external changes
+        self._written: Dict[Path, Tuple[int, int]] = {}
+
         self.folder_path = folder_path
-        self._load_files(locales_path=folder_path)
+        if load:
+            self.load()
+
+    @timed("load")
+    def load(self) -> None:
+        """
+        Loads the translation files of the locales directory.
+
+        Safe to run in a worker thread: translations are only added, so the GUI can
+        read locales reported by on_locale_loaded while the next ones are loading.
+
+        :raises LoadCancelled: If cancel_load() was called before loading finished.
+        """
+        self._cancel_load.clear()
+        self._load_files(locales_path=self.folder_path)
+
+    def cancel_load(self) -> None:
+        """Stops load() before the next file; may be called from any thread."""
+        self._cancel_load.set()
 
     def get_languages(self) -> List[str]:
         """Return a list of all loaded languages."""
@@ -55,9 +183,17 @@ class FluentAPI:
         return set(self.translations.keys())
 
     def get_translation(self, variable: str, language: str) -> Translation:
-        """Get translation data for a given variable and language."""
-        return self.translations[variable][language]
+        """
+        Get translation data for a given variable and language.
+
+        A missing translation is returned as a new empty one that is not stored:
+        update() adds it once it is edited.
+        """
+        self.ensure_loaded(variable)
+        translation = self.translations.get(variable, {}).get(language)
+        return translation if translation is not None else Translation()
 
+    @timed("update")
     def update(
         self,
         variable: str,
@@ -65,6 +201,7 @@ class FluentAPI:
         field: str,
         value: Any,
         attribute: Optional[str] = None,
+        normalize: bool = True,
     ) -> bool:
         """
         Update the value for a given variable and language in the cache.
@@ -75,49 +212,70 @@ class FluentAPI:
             field (str): Field to update ('value' or 'attributes').
             value (Any): New value for the field.
             attribute (Optional[str]): Attribute name (used if field is 'value').
+            normalize (bool): Reformat values through the Fluent parser. Without it the
+                text is stored as typed; update again later to store the normalised form.
         """
 
+        self.ensure_loaded(variable)
+
         # Validate existence of variable and language
-        try:
-            translation = self.translations[variable][language]
-        except KeyError as e:
-            key = e.args[0]
+        languages = self.translations.get(variable)
+        if languages is None or (
+            language not in languages and language not in self.bundles
+        ):
             error_message = (
                 f"Variable '{variable}' not found."
-                if key == variable
+                if languages is None
                 else f"Language '{language}' not found for variable '{variable}'."
             )
             logger.error(error_message)
-            raise KeyError(error_message) from e
+            raise KeyError(error_message)
+
+        # A missing translation is stored by the first edit that changes it
+        translation = languages.get(language)
+        if translation is None:
+            translation = self._new_translation(variable, language)
 
         # Determine if there's a value to update
         # if value or value in {False, 0}: # TODO: need tests
         if value is not None:
             if field in {"value", "attributes"}:
                 sanitized_value = re.sub(self.RE_NEWLINE_PATTERN, "\n", value)
-                beautiful_value, exist_junk = self.elements_to_beautiful_str(
-                    sanitized_value
-                )
+                if normalize:
+                    beautiful_value, exist_junk = self.elements_to_beautiful_str(
+                        sanitized_value
+                    )
 
-                if exist_junk:
-                    parsed_value = value
+                    if exist_junk:
+                        parsed_value = value
+                    else:
+                        parsed_value = beautiful_value
                 else:
-                    parsed_value = beautiful_value
+                    parsed_value = sanitized_value
 
             else:
                 parsed_value = value
         else:
             parsed_value = "" if field in {"value", "attributes"} else None
 
+        # Values are validated here, on the way in from the editor, not on every assignment
+        parsed_value = Translation.validate_field(field, parsed_value)
+
         if attribute and field == "value":
-            attribute = attribute
-            current_value = translation.attributes[attribute]
+            current_value = translation.attributes.get(attribute, "")
             if current_value != parsed_value:
                 translation.attributes[attribute] = parsed_value
-                self.edited = True
-                logger.info(
-                    f"Update value attribute '{attribute}' for variable '{variable}' and language '{language}'. "
-                    f"{current_value=}  -> {value=} -> {parsed_value=}"
+                translation.source = None
+                self._mark_dirty(variable, language, translation)
+                # Rate limited and formatted only when written: called on every keystroke
+                edit_log.info(
+                    "update",
+                    "Update value attribute {!r} for variable {!r} and language {!r}: {!r} -> {!r}",
+                    attribute,
+                    variable,
+                    language,
+                    current_value,
+                    parsed_value,
                 )
                 return True
         else:
@@ -130,15 +288,60 @@ class FluentAPI:
 
             if values_differ:
                 setattr(translation, field, parsed_value)
-                self.edited = True
-                logger.info(
-                    f"Update field '{field}' for variable '{variable}' and language '{language}'. "
-                    f"{current_value=}  -> {value=} -> {parsed_value=}"
+                translation.source = None
+                self._mark_dirty(variable, language, translation)
+                edit_log.info(
+                    "update",
+                    "Update field {!r} for variable {!r} and language {!r}: {!r} -> {!r}",
+                    field,
+                    variable,
+                    language,
+                    current_value,
+                    parsed_value,
                 )
                 return True
 
         return False
 
+    def _new_translation(self, variable: str, language: str) -> Translation:
+        """
+        Returns an empty translation to be saved next to the variable's other
+        translations: in the file with the same path in the language folder.
+        """
+        for sibling in self.translations.get(variable, {}).values():
+            filepath = sibling.filepath
+            if filepath is not None and len(filepath.parts) > 1:
+                return Translation(filepath=Path(language, *filepath.parts[1:]))
+        return Translation()
+
+    def _mark_dirty(
+        self, variable: str, language: str, translation: Translation
+    ) -> None:
+        """Remembers that the translation must be written on the next save."""
+        count("update.changed")
+        if translation.filepath in self._pending:
+            # A new translation is added to a file not parsed yet: without its
+            # entries the save would write the file with only this one
+            self.load_pending(translation.filepath)
+        with self._lock:
+            languages = self.translations[variable]
+            if languages.get(language) is not translation:
+                # A new translation is added to its file, the save writes it there
+                languages[language] = translation
+                ftl_file = self.files.get(translation.filepath)
+                if ftl_file is not None and ftl_file.locale == language:
+                    ftl_file.variables.append(variable)
+        coverage_changed = self.presence.set(variable, language, translation.has_text())
+        self.dirty.add((variable, language))
+        self.edited = True
+        self._notify_changed((variable,))
+        if coverage_changed and self.on_coverage_changed:
+            self.on_coverage_changed(language)
+
+    def _notify_changed(self, variables: Iterable[str]) -> None:
+        for listener in self.change_listeners:
+            listener(variables)
+
     def parse_fluent_ast(
         self,
         resource: Resource,
@@ -156,25 +359,145 @@ class FluentAPI:
         Returns:
             TranslationsType: The updated translations cache.
         """
+        self._store_entries(
+            self.parse_resource(resource, filepath), lang_folder, filepath
+        )
+        return self.translations
+
+    def parse_resource(
+        self,
+        resource: Resource,
+        filepath: Optional[Path] = None,
+        text: Optional[str] = None,
+    ) -> List[Tuple[str, Translation]]:
+        """
+        Converts the messages and terms of a Fluent AST into Translation objects.
+
+        Args:
+            resource (Resource): The Fluent AST resource.
+            filepath (Optional[Path]): The file path of the translation file.
+            text (Optional[str]): The text the resource was parsed from (with spans). Each
+                translation then keeps its entry's source and the text around it
+                (comments, blank lines, junk), so unchanged parts are saved byte-for-byte.
+
+        Returns:
+            List[Tuple[str, Translation]]: (variable name, translation) pairs in file order.
+        """
+        entries = []
+        skipped: List[SkippedEntry] = []
+        # End of the last entry converted to a translation, the text after it is a gap
+        gap_start = 0
         for entry in resource.body:
             if isinstance(entry, (Message, Term)):
                 var_name = (
                     f"-{entry.id.name}" if isinstance(entry, Term) else entry.id.name
                 )
 
+                source = None
+                if text is not None and entry.span:
+                    start, end = entry.span.start, entry.span.end
+                    source = text[start:end]
                 try:
-                    self.translations[var_name][lang_folder] = self.parse_message(
-                        entry, filepath=filepath
+                    translation = self.parse_message(
+                        entry, filepath=filepath, source=source
                     )
                 except Exception as e:
+                    # Its text stays in the gap before the next entry
                     logger.error(f"Error parsing {type(entry)} '{entry.id.name}': {e}")
+                    skipped.append(
+                        self._skipped_entry(entry, text, source or var_name, (str(e),))
+                    )
+                    continue
+
+                if source is not None:
+                    translation.leading = intern_gap(text[gap_start:start])
+                    gap_start = end
+                entries.append((var_name, translation))
+            elif isinstance(entry, Junk):
+                logger.warning(f"Junk in '{filepath}' is kept as is: {entry.content!r}")
+                skipped.append(
+                    self._skipped_entry(
+                        entry,
+                        text,
+                        entry.content,
+                        tuple(
+                            f"{annotation.code}: {annotation.message}"
+                            for annotation in entry.annotations
+                        ),
+                    )
+                )
             else:
-                logger.warning(f"Unsupported entry type: {type(entry)}")
+                logger.debug("Kept {} in '{}' as text.", type(entry).__name__, filepath)
 
-        return self.translations
+        if entries and text is not None and entries[-1][1].leading is not None:
+            entries[-1][1].trailing = intern_gap(text[gap_start:])
+        if len(entries) != len({var_name for var_name, _ in entries}):
+            entries = self._fold_duplicates(entries)
+
+        if filepath is not None:
+            if skipped:
+                self.skipped[filepath] = skipped
+            else:
+                self.skipped.pop(filepath, None)
+
+        return entries
+
+    @staticmethod
+    def _fold_duplicates(
+        entries: List[Tuple[str, Translation]],
+    ) -> List[Tuple[str, Translation]]:
+        """
+        Keeps the last definition of a variable defined more than once in a file.
+
+        The text of the earlier ones goes to the gap before the next kept entry,
+        so saving the file writes them back unchanged.
+        """
+        last = {var_name: index for index, (var_name, _) in enumerate(entries)}
+        kept = []
+        folded = ""
+        for index, (var_name, translation) in enumerate(entries):
+            if last[var_name] != index:
+                if translation.leading is not None:
+                    folded += translation.leading + translation.source
+                continue
+            if folded:
+                translation.leading = intern_gap(folded + translation.leading)
+                folded = ""
+            kept.append((var_name, translation))
+        return kept
+
+    @staticmethod
+    def _skipped_entry(
+        entry, text: Optional[str], content: str, errors: Tuple[str, ...]
+    ) -> SkippedEntry:
+        line = None
+        if text is not None and entry.span:
+            line = text.count("\n", 0, entry.span.start) + 1
+        return SkippedEntry(line=line, content=content, errors=errors)
+
+    def _store_entries(
+        self,
+        entries: List[Tuple[str, Translation]],
+        lang_folder: Optional[str],
+        filepath: Optional[Path],
+        text: Optional[str] = None,
+    ) -> None:
+        # Names are interned so every language, file index and table row shares one string
+        lang_folder = sys.intern(lang_folder) if lang_folder else lang_folder
+        ftl_file = self.files.setdefault(filepath, FtlFile(locale=lang_folder))
+        if not entries:
+            ftl_file.text = text
+        for var_name, translation in entries:
+            var_name = sys.intern(var_name)
+            self.translations.setdefault(var_name, {})[lang_folder] = translation
+            self.presence.set(var_name, lang_folder, translation.has_text())
+            ftl_file.variables.append(var_name)
 
     def parse_message(
-        self, entry: Union[Message, Term], filepath: Optional[Path] = None
+        self,
+        entry: Union[Message, Term],
+        filepath: Optional[Path] = None,
+        source: Optional[str] = None,
     ) -> Translation:
         """
         Parses a message or term and returns a Translation object.
@@ -182,6 +505,7 @@ class FluentAPI:
         Args:
             entry (Union[Message, Term]): The entry to parse.
             filepath (Optional[str]): File path for the translation, if available.
+            source (Optional[str]): Source text of the entry, if available.
 
         Returns:
             Translation: Parsed translation data.
@@ -201,7 +525,7 @@ class FluentAPI:
                     logger.error(
                         f"Error parsing attribute '{attr.id.name}' in {filepath or 'unknown'}: {e}"
                     )
-                attributes[f".{attr.id.name}"] = attr_value
+                attributes[sys.intern(f".{attr.id.name}")] = attr_value
 
         # Parse value
         value = self.elements_to_str(entry.value.elements) if entry.value else ""
@@ -212,6 +536,7 @@ class FluentAPI:
             comment=comment,
             check=check,
             filepath=filepath,
+            source=source,
         )
 
     def _parse_comment(self, comment: Optional[Comment]) -> tuple[Optional[str], bool]:
@@ -261,10 +586,21 @@ class FluentAPI:
 
     @staticmethod
     def parse_str_to_ast(value: str) -> list[TextElement | Placeable]:
+        if FluentAPI.RE_PLAIN_TEXT.fullmatch(value):
+            return [TextElement(value=value)]
+
+        cached = FluentAPI.AST_MEMO.get(value)
+        if cached is None:
+            cached = tuple(FluentAPI._parse_str_to_ast(value))
+            FluentAPI.AST_MEMO.put(value, cached)
+        # Shared elements are only read by the serializer, the list is the caller's
+        return list(cached)
+
+    @staticmethod
+    def _parse_str_to_ast(value: str) -> list[TextElement | Placeable]:
         sanitized_value = re.sub(FluentAPI.RE_LINE_SPLIT_PATTERN, "\n    ", value)
         parsed = FluentParser(with_spans=False).parse_entry(
-            f"variable ="
-            f"\n    {sanitized_value}"
+            f"variable =" f"\n    {sanitized_value}"
         )
         if isinstance(parsed, Junk):
             logger.warning(f"Junk: {parsed}")
@@ -278,6 +614,17 @@ class FluentAPI:
 
     @staticmethod
     def elements_to_beautiful_str(value: str) -> tuple[str, bool]:
+        if FluentAPI.RE_PLAIN_TEXT.fullmatch(value):
+            return value, False
+
+        cached = FluentAPI.BEAUTIFUL_MEMO.get(value)
+        if cached is None:
+            cached = FluentAPI._elements_to_beautiful_str(value)
+            FluentAPI.BEAUTIFUL_MEMO.put(value, cached)
+        return cached
+
+    @staticmethod
+    def _elements_to_beautiful_str(value: str) -> tuple[str, bool]:
         parsed_entry = FluentAPI.parse_str_to_ast(value)
         parsed_value = []
         exist_junk = False
@@ -295,6 +642,14 @@ class FluentAPI:
 
         return beautiful_str, exist_junk
 
+    @staticmethod
+    def memo_stats() -> Dict[str, CacheStats]:
+        """Hit/miss statistics of the parse memos."""
+        return {
+            "parse_str_to_ast": FluentAPI.AST_MEMO.stats(),
+            "elements_to_beautiful_str": FluentAPI.BEAUTIFUL_MEMO.stats(),
+        }
+
     def translation_data_to_ast(
         self, translation_data: Translation, name: Optional[str] = None
     ) -> Term | Message:
@@ -364,6 +719,254 @@ class FluentAPI:
                 f"Locales directory '{locales_path}' does not exist or is not a directory."
             )
 
+        ftl_files = self._collect_files(locales_path=locales_path, ext=ext)
+        cache = self._open_cache()
+        try:
+            cached = [
+                self._get_cached(cache, ftl_file, locales_path)
+                for _, ftl_file in ftl_files
+            ]
+            resources = self._parse_files(
+                [
+                    ftl_file
+                    for (_, ftl_file), entries in zip(ftl_files, cached)
+                    if entries is None and not self.loader_config.lazy
+                ],
+                encoding=encoding,
+            )
+
+            # Results are merged in discovery order, so the parallel path fills
+            # self.translations and self.bundles exactly like the serial one
+            try:
+                for done, ((locale, ftl_file), entries) in enumerate(
+                    zip(ftl_files, cached)
+                ):
+                    if self._cancel_load.is_set():
+                        logger.info(f"Loading of '{locales_path}' cancelled.")
+                        raise LoadCancelled(
+                            f"Loading of '{locales_path}' was cancelled."
+                        )
+                    if done and locale != ftl_files[done - 1][0]:
+                        self._locale_loaded(ftl_files[done - 1][0])
+
+                    filepath = ftl_file.relative_to(locales_path)
+                    if entries is None and self.loader_config.lazy:
+                        self._scan_file(ftl_file, locale, filepath, encoding)
+                        self._load_progress(done + 1, len(ftl_files), filepath)
+                        continue
+                    with self._file_errors(ftl_file):
+                        if entries is None:
+                            resource, text = next(resources)
+                            with span("load.convert"):
+                                entries = self.parse_resource(
+                                    resource, filepath=filepath, text=text
+                                )
+                            self.bundles[locale].append(resource)
+                            # Files without entries are parsed again for their text
+                            if cache and entries:
+                                cache.put(ftl_file, entries)
+                        else:
+                            # Cached files have no AST or text, only register the locale
+                            self.bundles.setdefault(locale, [])
+                            count("load.cache_hits")
+                            text = None
+                        self._store_entries(entries, locale, filepath, text)
+                        count("load.files")
+                        count("load.entries", len(entries))
+                    logger.debug(
+                        "Loaded resource from file '{}' for locale '{}'.",
+                        ftl_file,
+                        locale,
+                    )
+                    self._load_progress(done + 1, len(ftl_files), filepath)
+            finally:
+                resources.close()
+            self._locale_loaded(ftl_files[-1][0])
+
+            if cache:
+                cache.prune(locales_path, (ftl_file for _, ftl_file in ftl_files))
+                logger.info(
+                    f"Parse cache: {cache.hits} files loaded from cache, {cache.misses} parsed."
+                )
+        finally:
+            if cache and self._pending:
+                # Files parsed later on demand are stored in the cache when loaded
+                cache.commit()
+                self._cache = cache
+            elif cache:
+                cache.close()
+
+    def _load_progress(self, done: int, total: int, filepath: Path) -> None:
+        if self.on_load_progress:
+            self.on_load_progress(done, total, filepath)
+
+    def _locale_loaded(self, locale: str) -> None:
+        if self.on_locale_loaded:
+            self.on_locale_loaded(locale)
+
+    @staticmethod
+    @contextmanager
+    def _file_errors(ftl_file: Path) -> Iterator[None]:
+        """Wraps errors raised while loading a file with the file name."""
+        try:
+            yield
+        except ParseError as e:
+            logger.error(f"Parse error in file '{ftl_file}': {e}")
+            raise ParseError(f"Parse error in file '{ftl_file}': {e}") from e
+        except Exception as e:
+            logger.error("Failed to read file '%s': %s", ftl_file, e)
+            raise RuntimeError(f"Failed to read file '{ftl_file}': {e}") from e
+
+    def _scan_file(
+        self, ftl_file: Path, locale: str, filepath: Path, encoding: str
+    ) -> None:
+        """
+        Registers a file for on-demand parsing, listing its message IDs with a regex scan.
+
+        :param ftl_file: Absolute path of the file.
+        :param locale: Locale of the file.
+        :param filepath: Path of the file relative to the locales directory.
+        :param encoding: Encoding of the file.
+        """
+        with self._file_errors(ftl_file):
+            content = ftl_file.read_text(encoding=encoding)
+
+        self.bundles.setdefault(locale, [])
+        self.files[filepath] = FtlFile(locale=locale)
+        self._pending[filepath] = (locale, ftl_file, encoding)
+        for match in self.RE_MESSAGE_ID.finditer(content):
+            var_name = match.group(1)
+            # Creates the row now so variables keep the order of the full load;
+            # presence is assumed until the file is parsed
+            self.translations.setdefault(var_name, {})
+            self.presence.set(var_name, locale, True)
+            self._variable_files[var_name].append(filepath)
+
+    @property
+    def pending_files(self) -> List[Path]:
+        """Files registered by the lazy loader that are not parsed yet."""
+        return list(self._pending)
+
+    @timed("load.pending_file")
+    def load_pending(self, filepath: Path) -> List[str]:
+        """
+        Parses a file registered by the lazy loader and merges its translations.
+
+        :param filepath: Path of the file relative to the locales directory.
+        :return: Variables defined in the file, empty if it was already loaded.
+        """
+        with self._lock:
+            pending = self._pending.pop(filepath, None)
+            if pending is None:
+                return []
+
+            locale, ftl_file, encoding = pending
+            try:
+                with self._file_errors(ftl_file):
+                    resource, text = self._read_and_parse(ftl_file, encoding)
+                    entries = self.parse_resource(
+                        resource, filepath=filepath, text=text
+                    )
+                    self.bundles[locale].append(resource)
+                    self._store_entries(entries, locale, filepath, text)
+                    if self._cache and entries:
+                        self._cache.put(ftl_file, entries)
+                        self._cache.commit()
+            finally:
+                if self._cache and not self._pending:
+                    self._cache.close()
+                    self._cache = None
+
+            logger.debug(
+                "Loaded resource from file '{}' for locale '{}'.", ftl_file, locale
+            )
+            variables = [var_name for var_name, _ in entries]
+
+        self._notify_changed(variables)
+        if self.on_file_loaded:
+            self.on_file_loaded(filepath, variables)
+        return variables
+
+    def ensure_loaded(self, variable: str) -> None:
+        """Parses the pending files that define the variable."""
+        if not self._pending:
+            return
+        for filepath in self._variable_files.pop(variable, ()):
+            self.load_pending(filepath)
+
+    def load_all(self) -> None:
+        """Parses every file still pending in lazy mode."""
+        for filepath in self.pending_files:
+            self.load_pending(filepath)
+
+    def start_prefetch(self) -> None:
+        """Parses the pending files in a background thread."""
+        if not self._pending or self._prefetcher:
+            return
+
+        def prefetch() -> None:
+            for filepath in self.pending_files:
+                if self._stop_prefetch.is_set():
+                    return
+                try:
+                    self.load_pending(filepath)
+                except Exception as e:
+                    logger.error(f"Prefetch of '{filepath}' failed: {e}")
+
+        self._prefetcher = threading.Thread(
+            target=prefetch, name="ftl-prefetch", daemon=True
+        )
+        self._prefetcher.start()
+
+    def stop_prefetch(self) -> None:
+        """Stops the background prefetcher after the file it is parsing."""
+        if self._prefetcher:
+            self._stop_prefetch.set()
+            self._prefetcher.join()
+            self._prefetcher = None
+            self._stop_prefetch.clear()
+
+    def _open_cache(self) -> Optional[ParseCache]:
+        """Opens the on-disk parse cache if it is enabled in the config."""
+        if not self.cache_config.enabled:
+            return None
+        try:
+            return ParseCache(
+                f"{self.cache_config.name}.db", salt=f"check={self.config.check}"
+            )
+        except sqlite3.Error as e:
+            logger.warning(f"Parse cache is unavailable: {e}")
+            return None
+
+    @staticmethod
+    def _get_cached(
+        cache: Optional[ParseCache], ftl_file: Path, locales_path: Path
+    ) -> Optional[List[Tuple[str, Translation]]]:
+        if not cache:
+            return None
+        try:
+            entries = cache.get(ftl_file)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Parse cache lookup failed for '{ftl_file}': {e}")
+            return None
+        if entries:
+            # Rows are keyed by the resolved path, but the file may have been cached
+            # under another root (a symlink or parent folder): paths are relative to this one
+            filepath = ftl_file.relative_to(locales_path)
+            for _, translation in entries:
+                translation.filepath = filepath
+        return entries
+
+    @staticmethod
+    def _collect_files(locales_path: Path, ext: str) -> List[Tuple[str, Path]]:
+        """
+        Finds all translation files in the locales directory.
+
+        :param locales_path: Path to the locales directory.
+        :param ext: Translation file extension.
+        :return: List of (locale, file path) pairs in loading order.
+        :raises ValueError: If no locales or files are found for a locale.
+        """
         # Extract locales (names of subdirectories)
         locales = [item.name for item in locales_path.iterdir() if item.is_dir()]
 
@@ -371,11 +974,12 @@ class FluentAPI:
             logger.error("No locales found in directory '%s'.", locales_path)
             raise ValueError(f"No locales found in directory '{locales_path}'.")
 
+        ftl_files = []
         for locale in locales:
             locale_dir = locales_path / locale
-            ftl_files = list(locale_dir.rglob(f"*{ext}"))
+            locale_files = list(locale_dir.rglob(f"*{ext}"))
 
-            if not ftl_files:
+            if not locale_files:
                 logger.warning(
                     f"No '{ext}' files found in locale directory '{locale_dir}'."
                 )
@@ -383,31 +987,100 @@ class FluentAPI:
                     f"No '{ext}' files found in locale directory '{locale_dir}'."
                 )
 
+            ftl_files.extend((locale, ftl_file) for ftl_file in locale_files)
+
+        return ftl_files
+
+    @staticmethod
+    def _read_and_parse(ftl_file: Path, encoding: str) -> Tuple[Resource, str]:
+        """Reads and parses a single translation file (runs in worker processes)."""
+        # Spans recorded in worker processes are lost, the pool is timed in _parse_files
+        with span("load.read"):
+            text = ftl_file.read_text(encoding=encoding)
+        with span("load.parse"):
+            return parse(text), text
+
+    def _parse_files(
+        self, ftl_files: List[Path], encoding: str
+    ) -> Generator[Tuple[Resource, str], None, None]:
+        """
+        Yields parsed resources and the text they were parsed from in the same order as ftl_files.
+
+        Files are parsed in a process pool when the loader is configured with more
+        than one worker, otherwise one after another in the current process.
+
+        :param ftl_files: Paths of the files to parse.
+        :param encoding: Encoding of the translation files.
+        """
+        workers = self.loader_config.workers or os.cpu_count() or 1
+        workers = min(workers, len(ftl_files))
+
+        if workers <= 1:
             for ftl_file in ftl_files:
-                try:
-                    content = ftl_file.read_text(encoding=encoding)
-                    resource = parse(content)
-                    self.parse_fluent_ast(
-                        resource=resource,
-                        lang_folder=locale,
-                        filepath=ftl_file.relative_to(locales_path),
-                    )
-                    self.bundles[locale].append(resource)
-                    logger.debug(
-                        f"Loaded resource from file '{ftl_file}' for locale '{locale}'."
-                    )
-                except ParseError as e:
-                    logger.error(f"Parse error in file '{ftl_file}': {e}")
-                    raise ParseError(f"Parse error in file '{ftl_file}': {e}") from e
-                except Exception as e:
-                    logger.error("Failed to read file '%s': %s", ftl_file, e)
-                    raise RuntimeError(f"Failed to read file '{ftl_file}': {e}") from e
+                yield self._read_and_parse(ftl_file, encoding)
+            return
+
+        logger.debug(f"Parsing {len(ftl_files)} files with {workers} workers.")
+        executor = ProcessPoolExecutor(max_workers=workers)
+        try:
+            results = executor.map(
+                self._read_and_parse,
+                ftl_files,
+                repeat(encoding),
+                chunksize=max(1, len(ftl_files) // (workers * 4)),
+            )
+            while True:
+                # Time the loader waits for the pool, per file
+                with span("load.parse_wait"):
+                    result = next(results, None)
+                if result is None:
+                    return
+                yield result
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @timed("save")
+    def save_all_files(self, target_folder: Optional[str] = None) -> SaveReport:
+        """
+        Writes changed translation files.
+
+        Only files containing translations changed since the last save are rewritten.
+        When target_folder differs from the loaded folder every file is written there.
 
-    def save_all_files(self, target_folder: Optional[str] = None):
-        file_content_map: DefaultDict[Path, List[Message | Term]] = defaultdict(list)
+        :param target_folder: Folder to save into (default is the loaded folder).
+        :return: Number of written files and the time it took.
+        :raises ValueError: If a changed translation has no file to be saved to.
+        """
+        snapshot = self.snapshot_changes(target_folder)
+        try:
+            return self.write_snapshot(snapshot)
+        except Exception:
+            self.restore_changes(snapshot)
+            raise
+
+    @timed("save.snapshot")
+    def snapshot_changes(self, target_folder: Optional[str] = None) -> SaveSnapshot:
+        """
+        Copies the translations of the files to save and marks them as saved.
+
+        The snapshot is written with write_snapshot(), which may run in another thread
+        while the translations keep being edited. Edits made after the snapshot are
+        saved by the next one.
 
-        for variable_name, translations_by_lang in self.translations.items():
-            for language, translation_data in translations_by_lang.items():
+        :param target_folder: Folder to save into (default is the loaded folder).
+        :return: The files to write.
+        :raises ValueError: If a changed translation has no file to be saved to.
+        """
+        target_folder = Path(target_folder or self.folder_path)
+
+        if target_folder != Path(self.folder_path):
+            self.load_all()
+
+        with self._lock:
+            dirty_files: Set[Path] = set()
+            new_files: Set[Path] = set()
+            for variable_name, language in self.dirty:
+                translation_data = self.translations[variable_name][language]
                 if not translation_data.filepath:
                     logger.error(
                         f"Missing filepath for variable '{variable_name}': {translation_data.filepath}"
@@ -415,25 +1088,207 @@ class FluentAPI:
                     raise ValueError(
                         f"Filepath is missing for language '{language}', variable '{variable_name}'"
                     )
+                dirty_files.add(translation_data.filepath)
+
+                # Translations pointing to a file that was not loaded create it
+                if translation_data.filepath not in self.files:
+                    new_files.add(translation_data.filepath)
+                    self.files[translation_data.filepath] = FtlFile(locale=language)
+                if translation_data.filepath in new_files:
+                    self.files[translation_data.filepath].variables.append(
+                        variable_name
+                    )
+
+            if target_folder != Path(self.folder_path):
+                dirty_files = set(self.files)
+
+            files: Dict[Path, List[Tuple[str, Translation]]] = {}
+            for filepath in dirty_files:
+                ftl_file = self.files[filepath]
+                file_id = FILE_TABLE.get_id(filepath)
+                entries = files[filepath] = []
+                for variable_name in ftl_file.variables:
+                    translation_data = self.translations[variable_name][ftl_file.locale]
+                    # A variable defined twice is saved only to the file it was loaded from last
+                    if translation_data.file_id == file_id:
+                        entries.append((variable_name, translation_data.copy()))
+
+            texts = {
+                filepath: self.files[filepath].text
+                for filepath in dirty_files
+                if self.files[filepath].text is not None
+            }
+            snapshot = SaveSnapshot(target_folder, files, texts, set(self.dirty))
+            self.dirty.clear()
+            self.edited = False
+
+        return snapshot
+
+    @timed("save.write")
+    def write_snapshot(self, snapshot: SaveSnapshot) -> SaveReport:
+        """
+        Serializes and writes the files of a snapshot; safe to run in a worker thread.
 
-                # Determine the output filepath
-                output_filepath = (
-                    target_folder or self.folder_path
-                ) / translation_data.filepath
+        Every file is replaced atomically, so a crash never leaves one half-written.
 
-                # Generate translation AST and append to the file content map
-                file_content_map[output_filepath].append(
-                    self.translation_data_to_ast(translation_data, variable_name)
-                )
+        :param snapshot: Files returned by snapshot_changes().
+        :return: Number of written files and the time it took.
+        """
+        started = time.perf_counter()
+
+        serializer = FluentSerializer()
+        for filepath, entries in snapshot.files.items():
+            # The file is reassembled from the text between entries and the entries'
+            # sources; only edited entries are serialized again
+            chunks = []
+            if filepath in snapshot.texts:
+                chunks.append(snapshot.texts[filepath])
+            for variable_name, translation_data in entries:
+                if translation_data.leading is not None:
+                    chunks.append(translation_data.leading)
+                elif chunks:
+                    chunks.append("\n")
+
+                if translation_data.source is not None:
+                    chunks.append(translation_data.source)
+                else:
+                    entry_ast = self.translation_data_to_ast(
+                        translation_data, variable_name
+                    )
+                    chunks.append(
+                        serializer.serialize_entry(entry_ast).removesuffix("\n")
+                    )
+
+                if translation_data.trailing is not None:
+                    chunks.append(translation_data.trailing)
+            if entries and not chunks[-1].endswith("\n"):
+                chunks.append("\n")
 
-        # Write content to the respective files
-        for filepath, content_ast in file_content_map.items():
-            output_path = Path(filepath)
+            output_path = snapshot.target_folder / filepath
             output_path.parent.mkdir(
                 parents=True, exist_ok=True
             )  # Ensure the directory exists
 
-            with output_path.open("w", encoding="utf-8") as file:
-                file.write(serialize(Resource(body=content_ast)))
+            write_text_atomic(output_path, "".join(chunks))
+            stat = output_path.stat()
+            self._written[output_path] = (stat.st_mtime_ns, stat.st_size)
+
+        report = SaveReport(
+            files_written=len(snapshot.files), seconds=time.perf_counter() - started
+        )
+        count("save.files", report.files_written)
+        logger.info(
+            f"Saved {report.files_written} files to '{snapshot.target_folder}' in {report.seconds:.3f} s."
+        )
+        logger.opt(lazy=True).debug("Parse memo: {}", self.memo_stats)
+        return report
+
+    def is_own_write(self, ftl_file: Path) -> bool:
+        """Whether a file is unchanged since this FluentAPI saved it."""
+        written = self._written.get(ftl_file)
+        if written is None:
+            return False
+        try:
+            stat = ftl_file.stat()
+        except OSError:
+            return False
+        return written == (stat.st_mtime_ns, stat.st_size)
+
+    def reload_file(self, filepath: Path, encoding: str = "utf-8") -> ReloadReport:
+        """
+        Re-reads a file changed, added or deleted outside the editor and merges it.
+
+        Translations with unsaved edits are not overwritten: they are reported as
+        conflicts and the next save writes the local version.
+
+        :param filepath: Path of the file relative to the locales directory.
+        :param encoding: Encoding of the file.
+        :return: The variables that changed.
+        :raises RuntimeError: If the file cannot be read.
+        """
+        ftl_file = Path(self.folder_path) / filepath
+        locale = sys.intern(filepath.parts[0])
+        file_id = FILE_TABLE.get_id(filepath)
+
+        entries: List[Tuple[str, Translation]] = []
+        exists = ftl_file.is_file()
+        if exists:
+            with self._file_errors(ftl_file):
+                resource, text = self._read_and_parse(ftl_file, encoding)
+            entries = self.parse_resource(resource, filepath=filepath, text=text)
+        else:
+            self.skipped.pop(filepath, None)
+
+        report = ReloadReport(set(), set(), set(), [])
+        with self._lock:
+            # A pending file is read now, the lazy loader must not add it again
+            self._pending.pop(filepath, None)
+            old_file = self.files.pop(filepath, None)
+            new_file = FtlFile(locale=locale)
+            if exists and not entries:
+                new_file.text = text
+
+            for var_name, translation in entries:
+                var_name = sys.intern(var_name)
+                new_file.variables.append(var_name)
+                languages = self.translations.get(var_name)
+                current = languages.get(locale) if languages is not None else None
+                if current is not None and current == translation:
+                    # Same content, but the formatting around it may have changed
+                    current.source = translation.source
+                    current.leading = translation.leading
+                    current.trailing = translation.trailing
+                    continue
+                if (var_name, locale) in self.dirty:
+                    report.conflicts.append((var_name, locale))
+                    if current is not None and current.file_id == file_id:
+                        # The edit is written at the entry's place in the new text
+                        current.leading = translation.leading
+                        current.trailing = translation.trailing
+                    continue
+                if languages is None:
+                    report.added.add(var_name)
+                self.translations.setdefault(var_name, {})[locale] = translation
+                self.presence.set(var_name, locale, translation.has_text())
+                report.changed.add(var_name)
+
+            new_variables = set(new_file.variables)
+            for var_name in old_file.variables if old_file else ():
+                if var_name in new_variables:
+                    continue
+                languages = self.translations.get(var_name, {})
+                translation = languages.get(locale)
+                if translation is None or translation.file_id != file_id:
+                    continue  # Loaded from another file
+                if (var_name, locale) in self.dirty:
+                    # Kept in the file, so the next save writes the edit back,
+                    # after the entries of the new text
+                    report.conflicts.append((var_name, locale))
+                    new_file.variables.append(var_name)
+                    translation.leading = translation.trailing = None
+                    continue
+                del languages[locale]
+                if languages:
+                    self.presence.set(var_name, locale, False)
+                    report.changed.add(var_name)
+                else:
+                    del self.translations[var_name]
+                    self.presence.remove(var_name)
+                    report.removed.add(var_name)
 
-        self.edited = False
+            if exists or new_file.variables:
+                self.files[filepath] = new_file
+            self.bundles.setdefault(locale, [])
+
+        logger.info(
+            f"Reloaded '{ftl_file}': {len(report.changed)} changed, {len(report.removed)} removed, "
+            f"{len(report.conflicts)} conflicts."
+        )
+        self._notify_changed(report.changed | report.removed)
+        return report
+
+    def restore_changes(self, snapshot: SaveSnapshot) -> None:
+        """Marks the translations of a snapshot that failed to be written as unsaved again."""
+        with self._lock:
+            self.dirty.update(snapshot.dirty)
+            self.edited = True
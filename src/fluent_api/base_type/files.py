@@ -0,0 +1,103 @@
+import threading
+from pathlib import Path
+from typing import List, NamedTuple, Dict, Optional, Set, Tuple, TYPE_CHECKING
+
+from pydantic import BaseModel, Field
+
+if TYPE_CHECKING:
+    from src.fluent_api.base_type.translations import Translation
+
+
+class FileTable:
+    """
+    Interns file paths: every distinct path is stored once and referred to by an integer ID.
+    """
+
+    def __init__(self) -> None:
+        self._paths: List[Path] = []
+        self._ids: Dict[Path, int] = {}
+        self._lock = threading.Lock()
+
+    def get_id(self, filepath: Optional[Path]) -> int:
+        """Returns the ID of a path, registering it on first use (-1 for no path)."""
+        if filepath is None:
+            return -1
+        file_id = self._ids.get(filepath)
+        if file_id is None:
+            with self._lock:
+                file_id = self._ids.get(filepath)
+                if file_id is None:
+                    file_id = self._ids[filepath] = len(self._paths)
+                    self._paths.append(filepath)
+        return file_id
+
+    def get_path(self, file_id: int) -> Optional[Path]:
+        return self._paths[file_id] if file_id >= 0 else None
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+
+# Shared by all translations, paths are relative to the locales folder
+FILE_TABLE = FileTable()
+
+
+class FtlFile(BaseModel):
+    """A loaded translation file: its locale and the variables it defines, in file order."""
+
+    locale: str
+    variables: List[str] = Field(default_factory=list)
+    # Whole text of a file without messages or terms (only comments or junk),
+    # written back as is before any entry added to it
+    text: Optional[str] = None
+
+
+class SkippedEntry(NamedTuple):
+    """Text of a file that is not a message or term: Junk, or an entry that could not be converted."""
+
+    # 1-based line of its start, None when the file text was not available
+    line: Optional[int]
+    content: str
+    # Parser annotations or conversion error
+    errors: Tuple[str, ...]
+
+
+class SaveReport(NamedTuple):
+    files_written: int
+    seconds: float
+
+
+class ImportReport(NamedTuple):
+    """Effect of importing translations from an exchange file."""
+
+    # Rows read from the file
+    rows: int
+    # Values, comments and check flags that changed
+    changed: int
+    # Cells of variables or languages that are not in the project
+    skipped: int
+
+
+class ReloadReport(NamedTuple):
+    """Effect of re-reading a file that was changed outside the editor."""
+
+    # Variables whose translations changed, including added ones
+    changed: Set[str]
+    # Variables that did not exist before
+    added: Set[str]
+    # Variables that no longer exist in any language
+    removed: Set[str]
+    # (variable, language) pairs changed on disk and edited here; the unsaved edit is kept
+    conflicts: List[Tuple[str, str]]
+
+
+class SaveSnapshot(NamedTuple):
+    """Copies of the translations to write, so editing can go on while they are saved."""
+
+    target_folder: Path
+    # Entries of every file to write, in file order
+    files: Dict[Path, List[Tuple[str, "Translation"]]]
+    # Text of the files to write that have no entries of their own
+    texts: Dict[Path, str]
+    # (variable, language) pairs the snapshot saves
+    dirty: Set[Tuple[str, str]]
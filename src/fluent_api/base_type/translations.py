@@ -1,23 +1,157 @@
-from collections import defaultdict
+import sys
 from pathlib import Path
-from typing import Optional, DefaultDict
+from typing import Optional, Dict, Any
 
-from pydantic import BaseModel, ConfigDict, Field
+from src.fluent_api.base_type.files import FILE_TABLE
 
 
-class Translation(BaseModel):
-    value: Optional[str] = Field(default_factory=str)
-    attributes: DefaultDict[str, str] = Field(default_factory=lambda: defaultdict(str))
-    comment: Optional[str] = None
-    check: bool = False
-    filepath: Optional[Path] = None
+class Translation:
+    """
+    Translation of a message or term in one language.
 
-    model_config = ConfigDict(validate_assignment=True, arbitrary_types_allowed=True)
+    A plain __slots__ record: millions of them are kept in memory, so values are
+    not validated on assignment. Data coming from the editor is checked with
+    validate_field() before it is stored. The file is kept as an ID in FILE_TABLE
+    and attribute names are interned, so they are shared between all records.
+
+    source keeps the text the entry was parsed from; it is written back as is on
+    save until the translation is edited (update() resets it to None). leading is
+    the text between the previous entry and this one (blank lines, standalone
+    comments, junk) and trailing the text after the last entry of the file; they
+    are kept when the entry is edited.
+    """
+
+    __slots__ = (
+        "value",
+        "attributes",
+        "comment",
+        "check",
+        "file_id",
+        "source",
+        "leading",
+        "trailing",
+    )
+
+    FIELDS = ("value", "attributes", "comment", "check", "filepath")
+
+    FIELD_TYPES = {
+        "value": (str, type(None)),
+        "comment": (str, type(None)),
+        "check": (bool,),
+    }
+
+    def __init__(
+        self,
+        value: Optional[str] = "",
+        attributes: Optional[Dict[str, str]] = None,
+        comment: Optional[str] = None,
+        check: bool = False,
+        filepath: Optional[Path] = None,
+        source: Optional[str] = None,
+    ) -> None:
+        self.value = value
+        self.attributes: Dict[str, str] = attributes if attributes is not None else {}
+        self.comment = comment
+        self.check = check
+        self.file_id = FILE_TABLE.get_id(filepath)
+        self.source = source
+        self.leading: Optional[str] = None
+        self.trailing: Optional[str] = None
 
     # TODO: add check Junk
 
+    def has_text(self) -> bool:
+        """Whether the value or one of the attributes is not empty."""
+        return bool(self.value) or any(self.attributes.values())
+
+    @property
+    def filepath(self) -> Optional[Path]:
+        return FILE_TABLE.get_path(self.file_id)
+
+    @filepath.setter
+    def filepath(self, filepath: Optional[Path]) -> None:
+        self.file_id = FILE_TABLE.get_id(filepath)
+
+    def copy(self) -> "Translation":
+        """Returns a copy that does not share the attributes dict."""
+        translation = Translation(
+            self.value,
+            dict(self.attributes),
+            self.comment,
+            self.check,
+            source=self.source,
+        )
+        translation.file_id = self.file_id
+        translation.leading = self.leading
+        translation.trailing = self.trailing
+        return translation
+
+    def __reduce__(self):
+        # File IDs are only valid in this process, pickles keep the path itself
+        return _restore_translation, (
+            self.value,
+            self.attributes,
+            self.comment,
+            self.check,
+            self.filepath,
+            self.source,
+            self.leading,
+            self.trailing,
+        )
+
+    @classmethod
+    def validate_field(cls, field: str, value: Any) -> Any:
+        """
+        Checks a value before it is assigned to a field.
+
+        :param field: Field name ('value', 'comment' or 'check').
+        :param value: New value of the field.
+        :return: The value, converted to bool for the 'check' field.
+        :raises ValueError: If the field does not exist.
+        :raises TypeError: If the value has a wrong type.
+        """
+        types = cls.FIELD_TYPES.get(field)
+        if types is None:
+            raise ValueError(f"Translation has no field '{field}'")
+        if field == "check" and isinstance(value, int) and value in (0, 1):
+            return bool(value)
+        if not isinstance(value, types):
+            raise TypeError(f"Invalid type for field '{field}': {type(value).__name__}")
+        return value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Translation):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.FIELDS)
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.FIELDS)
+        return f"Translation({fields})"
+
+
+def _restore_translation(
+    value: Optional[str],
+    attributes: Dict[str, str],
+    comment: Optional[str],
+    check: bool,
+    filepath: Optional[Path],
+    source: Optional[str] = None,
+    leading: Optional[str] = None,
+    trailing: Optional[str] = None,
+) -> Translation:
+    """Unpickles a Translation, interning attribute names and whitespace like the parser does."""
+    attributes = {sys.intern(name): text for name, text in attributes.items()}
+    translation = Translation(value, attributes, comment, check, filepath, source)
+    translation.leading = intern_gap(leading)
+    translation.trailing = intern_gap(trailing)
+    return translation
+
+
+def intern_gap(text: Optional[str]) -> Optional[str]:
+    """Interns whitespace between entries: most of it is the same few strings."""
+    return sys.intern(text) if text is not None and not text.strip() else text
 
-Translation.model_rebuild()
 
-LanguagesType = DefaultDict[str, Translation]
-TranslationsType = DefaultDict[str, LanguagesType]
+# Only existing translations are stored: a language missing for a variable has no key
+LanguagesType = Dict[str, Translation]
+TranslationsType = Dict[str, LanguagesType]
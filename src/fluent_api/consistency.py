@@ -0,0 +1,390 @@
+"""
+Consistency of translations with the source language.
+
+Every pattern (a value or an attribute) is reduced to a Signature: the variables,
+term references, functions and select-expression keys it uses. A translation whose
+signature differs from the source one has lost a placeable, refers to something the
+source does not pass, or has different variants.
+
+Plural categories and numeric variant keys depend on the language, so they are not
+compared; other variant keys are.
+"""
+
+import os
+import re
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice, repeat
+from typing import (
+    Dict,
+    FrozenSet,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+)
+
+from fluent.syntax.ast import (
+    FunctionReference,
+    Placeable,
+    SelectExpression,
+    TermReference,
+    VariableReference,
+)
+from fluent.syntax.visitor import Visitor
+from loguru import logger
+
+from src.fluent_api.FluentAPI import FluentAPI
+
+# Keys selected by the plural rules of a language
+PLURAL_CATEGORIES = frozenset(("zero", "one", "two", "few", "many", "other"))
+
+
+class Signature(NamedTuple):
+    variables: FrozenSet[str]
+    terms: FrozenSet[str]
+    functions: FrozenSet[str]
+    keys: FrozenSet[str]
+
+
+EMPTY_SIGNATURE = Signature(frozenset(), frozenset(), frozenset(), frozenset())
+
+
+class Inconsistency(NamedTuple):
+    """A difference between a translation and the source language."""
+
+    variable: str
+    # Attribute name with its leading dot, None for the value
+    attribute: Optional[str]
+    language: str
+    # missing-/extra- + variable, term, function, key or attribute; or invalid-syntax
+    kind: str
+    name: str
+
+    @property
+    def message(self) -> str:
+        if self.kind == "invalid-syntax":
+            return "the text is not valid Fluent syntax"
+        presence, what = self.kind.split("-", 1)
+        prefix = {"variable": "$", "term": "-"}.get(what, "")
+        if presence == "missing":
+            return f"{what} '{prefix}{self.name}' of the source is missing"
+        return f"{what} '{prefix}{self.name}' is not in the source"
+
+
+# Stored patterns are serialised by FluentSerializer, so they are read with a few
+# regular expressions instead of the parser: innermost placeables are collected and
+# removed until none is left. Text is only looked at for select-expression keys.
+RE_INNERMOST_PLACEABLE = re.compile(r'\{((?:[^{}"]|"(?:[^"\\]|\\.)*")*)\}')
+RE_STRING = re.compile(r'"(?:[^"\\]|\\.)*"')
+RE_VARIANT_KEY = re.compile(r"\n[ \t]*\*?\[[ \t]*([^\]\s]+)[ \t]*\]")
+RE_VARIABLE = re.compile(r"\$([a-zA-Z][\w-]*)")
+RE_TERM = re.compile(r"(?<![\w$-])-([a-zA-Z][\w-]*)")
+RE_FUNCTION = re.compile(r"(?<![\w$.-])([a-zA-Z][\w-]*)\s*\(")
+
+
+class _SignatureVisitor(Visitor):
+    def __init__(self) -> None:
+        super().__init__()
+        self.found: Tuple[Set[str], Set[str], Set[str], Set[str]] = (
+            set(),
+            set(),
+            set(),
+            set(),
+        )
+
+    def visit_VariableReference(self, node: VariableReference) -> None:
+        self.found[0].add(node.id.name)
+
+    def visit_TermReference(self, node: TermReference) -> None:
+        self.found[1].add(node.id.name)
+        self.generic_visit(node)
+
+    def visit_FunctionReference(self, node: FunctionReference) -> None:
+        self.found[2].add(node.id.name)
+        self.generic_visit(node)
+
+    def visit_SelectExpression(self, node: SelectExpression) -> None:
+        for variant in node.variants:
+            key = variant.key
+            self.found[3].add(getattr(key, "name", None) or key.value)
+        self.generic_visit(node)
+
+
+def _parsed_signature(text: str) -> Optional[Signature]:
+    """Signature from the Fluent parser, for text the scanner does not understand."""
+    elements = FluentAPI.parse_str_to_ast(text)
+    # Junk comes back as text, while valid text with a brace has a placeable
+    if not any(isinstance(element, Placeable) for element in elements):
+        return None
+    visitor = _SignatureVisitor()
+    for element in elements:
+        visitor.visit(element)
+    return Signature(*(frozenset(found) for found in visitor.found))
+
+
+def extract_signature(text: Optional[str]) -> Optional[Signature]:
+    """
+    Returns the variables, terms, functions and variant keys used by a pattern.
+
+    :param text: A value or attribute as stored in Translation.
+    :return: The signature, None if the text is not valid Fluent.
+    """
+    if not text or "{" not in text:
+        return EMPTY_SIGNATURE
+
+    expressions: List[str] = []
+    keys: List[str] = []
+
+    def collect(match: re.Match) -> str:
+        # String literals may contain anything, including '->'
+        expression = RE_STRING.sub('""', match.group(1))
+        if "->" in expression:
+            expression, _, variants = expression.partition("->")
+            keys.extend(RE_VARIANT_KEY.findall(variants))
+        expressions.append(expression)
+        return ""
+
+    remaining = text
+    while "{" in remaining:
+        reduced = RE_INNERMOST_PLACEABLE.sub(collect, remaining)
+        if reduced == remaining:
+            # Unbalanced braces or quotes: invalid, or a shape left to the parser
+            return _parsed_signature(text)
+        remaining = reduced
+
+    expression = " ".join(expressions)
+    return Signature(
+        frozenset(RE_VARIABLE.findall(expression)),
+        frozenset(RE_TERM.findall(expression)),
+        frozenset(RE_FUNCTION.findall(expression)),
+        frozenset(keys),
+    )
+
+
+def _compared_keys(keys: FrozenSet[str]) -> FrozenSet[str]:
+    return frozenset(
+        key
+        for key in keys
+        if key not in PLURAL_CATEGORIES
+        and not key.lstrip("-").replace(".", "").isdigit()
+    )
+
+
+def compare_signatures(
+    source: Signature, translation: Signature
+) -> Iterator[Tuple[str, str]]:
+    """Yields (kind, name) for every difference between two signatures."""
+    for what, source_names, names in (
+        ("variable", source.variables, translation.variables),
+        ("term", source.terms, translation.terms),
+        ("function", source.functions, translation.functions),
+        ("key", _compared_keys(source.keys), _compared_keys(translation.keys)),
+    ):
+        if source_names == names:
+            continue
+        for name in sorted(source_names - names):
+            yield f"missing-{what}", name
+        for name in sorted(names - source_names):
+            yield f"extra-{what}", name
+
+
+# Texts of a variable: language -> (value, attributes)
+VariableTexts = Dict[str, Tuple[Optional[str], Dict[str, str]]]
+
+
+def check_variable(
+    variable: str, source_language: str, texts: VariableTexts
+) -> List[Inconsistency]:
+    """
+    Compares the value and attributes of every language with the source language.
+
+    :param variable: Message or term ID.
+    :param source_language: Language the others are compared with.
+    :param texts: Value and attributes by language.
+    :return: The differences, empty if the source language has no translation.
+    """
+    if source_language not in texts:
+        return []
+
+    source_value, source_attributes = texts[source_language]
+    source_patterns = (
+        {None: source_value, **source_attributes}
+        if source_attributes
+        else {None: source_value}
+    )
+    source_signatures = {
+        attribute: extract_signature(text)
+        for attribute, text in source_patterns.items()
+    }
+
+    problems = []
+    for language, (value, attributes) in texts.items():
+        if language == source_language:
+            continue
+        patterns = {None: value, **attributes} if attributes else {None: value}
+        for attribute, text in patterns.items():
+            if attribute not in source_patterns:
+                problems.append(
+                    Inconsistency(
+                        variable, None, language, "extra-attribute", attribute
+                    )
+                )
+                continue
+            source_signature = source_signatures[attribute]
+            if source_signature is None:
+                continue  # Nothing to compare with
+            if source_signature is EMPTY_SIGNATURE and (not text or "{" not in text):
+                continue  # Plain text on both sides, the common case
+            signature = extract_signature(text)
+            if signature == source_signature:
+                continue
+            if signature is None:
+                problems.append(
+                    Inconsistency(variable, attribute, language, "invalid-syntax", "")
+                )
+                continue
+            for kind, name in compare_signatures(source_signature, signature):
+                problems.append(
+                    Inconsistency(variable, attribute, language, kind, name)
+                )
+        for attribute in source_attributes:
+            if attribute not in attributes:
+                problems.append(
+                    Inconsistency(
+                        variable, None, language, "missing-attribute", attribute
+                    )
+                )
+    return problems
+
+
+def _variable_texts(
+    fluent_api: FluentAPI, variable: str, copy: bool = True
+) -> VariableTexts:
+    """
+    :param copy: Copy the attributes, for texts kept or read in another thread.
+    """
+    translations = fluent_api.translations.get(variable, {})
+    return {
+        language: (
+            translation.value,
+            dict(translation.attributes) if copy else translation.attributes,
+        )
+        for language, translation in list(translations.items())
+    }
+
+
+def _check_chunk(
+    chunk: List[Tuple[str, VariableTexts]], source_language: str
+) -> List[Inconsistency]:
+    problems = []
+    for variable, texts in chunk:
+        problems.extend(check_variable(variable, source_language, texts))
+    return problems
+
+
+def check_project(
+    fluent_api: FluentAPI, source_language: str, workers: int = 1
+) -> List[Inconsistency]:
+    """
+    Checks every variable of a loaded project against the source language.
+
+    :param fluent_api: Loaded project.
+    :param source_language: Language the others are compared with.
+    :param workers: Processes to check in: 1 - in this process, 0 - one per CPU core.
+    :return: All differences, in the order of the variables.
+    """
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1:
+        problems = []
+        for variable in list(fluent_api.translations):
+            texts = _variable_texts(fluent_api, variable, copy=False)
+            problems.extend(check_variable(variable, source_language, texts))
+        return problems
+
+    # Chunks are pickled for the workers, so the attributes need no copy either
+    items = (
+        (variable, _variable_texts(fluent_api, variable, copy=False))
+        for variable in list(fluent_api.translations)
+    )
+
+    chunk_size = max(1000, len(fluent_api.translations) // (workers * 8) + 1)
+    chunks = iter(lambda: list(islice(items, chunk_size)), [])
+    logger.debug(f"Checking consistency with {workers} workers.")
+    problems = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunk_problems in executor.map(
+            _check_chunk, chunks, repeat(source_language)
+        ):
+            problems.extend(chunk_problems)
+    return problems
+
+
+class ConsistencyChecker:
+    """
+    Differences with the source language, kept up to date as translations change.
+
+    Built once with check_project(), then only the variables reported by
+    FluentAPI.change_listeners are checked again.
+    """
+
+    def __init__(self, fluent_api: FluentAPI, source_language: str) -> None:
+        self.fluent_api = fluent_api
+        self.source_language = source_language
+        self._problems: Dict[str, List[Inconsistency]] = {}
+        self._lock = threading.Lock()
+
+        self._rebuild()
+        fluent_api.change_listeners.append(self.update)
+
+    def close(self) -> None:
+        """Stops following the changes of the FluentAPI."""
+        if self.update in self.fluent_api.change_listeners:
+            self.fluent_api.change_listeners.remove(self.update)
+
+    def _rebuild(self) -> None:
+        problems: Dict[str, List[Inconsistency]] = {}
+        for problem in check_project(self.fluent_api, self.source_language):
+            problems.setdefault(problem.variable, []).append(problem)
+        with self._lock:
+            self._problems = problems
+
+    def set_source_language(self, language: str) -> None:
+        """Compares the translations with another language."""
+        if language != self.source_language:
+            self.source_language = language
+            self._rebuild()
+
+    def update(self, variables: Iterable[str]) -> None:
+        """Checks variables whose translations changed again."""
+        for variable in variables:
+            problems = check_variable(
+                variable,
+                self.source_language,
+                _variable_texts(self.fluent_api, variable),
+            )
+            with self._lock:
+                if problems:
+                    self._problems[variable] = problems
+                else:
+                    self._problems.pop(variable, None)
+
+    def problems(self, variable: str) -> List[Inconsistency]:
+        with self._lock:
+            return list(self._problems.get(variable, ()))
+
+    def variables(self, language: str) -> Set[str]:
+        """Returns the variables with differences in a language."""
+        with self._lock:
+            return {
+                variable
+                for variable, problems in self._problems.items()
+                if any(problem.language == language for problem in problems)
+            }
+
+    def __len__(self) -> int:
+        with self._lock:
+            return sum(len(problems) for problems in self._problems.values())
@@ -0,0 +1,381 @@
+"""
+Streaming export and import of translations for exchange with translation vendors.
+
+A row is a message or term, or one of its attributes, with the text of every language.
+Comments and check flags belong to a whole translation, so they are on the message
+rows only. Rows are produced and consumed one at a time by generators: exchange
+files of any size are read and written without being loaded into memory.
+
+Formats:
+    CSV    key, <language>..., <language>:comment..., <language>:check...
+    JSONL  {"key": ..., "values": {...}, "comments": {...}, "checks": {...}} per line
+    XLIFF  1.2, one file per target language, with the source language as <source>
+
+Keys are 'message-id' or 'message-id.attribute'. Empty cells and missing columns
+leave the translation unchanged on import.
+"""
+
+import csv
+import json
+from pathlib import Path
+from typing import (
+    Dict,
+    IO,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Union,
+)
+from xml.etree.ElementTree import iterparse
+from xml.sax.saxutils import escape, quoteattr
+
+from loguru import logger
+
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.base_type.files import ImportReport
+from src.fluent_api.utils.bool_and_string import bool_to_string, string_bool
+
+XLIFF_NAMESPACE = "urn:oasis:names:tc:xliff:document:1.2"
+
+COMMENT_SUFFIX = ":comment"
+CHECK_SUFFIX = ":check"
+
+
+class ExchangeRow(NamedTuple):
+    variable: str
+    # Attribute name with its leading dot, None for the message row
+    attribute: Optional[str]
+    values: Dict[str, str]
+    comments: Dict[str, Optional[str]]
+    checks: Dict[str, bool]
+
+    @property
+    def key(self) -> str:
+        return self.variable + (self.attribute or "")
+
+    @staticmethod
+    def split_key(key: str) -> tuple[str, Optional[str]]:
+        variable, dot, attribute = key.strip().partition(".")
+        return variable, f".{attribute}" if dot and attribute else None
+
+
+def iter_rows(
+    fluent_api: FluentAPI, languages: Optional[Sequence[str]] = None
+) -> Iterator[ExchangeRow]:
+    """
+    Yields the rows of all variables, in their order in the project.
+
+    :param fluent_api: Project to export.
+    :param languages: Languages to include, all by default.
+    """
+    languages = list(languages or fluent_api.get_languages())
+    for variable in list(fluent_api.translations):
+        fluent_api.ensure_loaded(variable)
+        translations = fluent_api.translations.get(variable, {})
+        present = {
+            language: translations[language]
+            for language in languages
+            if language in translations
+        }
+
+        yield ExchangeRow(
+            variable,
+            None,
+            {language: t.value or "" for language, t in present.items()},
+            {language: t.comment for language, t in present.items()},
+            {language: t.check for language, t in present.items()},
+        )
+
+        attributes: Dict[str, None] = {}
+        for translation in present.values():
+            attributes.update(dict.fromkeys(translation.attributes))
+        for attribute in attributes:
+            yield ExchangeRow(
+                variable,
+                attribute,
+                {
+                    language: t.attributes[attribute]
+                    for language, t in present.items()
+                    if attribute in t.attributes
+                },
+                {},
+                {},
+            )
+
+
+# CSV
+
+
+def write_csv(
+    rows: Iterable[ExchangeRow], file: IO[str], languages: Sequence[str]
+) -> int:
+    """
+    Writes rows as CSV, one column per language followed by the comments and checks.
+
+    :param file: Text file opened with newline="".
+    :return: Number of rows written.
+    """
+    writer = csv.writer(file)
+    writer.writerow(
+        ["key"]
+        + list(languages)
+        + [language + COMMENT_SUFFIX for language in languages]
+        + [language + CHECK_SUFFIX for language in languages]
+    )
+    count = 0
+    for row in rows:
+        checks = [
+            bool_to_string(row.checks[language]) if language in row.checks else ""
+            for language in languages
+        ]
+        writer.writerow(
+            [row.key]
+            + [row.values.get(language, "") for language in languages]
+            + [row.comments.get(language) or "" for language in languages]
+            + checks
+        )
+        count += 1
+    return count
+
+
+def read_csv(file: IO[str]) -> Iterator[ExchangeRow]:
+    """
+    Reads rows written by write_csv(); columns may be reordered or left out.
+
+    :param file: Text file opened with newline="".
+    :raises ValueError: If the header has no 'key' column.
+    """
+    reader = csv.reader(file)
+    header = next(reader, None)
+    if not header or "key" not in header:
+        raise ValueError("The CSV file has no 'key' column.")
+
+    key_column = header.index("key")
+    values, comments, checks = [], [], []
+    for column, name in enumerate(header):
+        if column == key_column or not name:
+            continue
+        if name.endswith(COMMENT_SUFFIX):
+            comments.append((column, name.removesuffix(COMMENT_SUFFIX)))
+        elif name.endswith(CHECK_SUFFIX):
+            checks.append((column, name.removesuffix(CHECK_SUFFIX)))
+        else:
+            values.append((column, name))
+
+    for cells in reader:
+        if len(cells) <= key_column or not cells[key_column].strip():
+            continue
+        cells += [""] * (len(header) - len(cells))
+        variable, attribute = ExchangeRow.split_key(cells[key_column])
+        yield ExchangeRow(
+            variable,
+            attribute,
+            {language: cells[column] for column, language in values},
+            {language: cells[column] for column, language in comments},
+            {
+                language: string_bool(cells[column])
+                for column, language in checks
+                if cells[column].strip()
+            },
+        )
+
+
+# JSON Lines
+
+
+def write_jsonl(rows: Iterable[ExchangeRow], file: IO[str]) -> int:
+    """
+    Writes one JSON object per row.
+
+    :return: Number of rows written.
+    """
+    count = 0
+    for row in rows:
+        record = {"key": row.key, "values": row.values}
+        if row.attribute is None:
+            record["comments"] = row.comments
+            record["checks"] = row.checks
+        file.write(json.dumps(record, ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def read_jsonl(file: IO[str]) -> Iterator[ExchangeRow]:
+    """
+    Reads rows written by write_jsonl().
+
+    :raises ValueError: If a line is not a JSON object with a key.
+    """
+    for line_number, line in enumerate(file, 1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+            variable, attribute = ExchangeRow.split_key(record["key"])
+        except (ValueError, KeyError, TypeError, AttributeError) as e:
+            raise ValueError(f"Invalid row on line {line_number}: {e}") from e
+        yield ExchangeRow(
+            variable,
+            attribute,
+            record.get("values") or {},
+            record.get("comments") or {},
+            record.get("checks") or {},
+        )
+
+
+# XLIFF 1.2
+
+
+def write_xliff(
+    rows: Iterable[ExchangeRow],
+    file: IO[str],
+    source_language: str,
+    target_language: str,
+    original: str = "fluentus",
+) -> int:
+    """
+    Writes rows as an XLIFF 1.2 document translating source_language into target_language.
+
+    The target comment is written as a note and its check flag as the approved attribute
+    (yes or no, so importing the file back unchecks translations too).
+
+    :return: Number of translation units written.
+    """
+    file.write('<?xml version="1.0" encoding="UTF-8"?>\n')
+    file.write(f'<xliff version="1.2" xmlns="{XLIFF_NAMESPACE}">\n')
+    file.write(
+        f'  <file original={quoteattr(original)} datatype="plaintext" '
+        f"source-language={quoteattr(source_language)} "
+        f"target-language={quoteattr(target_language)}>\n"
+    )
+    file.write("    <body>\n")
+    count = 0
+    for row in rows:
+        approved = "yes" if row.checks.get(target_language) else "no"
+        file.write(
+            f'      <trans-unit id={quoteattr(row.key)} xml:space="preserve" approved="{approved}">\n'
+        )
+        file.write(
+            f"        <source>{escape(row.values.get(source_language, ''))}</source>\n"
+        )
+        if target_language in row.values:
+            file.write(
+                f"        <target>{escape(row.values[target_language])}</target>\n"
+            )
+        comment = row.comments.get(target_language)
+        if comment:
+            file.write(f"        <note>{escape(comment)}</note>\n")
+        file.write("      </trans-unit>\n")
+        count += 1
+    file.write("    </body>\n")
+    file.write("  </file>\n")
+    file.write("</xliff>\n")
+    return count
+
+
+def read_xliff(source: Union[str, Path, IO[bytes]]) -> Iterator[ExchangeRow]:
+    """
+    Reads the targets of an XLIFF 1.2 document with iterparse, one unit at a time.
+
+    :raises ValueError: If a file element has no target-language.
+    """
+    file_tag = f"{{{XLIFF_NAMESPACE}}}file"
+    body_tag = f"{{{XLIFF_NAMESPACE}}}body"
+    unit_tag = f"{{{XLIFF_NAMESPACE}}}trans-unit"
+    target_tag = f"{{{XLIFF_NAMESPACE}}}target"
+    note_tag = f"{{{XLIFF_NAMESPACE}}}note"
+
+    language = None
+    body = None
+    for event, element in iterparse(source, events=("start", "end")):
+        if event == "start":
+            if element.tag == file_tag:
+                language = element.get("target-language")
+                if not language:
+                    raise ValueError("An XLIFF file element has no target-language.")
+            elif element.tag == body_tag:
+                body = element
+            continue
+        if element.tag != unit_tag:
+            continue
+
+        variable, attribute = ExchangeRow.split_key(element.get("id", ""))
+        target = element.find(target_tag)
+        note = element.find(note_tag)
+        comments, checks = {}, {}
+        if attribute is None:
+            if note is not None:
+                comments[language] = note.text or ""
+            # Units without the attribute (e.g. from other tools) keep the check as is
+            approved = element.get("approved")
+            if approved is not None:
+                checks[language] = approved == "yes"
+        yield ExchangeRow(
+            variable,
+            attribute,
+            {language: target.text or ""} if target is not None else {},
+            comments,
+            checks,
+        )
+
+        # Units already read are dropped, so memory does not grow with the file
+        if body is not None:
+            body.clear()
+
+
+# Import
+
+
+def import_rows(fluent_api: FluentAPI, rows: Iterable[ExchangeRow]) -> ImportReport:
+    """
+    Applies rows to the project through FluentAPI.update(), so values are normalised
+    and changed translations are saved like edits made in the editor.
+
+    Empty cells leave translations unchanged. Translations missing in a language of
+    the project are added, next to the other languages' files. Variables and
+    languages that are not in the project are skipped.
+
+    :return: Counts of the rows read, the fields changed and the cells skipped.
+    """
+    languages = set(fluent_api.get_languages())
+    row_count = changed = skipped = 0
+    for row in rows:
+        row_count += 1
+        fluent_api.ensure_loaded(row.variable)
+        translations = fluent_api.translations.get(row.variable)
+
+        for language in dict.fromkeys([*row.values, *row.comments, *row.checks]):
+            if translations is None or language not in languages:
+                skipped += 1
+                logger.debug(
+                    "Skipped '{}' ({}): not in the project.", row.key, language
+                )
+                continue
+
+            # Missing translations are read as empty and created by the first change
+            translation = fluent_api.get_translation(row.variable, language)
+            value = row.values.get(language)
+            current = (
+                translation.attributes.get(row.attribute)
+                if row.attribute
+                else translation.value
+            )
+            # Exported values are stored text, equal ones are not parsed again
+            if value and value != current:
+                changed += fluent_api.update(
+                    row.variable, language, "value", value, attribute=row.attribute
+                )
+            if row.attribute is not None:
+                continue
+            comment = row.comments.get(language)
+            if comment and comment != translation.comment:
+                changed += fluent_api.update(row.variable, language, "comment", comment)
+            if language in row.checks and row.checks[language] != translation.check:
+                changed += fluent_api.update(
+                    row.variable, language, "check", row.checks[language]
+                )
+
+    return ImportReport(rows=row_count, changed=changed, skipped=skipped)
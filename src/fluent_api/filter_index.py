@@ -0,0 +1,107 @@
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Optional, Set
+
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.base_type.translations import Translation
+
+
+class FilterIndex:
+    """
+    Variables in each state, per language, for filtering the table.
+
+    Sets by filter and language:
+        missing    no translation, or one without any text (FluentAPI.presence)
+        unchecked  not marked with the '@check' comment (missing ones included)
+        commented  with a comment
+        changed    edited since the folder was loaded, saved or not
+
+    The sets are built once and then follow FluentAPI.change_listeners, so switching
+    filters costs a lookup instead of a scan of all translations.
+    """
+
+    FILTERS = ("missing", "unchecked", "commented", "changed")
+
+    def __init__(self, fluent_api: FluentAPI) -> None:
+        self.fluent_api = fluent_api
+        self._languages: List[str] = []
+        # Missing translations are read from the presence matrix of the FluentAPI
+        self._sets: Dict[str, DefaultDict[str, Set[str]]] = {
+            name: defaultdict(set) for name in self.FILTERS if name != "missing"
+        }
+        self._lock = threading.Lock()
+
+        self._rebuild()
+        fluent_api.change_listeners.append(self.update)
+
+    def close(self) -> None:
+        """Stops following the changes of the FluentAPI."""
+        if self.update in self.fluent_api.change_listeners:
+            self.fluent_api.change_listeners.remove(self.update)
+
+    def _rebuild(self) -> None:
+        with self._lock:
+            self._languages = self.fluent_api.get_languages()
+            changed = self._sets["changed"]
+            for sets in self._sets.values():
+                if sets is not changed:
+                    sets.clear()
+            for variable in list(self.fluent_api.translations):
+                self._index(variable)
+
+    def _index(self, variable: str) -> None:
+        languages = self.fluent_api.translations.get(variable)
+        if languages is None:
+            for sets in self._sets.values():
+                for variables in sets.values():
+                    variables.discard(variable)
+            return
+
+        dirty = self.fluent_api.dirty
+        for language in self._languages:
+            translation: Optional[Translation] = languages.get(language)
+            self._set(
+                "unchecked",
+                language,
+                variable,
+                translation is None or not translation.check,
+            )
+            self._set(
+                "commented",
+                language,
+                variable,
+                translation is not None and bool(translation.comment),
+            )
+            if (variable, language) in dirty:
+                self._sets["changed"][language].add(variable)
+
+    def _set(self, name: str, language: str, variable: str, value: bool) -> None:
+        if value:
+            self._sets[name][language].add(variable)
+        else:
+            self._sets[name][language].discard(variable)
+
+    def update(self, variables: Iterable[str]) -> None:
+        """Updates the sets for variables whose translations changed or were removed."""
+        if self.fluent_api.get_languages() != self._languages:
+            # Every variable is missing in a new language
+            self._rebuild()
+            return
+        with self._lock:
+            for variable in variables:
+                self._index(variable)
+
+    def variables(self, name: str, language: str) -> Set[str]:
+        """
+        Returns the variables matching a filter in a language.
+
+        :param name: One of FILTERS.
+        :param language: Language code.
+        :return: A copy of the set, safe to keep while the index changes.
+        """
+        if name == "missing":
+            return set(self.fluent_api.presence.missing(language))
+        if name not in self._sets:
+            raise ValueError(f"Unknown filter '{name}'.")
+        with self._lock:
+            return set(self._sets[name].get(language, ()))
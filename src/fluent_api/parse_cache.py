@@ -0,0 +1,177 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+from importlib.metadata import version, PackageNotFoundError
+from pathlib import Path
+from typing import Optional, List, Tuple, Dict, Iterable
+
+from loguru import logger
+
+from src.fluent_api.base_type.translations import Translation
+
+CacheEntries = List[Tuple[str, Translation]]
+
+
+def _parser_version() -> str:
+    try:
+        return version("fluent.syntax")
+    except PackageNotFoundError:  # e.g. frozen builds without package metadata
+        return "unknown"
+
+
+class ParseCache:
+    """
+    On-disk cache of parsed translation files stored in a SQLite database.
+
+    Every file is keyed by its absolute path and validated by mtime, size and content
+    hash, so unchanged files are loaded without being parsed again. The whole cache is
+    dropped when the parser version or the cache format changes.
+    """
+
+    # Bump when the cached entries change: their layout or how files are converted
+    SCHEMA_VERSION = 6
+
+    def __init__(self, db_path: Path | str, salt: str = "") -> None:
+        """
+        :param db_path: Path of the SQLite database file.
+        :param salt: Extra settings the parsed result depends on (e.g. the check field name).
+        """
+        self.db_path = Path(db_path)
+        self.version = f"{self.SCHEMA_VERSION}:{_parser_version()}:{salt}"
+        self.hits = 0
+        self.misses = 0
+
+        # Signatures of missed files, stored together with their entries in put()
+        self._pending: Dict[str, Tuple[int, int, str]] = {}
+
+        # The lazy loader stores files from its prefetch thread, calls are serialized by FluentAPI
+        self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._initialize()
+
+    def _initialize(self) -> None:
+        with self.connection:
+            self.connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self.connection.execute("""
+                CREATE TABLE IF NOT EXISTS files (
+                    path TEXT PRIMARY KEY,
+                    mtime_ns INTEGER NOT NULL,
+                    size INTEGER NOT NULL,
+                    hash TEXT NOT NULL,
+                    data BLOB NOT NULL
+                )
+                """)
+            row = self.connection.execute(
+                "SELECT value FROM meta WHERE key = 'version'"
+            ).fetchone()
+            if not row or row[0] != self.version:
+                logger.info(
+                    f"Parse cache version changed ({row[0] if row else None} -> {self.version}), clearing."
+                )
+                self.connection.execute("DELETE FROM files")
+                self.connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('version', ?)",
+                    (self.version,),
+                )
+
+    @staticmethod
+    def _hash(content: bytes) -> str:
+        return hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    def get(self, filepath: Path) -> Optional[CacheEntries]:
+        """
+        Returns the cached entries of a file, or None if the file changed since it was cached.
+
+        :param filepath: Path of the translation file.
+        """
+        key = str(filepath.resolve())
+        stat = filepath.stat()
+        row = self.connection.execute(
+            "SELECT mtime_ns, size, hash, data FROM files WHERE path = ?", (key,)
+        ).fetchone()
+
+        if row:
+            mtime_ns, size, content_hash, data = row
+            if mtime_ns != stat.st_mtime_ns or size != stat.st_size:
+                # Touched but possibly unchanged (checkout, copy): compare the content
+                new_hash = self._hash(filepath.read_bytes())
+                if new_hash != content_hash:
+                    return self._miss(key, stat.st_mtime_ns, stat.st_size, new_hash)
+                self.connection.execute(
+                    "UPDATE files SET mtime_ns = ?, size = ? WHERE path = ?",
+                    (stat.st_mtime_ns, stat.st_size, key),
+                )
+            try:
+                entries = pickle.loads(data)
+            except Exception as e:
+                logger.warning(f"Broken parse cache entry for '{filepath}': {e}")
+                return self._miss(key, mtime_ns, size, content_hash)
+            self.hits += 1
+            return entries
+
+        return self._miss(
+            key, stat.st_mtime_ns, stat.st_size, self._hash(filepath.read_bytes())
+        )
+
+    def _miss(self, key: str, mtime_ns: int, size: int, content_hash: str) -> None:
+        self.misses += 1
+        self._pending[key] = (mtime_ns, size, content_hash)
+        return None
+
+    def put(self, filepath: Path, entries: CacheEntries) -> None:
+        """
+        Stores the parsed entries of a file previously reported as a miss by get().
+
+        :param filepath: Path of the translation file.
+        :param entries: (variable name, Translation) pairs parsed from the file.
+        """
+        key = str(filepath.resolve())
+        signature = self._pending.pop(key, None)
+        if signature is None:
+            return
+
+        mtime_ns, size, content_hash = signature
+        self.connection.execute(
+            "INSERT OR REPLACE INTO files (path, mtime_ns, size, hash, data) VALUES (?, ?, ?, ?, ?)",
+            (
+                key,
+                mtime_ns,
+                size,
+                content_hash,
+                pickle.dumps(entries, protocol=pickle.HIGHEST_PROTOCOL),
+            ),
+        )
+
+    def prune(self, root: Path, seen: Iterable[Path]) -> None:
+        """
+        Removes entries of files under root that no longer exist.
+
+        :param root: Locales directory that was loaded.
+        :param seen: Files found in it.
+        """
+        # With the separator, so a sibling folder sharing the name prefix is not matched
+        prefix = os.path.join(str(root.resolve()), "")
+        seen_keys = {str(path.resolve()) for path in seen}
+        stale = [
+            (path,)
+            for (path,) in self.connection.execute(
+                "SELECT path FROM files WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix),
+            )
+            if path not in seen_keys
+        ]
+        self.connection.executemany("DELETE FROM files WHERE path = ?", stale)
+
+    def clear(self) -> None:
+        """Removes every cached file."""
+        with self.connection:
+            self.connection.execute("DELETE FROM files")
+
+    def commit(self) -> None:
+        self.connection.commit()
+
+    def close(self) -> None:
+        self.connection.commit()
+        self.connection.close()
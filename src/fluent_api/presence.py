@@ -0,0 +1,153 @@
+"""
+Which variables have a translation in each language, one bit per variable.
+
+Variables get a row number the first time they are seen and keep it, so each
+language is a bytearray with one bit per row and setting a bit costs the same on any
+project size. Counts per language are kept as bits flip: missing counts and coverage
+are read without a scan. Lists of missing and orphan variables are computed with
+bitwise operations on whole rows (a bytearray read as one integer) and only the
+non-zero bytes of the result are walked in Python.
+"""
+
+import re
+import threading
+from typing import Dict, List, Optional
+
+RE_NONZERO_BYTE = re.compile(rb"[^\x00]")
+
+
+class PresenceMatrix:
+    """
+    Variables × languages bit matrix of the translations that have text.
+
+    A translation is present when its value or one of its attributes is not empty,
+    so a translation emptied in the editor counts as missing again.
+    """
+
+    def __init__(self) -> None:
+        self._rows: Dict[str, int] = {}
+        self._variables: List[str] = []
+        # Rows of the variables that exist, removed ones keep their row number
+        self._exists = bytearray()
+        self._size = 0
+        self._bits: Dict[str, bytearray] = {}
+        self._counts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def _row(self, variable: str) -> int:
+        """Returns the row of a variable, adding it if needed; call with the lock held."""
+        row = self._rows.get(variable)
+        if row is None:
+            row = self._rows[variable] = len(self._variables)
+            self._variables.append(variable)
+            if row >> 3 >= len(self._exists):
+                # Grown by doubling, so adding variables stays amortised O(1)
+                grow = bytes(max(64, len(self._exists)))
+                self._exists.extend(grow)
+                for bits in self._bits.values():
+                    bits.extend(grow)
+        byte, mask = row >> 3, 1 << (row & 7)
+        if not self._exists[byte] & mask:
+            self._exists[byte] |= mask
+            self._size += 1
+        return row
+
+    def set(self, variable: str, language: str, present: bool) -> bool:
+        """
+        Records whether a variable has a translation in a language.
+
+        :param variable: Message or term ID, added to the matrix if it is new.
+        :param language: Language code, added to the matrix if it is new.
+        :param present: The translation exists and has text.
+        :return: Whether the bit flipped, i.e. the language's count changed.
+        """
+        with self._lock:
+            row = self._rows.get(variable)
+            if row is None or not self._exists[row >> 3] & 1 << (row & 7):
+                row = self._row(variable)
+            bits = self._bits.get(language)
+            if bits is None:
+                bits = self._bits[language] = bytearray(len(self._exists))
+                self._counts[language] = 0
+            byte, mask = row >> 3, 1 << (row & 7)
+            if bool(bits[byte] & mask) == present:
+                return False
+            bits[byte] ^= mask
+            self._counts[language] += 1 if present else -1
+            return True
+
+    def remove(self, variable: str) -> None:
+        """Drops a variable that is no longer defined in any language."""
+        with self._lock:
+            row = self._rows.get(variable)
+            if row is None:
+                return
+            byte, mask = row >> 3, 1 << (row & 7)
+            if not self._exists[byte] & mask:
+                return
+            self._exists[byte] ^= mask
+            self._size -= 1
+            for language, bits in self._bits.items():
+                if bits[byte] & mask:
+                    bits[byte] ^= mask
+                    self._counts[language] -= 1
+
+    def present(self, variable: str, language: str) -> bool:
+        with self._lock:
+            row = self._rows.get(variable)
+            bits = self._bits.get(language)
+            if row is None or bits is None:
+                return False
+            return bool(bits[row >> 3] & 1 << (row & 7))
+
+    def __len__(self) -> int:
+        """Number of variables."""
+        return self._size
+
+    def count(self, language: str) -> int:
+        """Number of variables translated in a language."""
+        return self._counts.get(language, 0)
+
+    def missing_count(self, language: str) -> int:
+        return self._size - self._counts.get(language, 0)
+
+    def coverage(self, language: str) -> float:
+        """Share of the variables translated in a language, from 0.0 to 1.0."""
+        if not self._size:
+            return 1.0
+        return self._counts.get(language, 0) / self._size
+
+    def missing(self, language: str) -> List[str]:
+        """Returns the variables without text in a language, in the order they were added."""
+        with self._lock:
+            exists = int.from_bytes(self._exists, "little")
+            return self._variables_in(exists & ~self._as_int(language))
+
+    def orphans(self, source_language: str) -> List[str]:
+        """
+        Returns the variables translated in some language but missing in the source
+        language, e.g. keys left behind after they were removed from the source.
+        """
+        with self._lock:
+            others = 0
+            for language, bits in self._bits.items():
+                if language != source_language:
+                    others |= int.from_bytes(bits, "little")
+            return self._variables_in(others & ~self._as_int(source_language))
+
+    def _as_int(self, language: str) -> int:
+        bits: Optional[bytearray] = self._bits.get(language)
+        return int.from_bytes(bits, "little") if bits is not None else 0
+
+    def _variables_in(self, bits: int) -> List[str]:
+        """Returns the variables of the set bits; call with the lock held."""
+        data = bits.to_bytes(len(self._exists), "little")
+        variables = self._variables
+        found = []
+        for match in RE_NONZERO_BYTE.finditer(data):
+            byte = match.start()
+            value = data[byte]
+            for bit in range(8):
+                if value >> bit & 1:
+                    found.append(variables[(byte << 3) + bit])
+        return found
@@ -0,0 +1,145 @@
+import re
+import threading
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Optional, Set
+
+from src.fluent_api.FluentAPI import FluentAPI
+
+
+class SearchIndex:
+    """
+    Full-text index over the variables of a FluentAPI.
+
+    Every variable is indexed as one document made of its name and, in all languages,
+    its value, attribute names and values and comment. Words map to the variables
+    containing them; a query word matches every indexed word it is a substring of, so
+    'hel' finds 'Hello'. The case-folded documents are kept to check whole queries and
+    to un-index the old words when a translation changes.
+
+    The index follows FluentAPI.change_listeners, so edits, files loaded on demand and
+    reloaded files are reindexed as they happen.
+    """
+
+    RE_WORD = re.compile(r"\w+")
+
+    # Query words whose matching indexed words are remembered
+    MATCHING_WORDS_LIMIT = 256
+
+    def __init__(self, fluent_api: FluentAPI) -> None:
+        self.fluent_api = fluent_api
+        self._documents: Dict[str, str] = {}
+        self._postings: DefaultDict[str, Set[str]] = defaultdict(set)
+        # Indexed words containing a query word, reused while the query is being typed
+        self._matching_words: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+
+        with self._lock:
+            for variable in list(fluent_api.translations):
+                self._index(variable)
+        fluent_api.change_listeners.append(self.update)
+
+    def close(self) -> None:
+        """Stops following the changes of the FluentAPI."""
+        if self.update in self.fluent_api.change_listeners:
+            self.fluent_api.change_listeners.remove(self.update)
+
+    def __len__(self) -> int:
+        return len(self._documents)
+
+    def _document(self, variable: str) -> Optional[str]:
+        languages = self.fluent_api.translations.get(variable)
+        if languages is None:
+            return None
+        parts = [variable]
+        for translation in list(languages.values()):
+            parts.append(translation.value or "")
+            for name, text in translation.attributes.items():
+                parts.append(name)
+                parts.append(text)
+            if translation.comment:
+                parts.append(translation.comment)
+        return "\n".join(parts).casefold()
+
+    def _index(self, variable: str) -> None:
+        document = self._document(variable)
+        if document is None:
+            return
+        self._documents[variable] = document
+        for word in set(self.RE_WORD.findall(document)):
+            self._postings[word].add(variable)
+
+    def update(self, variables: Iterable[str]) -> None:
+        """Reindexes variables whose translations changed, or removes deleted ones."""
+        with self._lock:
+            self._matching_words.clear()
+            for variable in variables:
+                old_document = self._documents.pop(variable, None)
+                old_words = (
+                    set(self.RE_WORD.findall(old_document)) if old_document else set()
+                )
+                self._index(variable)
+                new_document = self._documents.get(variable)
+                new_words = (
+                    set(self.RE_WORD.findall(new_document)) if new_document else set()
+                )
+                for word in old_words - new_words:
+                    postings = self._postings[word]
+                    postings.discard(variable)
+                    if not postings:
+                        del self._postings[word]
+
+    def search(self, query: str) -> Optional[Set[str]]:
+        """
+        Returns the variables whose document contains the query, case-insensitively.
+
+        :param query: Text to find.
+        :return: Matching variables, None for an empty query (everything matches).
+        """
+        query = query.strip().casefold()
+        if not query:
+            return None
+
+        with self._lock:
+            words = self.RE_WORD.findall(query)
+            if not words:
+                # Punctuation only, nothing to look up
+                candidates: Iterable[str] = self._documents
+            else:
+                candidates = None
+                # The longest words are the most selective
+                for word in sorted(set(words), key=len, reverse=True):
+                    matches = set()
+                    for indexed_word in self._words_containing(word):
+                        matches |= self._postings[indexed_word]
+                    candidates = matches if candidates is None else candidates & matches
+                    if not candidates:
+                        return set()
+
+            documents = self._documents
+            return {
+                variable
+                for variable in candidates
+                if query in documents.get(variable, "")
+            }
+
+    def _words_containing(self, word: str) -> List[str]:
+        matching = self._matching_words.get(word)
+        if matching is not None:
+            return matching
+
+        # Words containing 'hell' are among those containing 'hel', typed just before
+        source: Iterable[str] = self._postings
+        for length in range(len(word) - 1, 0, -1):
+            for shorter in (word[:length], word[-length:]):
+                if shorter in self._matching_words:
+                    source = self._matching_words[shorter]
+                    break
+            else:
+                continue
+            break
+
+        matching = [indexed_word for indexed_word in source if word in indexed_word]
+        if len(self._matching_words) >= self.MATCHING_WORDS_LIMIT:
+            self._matching_words.clear()
+        self._matching_words[word] = matching
+        return matching
@@ -0,0 +1,47 @@
+import os
+import tempfile
+from pathlib import Path
+
+
+def _read_umask() -> int:
+    # os.umask() can only be read by setting it, done once before any worker thread runs
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+# Mode of new files, as open() would create them
+DEFAULT_MODE = 0o666 & ~_read_umask()
+
+
+def write_text_atomic(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """
+    Replaces the contents of a file without ever leaving it half-written.
+
+    The text is written to a temporary file in the same directory, flushed to disk
+    and moved over the target with os.replace(), which is atomic on the same filesystem.
+    The file keeps its permissions (new files get the umask default, not mkstemp's
+    0600), and a symlink stays a symlink: its target is replaced.
+    """
+    path = Path(os.path.realpath(path))
+    try:
+        mode = os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = DEFAULT_MODE
+
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
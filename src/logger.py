@@ -2,11 +2,15 @@ import sys
 
 from loguru import logger
 
+from src.utils.config_reader import get_config, LoggingConfig
+from src.utils.log_sampler import edit_log
 from src.utils.qt_error import excepthook
 
 
 def configure_logger():
-    """Configures the Loguru logger with console and file handlers."""
+    """Configures the Loguru logger with the handlers of the [logging] section."""
+
+    config = get_config(LoggingConfig, root_key="logging")
 
     logger.remove()
 
@@ -20,20 +24,41 @@ def configure_logger():
 
     if sys.stderr and not sys.stderr.isatty():
         logger.add(
-            sys.stderr, format=log_format, level="INFO", colorize=True, enqueue=True
+            sys.stderr,
+            format=log_format,
+            level=config.level,
+            colorize=True,
+            enqueue=True,
         )
 
     # Add file handler with rotation, retention, and compression
-    logger.add(
-        "fluentus.log",
-        rotation="10 MB",
-        retention="10 days",
-        compression="zip",
-        format=log_format,
-        enqueue=True,
-        backtrace=True,  # Provides full stack traces
-        diagnose=True,  # Adds variable information to stack traces
-    )
+    if config.file:
+        logger.add(
+            config.file,
+            level=config.file_level,
+            rotation=config.rotation,
+            retention=config.retention,
+            compression="zip",
+            format=log_format,
+            enqueue=True,
+            backtrace=config.backtrace,  # Stack traces beyond the catching frame
+            diagnose=config.diagnose,  # Variable values in stack traces
+        )
+
+    # Structured records, one JSON object per line
+    if config.json_file:
+        logger.add(
+            config.json_file,
+            level=config.file_level,
+            rotation=config.rotation,
+            retention=config.retention,
+            serialize=True,
+            enqueue=True,
+            backtrace=config.backtrace,
+            diagnose=False,
+        )
+
+    edit_log.interval = config.edit_log_interval
 
     # Define a handler for uncaught exceptions
     def exception_handler(exception_type, exception, traceback):
@@ -1,12 +1,14 @@
 from functools import lru_cache
 from tomllib import load
-from typing import Type, TypeVar
+from typing import Any, Type, TypeVar, TYPE_CHECKING
 
-from PyQt6.QtGui import QColor
-from pydantic import BaseModel, field_validator, ConfigDict
+from pydantic import BaseModel, field_validator
 
 from src.utils.resource_path import resource_path
 
+if TYPE_CHECKING:
+    from PyQt6.QtGui import QColor
+
 ConfigType = TypeVar("ConfigType", bound=BaseModel)
 
 
@@ -27,6 +29,39 @@ class FtlFieldConfig(BaseModel):
     check: str
 
 
+class LoaderConfig(BaseModel):
+    workers: int = 1
+    lazy: bool = False
+
+
+class ParserConfig(BaseModel):
+    memo_size: int = 100_000
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    name: str
+
+
+class InstrumentationConfig(BaseModel):
+    enabled: bool = False
+    profile: bool = False
+    trace_memory: bool = False
+    dump_file: str = ""
+
+
+class LoggingConfig(BaseModel):
+    level: str = "INFO"
+    file: str = "fluentus.log"
+    file_level: str = "INFO"
+    rotation: str = "10 MB"
+    retention: str = "10 days"
+    backtrace: bool = True
+    diagnose: bool = False
+    json_file: str = ""
+    edit_log_interval: float = 1.0
+
+
 class TableColumn(BaseModel):
     icon: str
     variable: str
@@ -34,12 +69,13 @@ class TableColumn(BaseModel):
 
 
 class Colors(BaseModel):
-    highlight: QColor
-
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    # A QColor; Qt is imported when the colours are read, so headless tools
+    # can use the configuration without it
+    highlight: Any
 
     @field_validator("highlight", mode="before")
-    def parse_color(cls, v) -> QColor:
+    def parse_color(cls, v) -> "QColor":
+        from PyQt6.QtGui import QColor
 
         if isinstance(v, list):
             if len(v) < 3:
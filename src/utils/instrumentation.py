@@ -0,0 +1,285 @@
+"""
+Timing spans, counters and histograms for the hot paths, with opt-in profiling.
+
+Recording is off unless [instrumentation] enabled = true (or it is switched on in the
+diagnostics dialog, Ctrl+Shift+D in the editor). While it is off, span() returns one
+shared no-op context manager and timed() functions only check a flag, so the
+instrumented code runs at its usual speed.
+
+Durations go into histograms with power-of-two microsecond buckets, so any number
+of calls is kept in constant memory. The statistics are dumped as JSON to the
+configured file on exit; cProfile stats (.prof, readable with pstats or snakeviz)
+and the top tracemalloc allocation sites are added when profiling is configured.
+"""
+
+import atexit
+import cProfile
+import functools
+import json
+import threading
+import time
+import tracemalloc
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, List, Optional, TypeVar
+
+from loguru import logger
+
+from src.utils.config_reader import InstrumentationConfig
+
+FunctionType = TypeVar("FunctionType", bound=Callable[..., Any])
+
+# Allocation sites listed in dumps when memory is traced
+TOP_ALLOCATIONS = 25
+
+
+class Histogram:
+    """Durations of a span: count, total, extremes and power-of-two microsecond buckets."""
+
+    __slots__ = ("count", "total", "min", "max", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        # Bucket b holds durations below 2**b microseconds (and at least 2**(b-1))
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        bucket = int(seconds * 1e6).bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the q-quantile (0 to 1) in seconds, at most the maximum."""
+        rank = q * self.count
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(2**bucket / 1e6, self.max)
+        return self.max
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "total_s": self.total,
+            "mean_ms": self.total / self.count * 1e3 if self.count else 0.0,
+            "min_ms": self.min * 1e3 if self.count else 0.0,
+            "max_ms": self.max * 1e3,
+            "p50_ms": self.quantile(0.5) * 1e3,
+            "p95_ms": self.quantile(0.95) * 1e3,
+            "p99_ms": self.quantile(0.99) * 1e3,
+            "buckets_us": {
+                f"<{2**bucket}": count for bucket, count in sorted(self.buckets.items())
+            },
+        }
+
+
+class _Span:
+    __slots__ = ("metrics", "name", "started")
+
+    def __init__(self, metrics: "Metrics", name: str) -> None:
+        self.metrics = metrics
+        self.name = name
+
+    def __enter__(self) -> "_Span":
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.metrics.record(self.name, time.perf_counter() - self.started)
+
+
+_NO_SPAN = nullcontext()
+
+
+class Metrics:
+    """Span histograms and counters; safe to use from worker threads."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self.started = time.time()
+        self._lock = threading.Lock()
+
+    def span(self, name: str) -> ContextManager:
+        """Times the code of a with block as the span name."""
+        if not self.enabled:
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        with self._lock:
+            histogram = self.histograms.get(name)
+            if histogram is None:
+                histogram = self.histograms[name] = Histogram()
+            histogram.add(seconds)
+
+    def count(self, name: str, value: int = 1) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + value
+
+    def reset(self) -> None:
+        with self._lock:
+            self.histograms = {}
+            self.counters = {}
+            self.started = time.time()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns the statistics as a JSON-serialisable dict."""
+        with self._lock:
+            return {
+                "seconds": time.time() - self.started,
+                "spans": {
+                    name: histogram.as_dict()
+                    for name, histogram in sorted(self.histograms.items())
+                },
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def report(self) -> str:
+        """Returns the statistics as a text table."""
+        snapshot = self.snapshot()
+        lines = [
+            f"{'span':<24}{'count':>8}{'total s':>10}{'mean ms':>10}"
+            f"{'p95 ms':>10}{'max ms':>10}"
+        ]
+        for name, stats in snapshot["spans"].items():
+            lines.append(
+                f"{name:<24}{stats['count']:>8}{stats['total_s']:>10.3f}"
+                f"{stats['mean_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['max_ms']:>10.3f}"
+            )
+        if snapshot["counters"]:
+            lines.append("")
+            lines.append(f"{'counter':<24}{'value':>8}")
+            for name, value in snapshot["counters"].items():
+                lines.append(f"{name:<24}{value:>8}")
+        return "\n".join(lines)
+
+
+# Shared by the whole process, like the logger
+metrics = Metrics()
+
+
+def span(name: str) -> ContextManager:
+    """Times a with block: `with span("load.parse"): ...`."""
+    return _Span(metrics, name) if metrics.enabled else _NO_SPAN
+
+
+def count(name: str, value: int = 1) -> None:
+    """Adds to a counter while recording is enabled."""
+    metrics.count(name, value)
+
+
+def timed(name: str) -> Callable[[FunctionType], FunctionType]:
+    """Decorator timing every call of a function as the span name."""
+
+    def decorator(function: FunctionType) -> FunctionType:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            if not metrics.enabled:
+                return function(*args, **kwargs)
+            started = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                metrics.record(name, time.perf_counter() - started)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
+class Profiler:
+    """cProfile and tracemalloc capture, started from the configuration."""
+
+    def __init__(self) -> None:
+        self.profile: Optional[cProfile.Profile] = None
+
+    def start(self, profile: bool, trace_memory: bool) -> None:
+        if profile and self.profile is None:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def stop(self) -> None:
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile = None
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def dump_profile(self, path: Path) -> None:
+        """Writes the cProfile stats collected so far; profiling goes on."""
+        if self.profile is None:
+            return
+        self.profile.disable()
+        try:
+            self.profile.dump_stats(path)
+        finally:
+            self.profile.enable()
+
+    @staticmethod
+    def memory() -> Optional[Dict[str, Any]]:
+        """Traced memory and the largest allocation sites, None if not tracing."""
+        if not tracemalloc.is_tracing():
+            return None
+        current, peak = tracemalloc.get_traced_memory()
+        statistics = tracemalloc.take_snapshot().statistics("lineno")
+        top: List[Dict[str, Any]] = [
+            {
+                "site": str(statistic.traceback),
+                "size_kib": statistic.size / 1024,
+                "blocks": statistic.count,
+            }
+            for statistic in statistics[:TOP_ALLOCATIONS]
+        ]
+        return {"current_mib": current / 2**20, "peak_mib": peak / 2**20, "top": top}
+
+
+profiler = Profiler()
+
+
+def dump(path: str | Path) -> Path:
+    """
+    Writes the statistics as JSON, with the traced memory if any; cProfile stats go
+    to a .prof file next to it.
+
+    :return: Path of the JSON file.
+    """
+    path = Path(path)
+    data = metrics.snapshot()
+    memory = profiler.memory()
+    if memory is not None:
+        data["memory"] = memory
+    if profiler.profile is not None:
+        profile_path = path.with_suffix(".prof")
+        profiler.dump_profile(profile_path)
+        data["profile"] = str(profile_path)
+    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    logger.info(f"Instrumentation statistics written to '{path}'.")
+    return path
+
+
+def configure(config: InstrumentationConfig) -> None:
+    """Starts recording and profiling as configured, and dumps the statistics on exit."""
+    metrics.enabled = config.enabled or config.profile or config.trace_memory
+    profiler.start(config.profile, config.trace_memory)
+    if metrics.enabled and config.dump_file:
+        atexit.register(_dump_at_exit, config.dump_file)
+
+
+def _dump_at_exit(path: str) -> None:
+    try:
+        dump(path)
+    except OSError as e:
+        logger.error(f"Could not write instrumentation statistics to '{path}': {e}")
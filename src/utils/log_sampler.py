@@ -0,0 +1,62 @@
+"""
+Rate-limited logging for high-volume events such as edits.
+
+Messages are passed to loguru as a template with arguments, so they are only
+formatted when a handler writes them. Each key lets at most one message through
+per interval; the number of messages dropped in between is added to the next one.
+"""
+
+import threading
+import time
+from typing import Any, Dict
+
+from loguru import logger
+
+
+class LogSampler:
+    def __init__(self, interval: float = 1.0) -> None:
+        """
+        :param interval: Minimum seconds between two messages of a key, 0 - log all.
+        """
+        self.interval = interval
+        self._last: Dict[str, float] = {}
+        self._dropped: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def log(
+        self, key: str, level: str, message: str, *args: Any, **kwargs: Any
+    ) -> None:
+        """
+        Logs a message unless one with the same key was logged less than an interval ago.
+
+        :param key: Kind of event, limited separately from the others.
+        :param level: Loguru level name.
+        :param message: Loguru template, formatted with args and kwargs when written.
+        """
+        self._log(key, level, message, args, kwargs)
+
+    def debug(self, key: str, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(key, "DEBUG", message, args, kwargs)
+
+    def info(self, key: str, message: str, *args: Any, **kwargs: Any) -> None:
+        self._log(key, "INFO", message, args, kwargs)
+
+    def _log(
+        self, key: str, level: str, message: str, args: tuple, kwargs: dict
+    ) -> None:
+        now = time.monotonic()
+        with self._lock:
+            last = self._last.get(key)
+            if self.interval > 0 and last is not None and now - last < self.interval:
+                self._dropped[key] = self._dropped.get(key, 0) + 1
+                return
+            self._last[key] = now
+            dropped = self._dropped.pop(key, 0)
+        if dropped:
+            message += f" ({dropped} similar messages skipped)"
+        # depth=2 reports the function and line that called log(), debug() or info()
+        logger.opt(depth=2).log(level, message, *args, **kwargs)
+
+
+# Per-edit events (FluentAPI.update), configured by the [logging] section
+edit_log = LogSampler()
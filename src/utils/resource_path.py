@@ -13,6 +13,7 @@ def resource_path(relative_path: str) -> str:
     try:
         base_path = sys._MEIPASS  # Used by PyInstaller
     except Exception:
-        base_path = os.path.abspath(".")
+        # The src folder, whatever the working directory is
+        base_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
     return os.path.join(base_path, relative_path)
@@ -0,0 +1,93 @@
+from pathlib import Path
+from typing import List
+
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+from loguru import logger
+
+from src.fluent_api.FluentAPI import FluentAPI, LoadCancelled
+from src.fluent_api.base_type.files import SaveSnapshot
+
+
+class FileLoadedNotifier(QObject):
+    """
+    Relays FluentAPI.on_file_loaded calls, made from the prefetch thread, to the GUI thread.
+    """
+
+    file_loaded = pyqtSignal(list)
+
+    def __call__(self, filepath: Path, variables: List[str]) -> None:
+        self.file_loaded.emit(variables)
+
+
+class ProjectLoaderSignals(QObject):
+    """Signals of a ProjectLoader, delivered to the GUI thread."""
+
+    # Files done, files total, path of the last file
+    progress = pyqtSignal(int, int, str)
+    locale_loaded = pyqtSignal(str)
+    finished = pyqtSignal()
+    cancelled = pyqtSignal()
+    failed = pyqtSignal(str)
+
+
+class ProjectLoader(QRunnable):
+    """Runs FluentAPI.load() on a thread pool, reporting its progress through signals."""
+
+    def __init__(self, fluent_api: FluentAPI) -> None:
+        super().__init__()
+        self.fluent_api = fluent_api
+        self.signals = ProjectLoaderSignals()
+        # Kept alive by the editor, which reads its signals after run() returns
+        self.setAutoDelete(False)
+
+        fluent_api.on_load_progress = self._emit_progress
+        fluent_api.on_locale_loaded = self.signals.locale_loaded.emit
+
+    def _emit_progress(self, done: int, total: int, filepath: Path) -> None:
+        self.signals.progress.emit(done, total, str(filepath))
+
+    def cancel(self) -> None:
+        """Asks the loader to stop before the next file."""
+        self.fluent_api.cancel_load()
+
+    def run(self) -> None:
+        try:
+            self.fluent_api.load()
+        except LoadCancelled:
+            self.signals.cancelled.emit()
+        except Exception as e:
+            logger.exception(f"Failed to load '{self.fluent_api.folder_path}'")
+            self.signals.failed.emit(f"{type(e).__name__}: {e}")
+        else:
+            self.signals.finished.emit()
+        finally:
+            self.fluent_api.on_load_progress = None
+            self.fluent_api.on_locale_loaded = None
+
+
+class SaveWorkerSignals(QObject):
+    """Signals of a SaveWorker, delivered to the GUI thread."""
+
+    finished = pyqtSignal(object)  # SaveReport
+    failed = pyqtSignal(object, str)  # SaveSnapshot, error message
+
+
+class SaveWorker(QRunnable):
+    """Writes a snapshot of the changed files on a thread pool."""
+
+    def __init__(self, fluent_api: FluentAPI, snapshot: SaveSnapshot) -> None:
+        super().__init__()
+        self.fluent_api = fluent_api
+        self.snapshot = snapshot
+        self.signals = SaveWorkerSignals()
+        # Kept alive by the editor until its signals are handled
+        self.setAutoDelete(False)
+
+    def run(self) -> None:
+        try:
+            report = self.fluent_api.write_snapshot(self.snapshot)
+        except Exception as e:
+            logger.exception(f"Failed to save '{self.snapshot.target_folder}'")
+            self.signals.failed.emit(self.snapshot, f"{type(e).__name__}: {e}")
+        else:
+            self.signals.finished.emit(report)
@@ -0,0 +1,96 @@
+from PyQt6.QtGui import QFontDatabase
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QDialogButtonBox,
+    QFileDialog,
+    QHBoxLayout,
+    QMessageBox,
+    QPlainTextEdit,
+    QPushButton,
+    QVBoxLayout,
+)
+
+from src.utils import instrumentation
+
+
+class DiagnosticsDialog(QDialog):
+    """
+    Timings and counters recorded by src.utils.instrumentation (Ctrl+Shift+D).
+
+    Recording can be switched on here for the rest of the session, the statistics
+    reset between measurements and saved as JSON to attach to a report.
+    """
+
+    def __init__(self, parent=None) -> None:
+        super().__init__(parent)
+
+        self.setWindowTitle("Diagnostics")
+        self.resize(760, 480)
+
+        self.enabled_box = QCheckBox("Record timings")
+        self.enabled_box.setChecked(instrumentation.metrics.enabled)
+        self.enabled_box.toggled.connect(self.set_enabled)
+
+        self.report_view = QPlainTextEdit()
+        self.report_view.setReadOnly(True)
+        self.report_view.setFont(
+            QFontDatabase.systemFont(QFontDatabase.SystemFont.FixedFont)
+        )
+
+        refresh_button = QPushButton("Refresh")
+        refresh_button.clicked.connect(self.refresh)
+        reset_button = QPushButton("Reset")
+        reset_button.clicked.connect(self.reset)
+        save_button = QPushButton("Save…")
+        save_button.clicked.connect(self.save)
+
+        controls = QHBoxLayout()
+        controls.addWidget(self.enabled_box)
+        controls.addStretch()
+        controls.addWidget(refresh_button)
+        controls.addWidget(reset_button)
+        controls.addWidget(save_button)
+
+        buttons = QDialogButtonBox(QDialogButtonBox.StandardButton.Close)
+        buttons.rejected.connect(self.reject)
+
+        main_layout = QVBoxLayout()
+        main_layout.addLayout(controls)
+        main_layout.addWidget(self.report_view)
+        main_layout.addWidget(buttons)
+        self.setLayout(main_layout)
+
+        self.refresh()
+
+    def set_enabled(self, enabled: bool) -> None:
+        instrumentation.metrics.enabled = enabled
+        self.refresh()
+
+    def refresh(self) -> None:
+        if (
+            not instrumentation.metrics.enabled
+            and not instrumentation.metrics.histograms
+        ):
+            self.report_view.setPlainText(
+                "Timings are not recorded. Check 'Record timings', or set "
+                "enabled = true in the [instrumentation] section of config.toml "
+                "to time loading as well."
+            )
+            return
+        self.report_view.setPlainText(instrumentation.metrics.report())
+
+    def reset(self) -> None:
+        instrumentation.metrics.reset()
+        self.refresh()
+
+    def save(self) -> None:
+        path, _ = QFileDialog.getSaveFileName(
+            self, "Save statistics", "fluentus-stats.json", "JSON (*.json)"
+        )
+        if not path:
+            return
+        try:
+            instrumentation.dump(path)
+        except OSError as e:
+            QMessageBox.critical(self, "Diagnostics", f"Could not save '{path}': {e}")
@@ -0,0 +1,87 @@
+import os
+from pathlib import Path
+from typing import Set, List
+
+from PyQt6.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+
+
+class FtlFileWatcher(QObject):
+    """
+    Watches a locales folder for changed, added and deleted translation files.
+
+    Notifications are collected for DELAY ms, so a file written in several steps
+    (or a whole checkout) is reported once.
+    """
+
+    # Absolute paths of the changed, added or deleted files
+    files_changed = pyqtSignal(list)
+
+    DELAY = 300
+
+    def __init__(self, folder: Path | str, ext: str = ".ftl", parent=None) -> None:
+        super().__init__(parent)
+        self.folder = Path(folder)
+        self.ext = ext
+
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._on_file_changed)
+        self._watcher.directoryChanged.connect(self._on_directory_changed)
+
+        self._known_files: Set[Path] = set()
+        self._changed_files: Set[Path] = set()
+        self._changed_directories: Set[Path] = set()
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(self.DELAY)
+        self._timer.timeout.connect(self._emit_changes)
+
+        self._watch_directory(self.folder, report=False)
+
+    def _watch_directory(self, directory: Path, report: bool) -> None:
+        """Watches a directory tree; its files are reported as added if report is set."""
+        for root, _, files in os.walk(directory):
+            root = Path(root)
+            self._watcher.addPath(str(root))
+            if root == self.folder:
+                continue  # Translation files are inside locale folders
+            for name in files:
+                ftl_file = root / name
+                if ftl_file.suffix == self.ext and ftl_file not in self._known_files:
+                    self._known_files.add(ftl_file)
+                    self._watcher.addPath(str(ftl_file))
+                    if report:
+                        self._changed_files.add(ftl_file)
+
+    def _on_file_changed(self, path: str) -> None:
+        self._changed_files.add(Path(path))
+        self._timer.start()
+
+    def _on_directory_changed(self, path: str) -> None:
+        self._changed_directories.add(Path(path))
+        self._timer.start()
+
+    def _emit_changes(self) -> None:
+        for directory in self._changed_directories:
+            if directory.is_dir():
+                self._watch_directory(directory, report=True)
+            # Files of removed directories and deleted files
+            self._changed_files.update(
+                ftl_file
+                for ftl_file in self._known_files
+                if ftl_file.is_relative_to(directory) and not ftl_file.exists()
+            )
+
+        changed: List[Path] = sorted(self._changed_files)
+        self._changed_files.clear()
+        self._changed_directories.clear()
+
+        for ftl_file in changed:
+            if ftl_file.exists():
+                # Files replaced by rename (like atomic saves) drop out of the watch list
+                self._watcher.addPath(str(ftl_file))
+            else:
+                self._known_files.discard(ftl_file)
+
+        if changed:
+            self.files_changed.emit(changed)
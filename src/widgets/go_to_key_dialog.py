@@ -0,0 +1,58 @@
+from typing import List, Optional, Tuple
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtWidgets import (
+    QCompleter,
+    QDialog,
+    QDialogButtonBox,
+    QLabel,
+    QLineEdit,
+    QVBoxLayout,
+)
+
+
+class GoToKeyDialog(QDialog):
+    """
+    A dialog asking for a message ID to jump to, with completion over the known IDs.
+
+    An attribute is selected with 'message-id.attribute'.
+    """
+
+    def __init__(self, variables: List[str], parent=None) -> None:
+        super().__init__(parent)
+
+        self.setWindowTitle("Go to Key")
+        self.setModal(True)
+
+        label = QLabel("Message ID (or message-id.attribute):")
+
+        self.key_edit = QLineEdit()
+        completer = QCompleter(variables, self)
+        completer.setCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        completer.setFilterMode(Qt.MatchFlag.MatchContains)
+        self.key_edit.setCompleter(completer)
+
+        buttons = QDialogButtonBox(
+            QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel
+        )
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+
+        main_layout = QVBoxLayout()
+        main_layout.addWidget(label)
+        main_layout.addWidget(self.key_edit)
+        main_layout.addWidget(buttons)
+
+        self.setLayout(main_layout)
+
+    def key(self) -> Tuple[Optional[str], Optional[str]]:
+        """
+        Returns the entered key split into the variable and the attribute.
+
+        :return: A tuple containing the variable and the attribute (with its leading dot).
+        """
+        text = self.key_edit.text().strip()
+        if not text:
+            return None, None
+        variable, dot, attribute = text.partition(".")
+        return variable, f".{attribute}" if dot and attribute else None
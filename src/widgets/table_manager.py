@@ -1,24 +1,22 @@
-import re
-from collections import defaultdict
-from typing import Optional, Callable, Iterable, Tuple, Dict
+from typing import Optional, Callable, Iterable, Tuple, Dict, Set
 
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QHeaderView, QTreeWidget, QTreeWidgetItem
+from PyQt6.QtCore import QModelIndex, QItemSelectionModel
+from PyQt6.QtWidgets import QHeaderView, QTreeView
 
 from src.fluent_api.FluentAPI import FluentAPI
-from src.fluent_api.base_type.translations import LanguagesType
 from src.utils.config_reader import get_config, TableColumn, Colors
+from src.utils.instrumentation import timed
 from src.utils.icon_utils import get_tinted_icon
 from src.utils.resource_path import resource_path
+from src.widgets.translation_model import TranslationTableModel
 
 
 class TableManager:
     """Manages the variable table and synchronizes updates."""
 
     # Constants for column indices
-    ICON_COLUMN_INDEX = 0
-    BASE_COLUMN_COUNT = 2
+    ICON_COLUMN_INDEX = TranslationTableModel.ICON_COLUMN_INDEX
+    BASE_COLUMN_COUNT = TranslationTableModel.BASE_COLUMN_COUNT
 
     # Path to the comment icon
     COMMENT_ICON_PATH = resource_path("resource/icons/comment.png")
@@ -28,14 +26,14 @@ class TableManager:
 
     def __init__(
         self,
-        table: QTreeWidget,
+        table: QTreeView,
         fluent_api: FluentAPI,
         on_item_selected_callback: Optional[Callable[[], None]] = None,
     ):
         """
         Initializes the TableManager.
 
-        :param table: The QTreeWidget instance to manage.
+        :param table: The QTreeView instance to manage.
         :param fluent_api: Instance of FluentAPI for accessing translations.
         :param on_item_selected_callback: Optional callback for item selection changes.
         """
@@ -52,35 +50,41 @@ class TableManager:
         # Header labels
         self.BASE_HEADERS = [self.table_config.icon, self.table_config.variable]
 
+        self._language_columns: Dict[str, int] = {}
+
         self.comment_icon = get_tinted_icon(self.COMMENT_ICON_PATH, self.table)
+        self.model = TranslationTableModel(
+            self.fluent_api,
+            comment_icon=self.comment_icon,
+            highlight=self.colors_config.highlight,
+            parent=self.table,
+        )
+        # Edits are made on the GUI thread, the header percentages follow them
+        self.fluent_api.on_coverage_changed = self.model.refresh_coverage
         self._setup_table()
 
     def _setup_table(self) -> None:
         """Configures the table settings."""
-        self.table.setSelectionBehavior(QTreeWidget.SelectionBehavior.SelectRows)
-        self.table.setSelectionMode(QTreeWidget.SelectionMode.SingleSelection)
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QTreeView.SelectionBehavior.SelectRows)
+        self.table.setSelectionMode(QTreeView.SelectionMode.SingleSelection)
+        # Lets the view lay out rows without asking the model for every row's size
+        self.table.setUniformRowHeights(True)
 
         if self.on_item_selected_callback:
-            self.table.itemSelectionChanged.connect(self.on_item_selected_callback)
+            self.table.selectionModel().currentChanged.connect(
+                lambda *_: self.on_item_selected_callback()
+            )
 
-        self.table.setColumnCount(
-            self.BASE_COLUMN_COUNT + len(self.fluent_api.get_languages())
-        )
-        self.table.header().setSectionResizeMode(
-            self.ICON_COLUMN_INDEX, QHeaderView.ResizeMode.Fixed
-        )
-        self.table.setColumnWidth(self.ICON_COLUMN_INDEX, self.ICON_COLUMN_WIDTH)
+        self._initialize_headers(self.fluent_api.get_languages())
 
-    def _find_header_index(self, header_name: str) -> Optional[int]:
-        """Finds the column index for a given header name."""
-        for index in range(self.table.columnCount()):
-            if self.table.headerItem().text(index) == header_name:
-                return index
-        return None
+    def _find_language_column(self, language_code: str) -> Optional[int]:
+        """Finds the column index of a language."""
+        return self._language_columns.get(language_code)
 
     def set_current_item(self, language_code: str) -> None:
         """
-        Updates the current item's translations and formatting based on the provided language.
+        Refreshes the current item's translations and formatting for the provided language.
 
         :param language_code: The language code.
         """
@@ -88,182 +92,52 @@ class TableManager:
         if not variable_name:
             return
 
-        variable_item, attribute_item = self.get_selected_items()
-        if not variable_item:
-            return
-
-        translations = self.fluent_api.translations[variable_name]
-        header_name = f"{self.table_config.translation} — {language_code}"
-        column_index = self._find_header_index(header_name)
-        if column_index is None:
-            return  # Header not found
-
-        if attribute_name:
-            self._update_attribute_translation(
-                attribute_item,
-                translations,
-                attribute_name,
-                language_code,
-                column_index,
-            )
-        else:
-            self._update_variable_translation(
-                variable_item, translations, language_code, column_index
-            )
-
-        self._apply_icon_and_formatting(variable_item, translations, language_code)
-
-    def _update_variable_translation(
-        self,
-        variable_item: QTreeWidgetItem,
-        translations: LanguagesType,
-        language_code: str,
-        column_index: int,
-    ) -> None:
-        """Updates the variable item's translation."""
-        new_translation = self._extract_text(translations[language_code].value)
-        old_translation = variable_item.text(column_index)
-        if new_translation != old_translation:
-            variable_item.setText(column_index, new_translation)
+        self.refresh_item(variable_name, language_code, attribute_name)
 
-    def _update_attribute_translation(
-        self,
-        attribute_item: QTreeWidgetItem,
-        translations: LanguagesType,
-        attribute_name: str,
-        language_code: str,
-        column_index: int,
+    def refresh_item(
+        self, variable_name: str, language_code: str, attribute_name: Optional[str]
     ) -> None:
-        """Updates the attribute item's translation."""
-        new_translation = self._extract_text(
-            translations[language_code].attributes[attribute_name]
-        )
-        old_translation = attribute_item.text(column_index)
-        if new_translation != old_translation:
-            attribute_item.setText(column_index, new_translation)
-
-    def _apply_icon_and_formatting(
-        self,
-        variable_item: QTreeWidgetItem,
-        translations: LanguagesType,
-        language_code: str,
-    ) -> None:
-        """Sets the icon and text formatting based on comments and checks."""
-        languages = self.fluent_api.get_languages()
+        """
+        Refreshes one translation cell, selected or not.
 
-        # Set icon
-        comment_exists = any(translations[lang].comment for lang in languages)
-        variable_item.setIcon(
-            self.ICON_COLUMN_INDEX, self.comment_icon if comment_exists else QIcon()
-        )
+        :param variable_name: The variable name.
+        :param language_code: The language code.
+        :param attribute_name: The attribute name, None for the variable row.
+        """
+        if self._find_language_column(language_code) is None:
+            return  # Header not found
 
-        # Set foreground color
-        language_data = translations[language_code]
-        column_index = self._find_header_index(
-            f"{self.table_config.translation} — {language_code}"
-        )
-        if language_data.check:
-            variable_item.setForeground(column_index, self.colors_config.highlight)
-        else:
-            variable_item.setData(column_index, Qt.ItemDataRole.ForegroundRole, None)
+        self.model.refresh_cell(variable_name, language_code, attribute_name)
 
+    @timed("table.populate")
     def populate_table(self) -> None:
         """
         Populates the table with variables and translations, preserving the user's selection.
         """
         languages = self.fluent_api.get_languages()
-        selected_variable, selected_attribute = self.get_selected_items()
-
-        self.table.clear()
+        selected_variable, selected_attribute = self.get_selected_names()
 
         self._initialize_headers(languages)
 
-        for variable_name, translations in self.fluent_api.translations.items():
-            table_item = self._create_top_level_item(
-                variable_name, translations, languages
-            )
-            self.table.addTopLevelItem(table_item)
-
         self._restore_selection(selected_variable, selected_attribute)
 
-    def _create_top_level_item(
-        self, variable_name: str, translations: LanguagesType, languages: Iterable[str]
-    ) -> QTreeWidgetItem:
+    def set_visible_variables(self, variable_names: Optional[Set[str]]) -> None:
         """
-        Creates a top-level table item with translations and attributes.
+        Filters the table, preserving the user's selection when it is still shown.
 
-        :param variable_name: The variable name.
-        :param translations: The data associated with the variable.
-        :param languages: Iterable of language codes.
-        :return: A configured QTreeWidgetItem.
+        :param variable_names: Variables to show, None to show all.
         """
-        item_data = ["", variable_name]
-        comment_exists = False
-
-        for language_code in languages:
-            language_data = translations[language_code]
-            translation = self._extract_text(language_data.value)
-            item_data.append(translation)
-            if language_data.comment:
-                comment_exists = True
-
-        table_item = QTreeWidgetItem(item_data)
-        table_item.setIcon(
-            self.ICON_COLUMN_INDEX, self.comment_icon if comment_exists else QIcon()
-        )
+        selected_variable, selected_attribute = self.get_selected_names()
+        self.model.set_visible(variable_names)
+        self._restore_selection(selected_variable, selected_attribute)
 
-        for language_code in languages:
-            header_name = f"{self.table_config.translation} — {language_code}"
-            column_index = self._find_header_index(header_name)
-            if column_index is None:
-                continue
-            language_data = translations[language_code]
-            if language_data.check:
-                table_item.setForeground(column_index, self.colors_config.highlight)
-            else:
-                table_item.setData(column_index, Qt.ItemDataRole.ForegroundRole, None)
-
-        attributes = self._collect_attributes(translations, languages)
-        for attribute_name, attribute_translations in attributes.items():
-            attribute_data = ["", attribute_name] + [
-                self._extract_text(attribute_translations[lang]) for lang in languages
-            ]
-            child_item = QTreeWidgetItem(attribute_data)
-            table_item.addChild(child_item)
-
-        return table_item
-
-    @staticmethod
-    def _extract_text(content: str) -> str:
+    def refresh_variables(self, variable_names: Iterable[str]) -> None:
         """
-        Processes the content string by replacing line splits with arrows.
+        Refreshes the rows of the given variables, e.g. after their files were loaded.
 
-        :param content: The original content string.
-        :return: The processed string.
-        """
-        if not content:
-            return ""
-        return re.sub(pattern=FluentAPI.RE_LINE_SPLIT_PATTERN, repl="➚", string=content)
-
-    @staticmethod
-    def _collect_attributes(
-        translations: LanguagesType, languages: Iterable[str]
-    ) -> Dict[str, Dict[str, str]]:
+        :param variable_names: Names of the variables to refresh.
         """
-        Aggregates attributes for languages.
-
-        :param translations: The data containing attributes.
-        :param languages: Iterable of language codes.
-        :return: A dictionary of attributes with their translations.
-        """
-        attributes = defaultdict(lambda: defaultdict(str))
-
-        for language_code in languages:
-            language_data = translations[language_code]
-            for attr_name, attr_value in language_data.attributes.items():
-                attributes[attr_name][language_code] = attr_value or ""
-
-        return attributes
+        self.model.refresh_variables(variable_names)
 
     def _restore_selection(
         self, variable_name: Optional[str], attribute_name: Optional[str]
@@ -274,24 +148,34 @@ class TableManager:
         :param variable_name: The previously selected variable.
         :param attribute_name: The previously selected attribute.
         """
-        if not variable_name:
-            return
+        if variable_name:
+            self.select(variable_name, attribute_name)
 
-        variable_column = self._find_header_index(self.table_config.variable)
-        if variable_column is None:
-            return
+    def select(self, variable_name: str, attribute_name: Optional[str] = None) -> bool:
+        """
+        Selects and scrolls to a variable or one of its attributes.
 
-        for row_index in range(self.table.topLevelItemCount()):
-            parent_item = self.table.topLevelItem(row_index)
-            if parent_item.text(variable_column) == variable_name:
-                if attribute_name:
-                    for child_index in range(parent_item.childCount()):
-                        child_item = parent_item.child(child_index)
-                        if child_item.text(variable_column) == attribute_name:
-                            self.table.setCurrentItem(child_item)
-                            return
-                self.table.setCurrentItem(parent_item)
-                return
+        Falls back to the variable row if the attribute is not found.
+
+        :param variable_name: The variable to select.
+        :param attribute_name: The attribute to select.
+        :return: False if the variable is not shown in the table.
+        """
+        index = QModelIndex()
+        if attribute_name:
+            index = self.model.attribute_index(variable_name, attribute_name)
+        if not index.isValid():
+            index = self.model.variable_index(variable_name)
+        if not index.isValid():
+            return False
+
+        self.table.selectionModel().setCurrentIndex(
+            index,
+            QItemSelectionModel.SelectionFlag.ClearAndSelect
+            | QItemSelectionModel.SelectionFlag.Rows,
+        )
+        self.table.scrollTo(index)
+        return True
 
     def _initialize_headers(self, languages: Iterable[str]) -> None:
         """
@@ -299,27 +183,38 @@ class TableManager:
 
         :param languages: Iterable of language codes.
         """
+        languages = list(languages)
         headers = self.BASE_HEADERS + [
             f"{self.table_config.translation} — {lang}" for lang in languages
         ]
-        self.table.setHeaderLabels(headers)
+        self.model.reset(headers, languages)
 
-    def get_selected_items(
+        # Column lookup used on every keystroke, rebuilt only when the headers change
+        self._language_columns = {
+            lang: index for index, lang in enumerate(languages, self.BASE_COLUMN_COUNT)
+        }
+
+        self.table.header().setSectionResizeMode(
+            self.ICON_COLUMN_INDEX, QHeaderView.ResizeMode.Fixed
+        )
+        self.table.setColumnWidth(self.ICON_COLUMN_INDEX, self.ICON_COLUMN_WIDTH)
+
+    def get_selected_indexes(
         self,
-    ) -> Tuple[Optional[QTreeWidgetItem], Optional[QTreeWidgetItem]]:
+    ) -> Tuple[Optional[QModelIndex], Optional[QModelIndex]]:
         """
-        Retrieves the selected item and its parent.
+        Retrieves the selected index and its parent.
 
-        :return: A tuple containing the parent QTreeWidgetItem and the selected QTreeWidgetItem.
+        :return: A tuple containing the variable index and the selected attribute index.
         """
-        selected_item = self.table.currentItem()
-        if not selected_item:
+        selected_index = self.table.selectionModel().currentIndex()
+        if not selected_index.isValid():
             return None, None
 
-        parent = selected_item.parent()
-        if parent:
-            return parent, selected_item
-        return selected_item, None
+        parent = selected_index.parent()
+        if parent.isValid():
+            return parent, selected_index
+        return selected_index.siblingAtColumn(0), None
 
     def get_selected_names(self) -> Tuple[Optional[str], Optional[str]]:
         """
@@ -327,15 +222,12 @@ class TableManager:
 
         :return: A tuple containing the selected variable and attribute.
         """
-        parent_item, selected_item = self.get_selected_items()
-        variable_column = self._find_header_index(self.table_config.variable)
-        if variable_column is None:
-            return None, None
+        parent_index, selected_index = self.get_selected_indexes()
 
-        variable_name = parent_item.text(variable_column) if parent_item else None
+        variable_name = self.model.variable_name(parent_index) if parent_index else None
         attribute_name = (
-            selected_item.text(variable_column)
-            if selected_item and parent_item
+            self.model.attribute_name(selected_index)
+            if selected_index and parent_index
             else None
         )
         return variable_name, attribute_name
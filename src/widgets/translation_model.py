@@ -0,0 +1,377 @@
+import re
+from typing import Optional, List, Any, Iterable, Dict, Set
+
+from PyQt6.QtCore import QAbstractItemModel, QModelIndex, Qt
+from PyQt6.QtGui import QIcon, QColor
+
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.base_type.translations import Translation
+
+
+def extract_text(content: Optional[str]) -> str:
+    """
+    Processes the content string by replacing line splits with arrows.
+
+    :param content: The original content string.
+    :return: The processed string.
+    """
+    if not content:
+        return ""
+    return re.sub(pattern=FluentAPI.RE_LINE_SPLIT_PATTERN, repl="➚", string=content)
+
+
+class _VariableRow:
+    """A top-level row; attribute names are collected the first time its children are needed."""
+
+    __slots__ = ("variable", "row", "attributes", "attribute_rows")
+
+    def __init__(self, variable: str, row: int) -> None:
+        self.variable = variable
+        self.row = row
+        self.attributes: Optional[List[str]] = None
+        self.attribute_rows: Dict[str, int] = {}
+
+    def set_attributes(self, attributes: List[str]) -> None:
+        self.attributes = attributes
+        self.attribute_rows = {name: row for row, name in enumerate(attributes)}
+
+
+class TranslationTableModel(QAbstractItemModel):
+    """
+    Tree model over FluentAPI.translations: a row per variable with its attributes as children.
+
+    Nothing is copied from the translations: cell text, icons and colours are computed
+    in data(), so only the rows the view actually paints are ever formatted.
+    """
+
+    ICON_COLUMN_INDEX = 0
+    VARIABLE_COLUMN_INDEX = 1
+    BASE_COLUMN_COUNT = 2
+
+    _EMPTY = Translation()
+
+    def __init__(
+        self,
+        fluent_api: FluentAPI,
+        comment_icon: QIcon,
+        highlight: QColor,
+        parent=None,
+    ):
+        """
+        :param fluent_api: Instance of FluentAPI the rows are read from.
+        :param comment_icon: Icon shown for variables with a comment.
+        :param highlight: Text colour of checked translations.
+        """
+        super().__init__(parent)
+        self.fluent_api = fluent_api
+        self.comment_icon = comment_icon
+        self.highlight = highlight
+
+        self._headers: List[str] = []
+        self._languages: List[str] = []
+        self._language_columns: Dict[str, int] = {}
+        self._rows: List[_VariableRow] = []
+        # Row lookup by variable name, rebuilt with the rows
+        self._row_of: Dict[str, _VariableRow] = {}
+        # Variables shown by the current filter, None shows all
+        self._visible: Optional[Set[str]] = None
+        # Rows of all variables, hidden ones included, so switching filters keeps
+        # the attributes already collected; dropped on reset
+        self._all_rows: Dict[str, _VariableRow] = {}
+
+    def reset(self, headers: List[str], languages: Iterable[str]) -> None:
+        """
+        Re-reads the list of variables and languages.
+
+        :param headers: Column header labels.
+        :param languages: Language codes in column order.
+        """
+        self.beginResetModel()
+        self._headers = list(headers)
+        self._languages = list(languages)
+        self._language_columns = {
+            language: column
+            for column, language in enumerate(self._languages, self.BASE_COLUMN_COUNT)
+        }
+        self._all_rows = {}
+        self._build_rows()
+        self.endResetModel()
+
+    def set_visible(self, variables: Optional[Set[str]]) -> None:
+        """
+        Shows only the given variables, in their usual order.
+
+        :param variables: Variables to show, None to show all.
+        """
+        self.beginResetModel()
+        self._visible = variables
+        self._build_rows()
+        self.endResetModel()
+
+    def _build_rows(self) -> None:
+        variables = list(self.fluent_api.translations)
+        if self._visible is not None:
+            visible = self._visible
+            variables = [variable for variable in variables if variable in visible]
+        all_rows = self._all_rows
+        self._rows = []
+        for row_number, variable in enumerate(variables):
+            row = all_rows.get(variable)
+            if row is None:
+                row = all_rows[variable] = _VariableRow(variable, row_number)
+            else:
+                row.row = row_number
+            self._rows.append(row)
+        self._row_of = {row.variable: row for row in self._rows}
+
+    def _translation(self, variable: str, language: str) -> Translation:
+        # Missing languages read as one shared empty translation
+        return self.fluent_api.translations.get(variable, {}).get(language, self._EMPTY)
+
+    def _collect_attributes(self, variable: str) -> List[str]:
+        """Returns the attribute names of a variable across all languages."""
+        attributes: Dict[str, None] = {}
+        for language in self._languages:
+            attributes.update(
+                dict.fromkeys(self._translation(variable, language).attributes)
+            )
+        return list(attributes)
+
+    def _attributes(self, row: _VariableRow) -> List[str]:
+        if row.attributes is None:
+            row.set_attributes(self._collect_attributes(row.variable))
+        return row.attributes
+
+    # QAbstractItemModel interface
+
+    def index(
+        self, row: int, column: int, parent: QModelIndex = QModelIndex()
+    ) -> QModelIndex:
+        # The view asks for every top-level row after a reset: checked here rather than
+        # with hasIndex(), which calls back into rowCount() and columnCount()
+        if not 0 <= column < self.BASE_COLUMN_COUNT + len(self._languages):
+            return QModelIndex()
+        if not parent.isValid():
+            if 0 <= row < len(self._rows):
+                return self.createIndex(row, column)
+            return QModelIndex()
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        return self.createIndex(row, column, self._rows[parent.row()])
+
+    def parent(self, index: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
+        parent_row: Optional[_VariableRow] = index.internalPointer()
+        if parent_row is None:
+            return QModelIndex()
+        return self.createIndex(parent_row.row, 0)
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if not parent.isValid():
+            return len(self._rows)
+        if parent.internalPointer() is not None or parent.column() != 0:
+            return 0
+        return len(self._attributes(self._rows[parent.row()]))
+
+    def hasChildren(self, parent: QModelIndex = QModelIndex()) -> bool:
+        if not parent.isValid():
+            return bool(self._rows)
+        if parent.internalPointer() is not None or parent.column() != 0:
+            return False
+        return bool(self._attributes(self._rows[parent.row()]))
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return self.BASE_COLUMN_COUNT + len(self._languages)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if orientation != Qt.Orientation.Horizontal or section >= len(self._headers):
+            return None
+        if section < self.BASE_COLUMN_COUNT:
+            return (
+                self._headers[section] if role == Qt.ItemDataRole.DisplayRole else None
+            )
+
+        # Language columns show how much is translated, from the presence matrix
+        presence = self.fluent_api.presence
+        language = self._languages[section - self.BASE_COLUMN_COUNT]
+        if role == Qt.ItemDataRole.DisplayRole:
+            # Rounded down, so 100% means nothing is missing
+            percent = int(presence.coverage(language) * 100)
+            return f"{self._headers[section]} ({percent}%)"
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return (
+                f"{presence.count(language)} of {len(presence)} keys translated, "
+                f"{presence.missing_count(language)} missing"
+            )
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        column = index.column()
+        parent_row: Optional[_VariableRow] = index.internalPointer()
+
+        if parent_row is not None:
+            # Attribute row
+            attribute = self._attributes(parent_row)[index.row()]
+            if role != Qt.ItemDataRole.DisplayRole:
+                return None
+            if column == self.VARIABLE_COLUMN_INDEX:
+                return attribute
+            if column >= self.BASE_COLUMN_COUNT:
+                language = self._languages[column - self.BASE_COLUMN_COUNT]
+                translation = self._translation(parent_row.variable, language)
+                return extract_text(translation.attributes.get(attribute, ""))
+            return None
+
+        variable = self._rows[index.row()].variable
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == self.VARIABLE_COLUMN_INDEX:
+                return variable
+            if column >= self.BASE_COLUMN_COUNT:
+                language = self._languages[column - self.BASE_COLUMN_COUNT]
+                return extract_text(self._translation(variable, language).value)
+        elif role == Qt.ItemDataRole.DecorationRole:
+            if column == self.ICON_COLUMN_INDEX and any(
+                self._translation(variable, language).comment
+                for language in self._languages
+            ):
+                return self.comment_icon
+        elif role == Qt.ItemDataRole.ForegroundRole:
+            if column >= self.BASE_COLUMN_COUNT:
+                language = self._languages[column - self.BASE_COLUMN_COUNT]
+                if self._translation(variable, language).check:
+                    return self.highlight
+        return None
+
+    # Helpers for the table manager
+
+    def variable_index(self, variable: str, column: int = 0) -> QModelIndex:
+        """Returns the index of a variable row, invalid if it is not shown."""
+        row = self._row_of.get(variable)
+        if row is None:
+            return QModelIndex()
+        return self.createIndex(row.row, column)
+
+    def attribute_index(
+        self, variable: str, attribute: str, column: int = 0
+    ) -> QModelIndex:
+        """Returns the index of an attribute row, invalid if it is not shown."""
+        row = self._row_of.get(variable)
+        if row is None:
+            return QModelIndex()
+        self._attributes(row)
+        attribute_row = row.attribute_rows.get(attribute)
+        if attribute_row is None:
+            return QModelIndex()
+        return self.createIndex(attribute_row, column, row)
+
+    def has_variable(self, variable: str) -> bool:
+        return variable in self._row_of
+
+    def variables(self) -> List[str]:
+        """Returns the shown variables in row order."""
+        return [row.variable for row in self._rows]
+
+    def variable_name(self, index: QModelIndex) -> Optional[str]:
+        """Returns the variable of a top-level index."""
+        if not index.isValid() or index.internalPointer() is not None:
+            return None
+        return self._rows[index.row()].variable
+
+    def attribute_name(self, index: QModelIndex) -> Optional[str]:
+        """Returns the attribute of a child index."""
+        parent_row: Optional[_VariableRow] = (
+            index.internalPointer() if index.isValid() else None
+        )
+        if parent_row is None:
+            return None
+        return self._attributes(parent_row)[index.row()]
+
+    def refresh_cell(
+        self, variable: str, language: str, attribute: Optional[str] = None
+    ) -> None:
+        """
+        Notifies the view that a translation changed.
+
+        :param variable: The variable name.
+        :param language: The language code.
+        :param attribute: The attribute name, None for the variable value, comment or check.
+        """
+        column = self._language_columns.get(language)
+        if column is None:
+            return
+
+        if attribute:
+            index = self.attribute_index(variable, attribute, column)
+            if index.isValid():
+                self.dataChanged.emit(index, index, [Qt.ItemDataRole.DisplayRole])
+            return
+
+        index = self.variable_index(variable, column)
+        if not index.isValid():
+            return
+        self.dataChanged.emit(
+            index,
+            index,
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.ForegroundRole],
+        )
+        icon_index = index.siblingAtColumn(self.ICON_COLUMN_INDEX)
+        self.dataChanged.emit(icon_index, icon_index, [Qt.ItemDataRole.DecorationRole])
+
+    def refresh_coverage(self, language: str) -> None:
+        """Notifies the view that the translated share of a language changed."""
+        column = self._language_columns.get(language)
+        if column is not None:
+            self.headerDataChanged.emit(Qt.Orientation.Horizontal, column, column)
+
+    def refresh_variables(self, variables: Iterable[str]) -> None:
+        """
+        Notifies the view that whole variables changed, e.g. after their file was loaded.
+
+        :param variables: Names of the changed variables.
+        """
+        last_column = self.columnCount() - 1
+        if self._languages:
+            self.headerDataChanged.emit(
+                Qt.Orientation.Horizontal, self.BASE_COLUMN_COUNT, last_column
+            )
+        for variable in set(variables):
+            row = self._row_of.get(variable)
+            if row is None:
+                hidden_row = self._all_rows.get(variable)
+                if hidden_row is not None:
+                    hidden_row.attributes = None  # Collected again when shown
+                continue
+            parent = self.createIndex(row.row, 0)
+            self._refresh_children(row, parent)
+            self.dataChanged.emit(parent, parent.siblingAtColumn(last_column))
+
+    def _refresh_children(self, row: _VariableRow, parent: QModelIndex) -> None:
+        """Replaces the attribute rows of a variable if its attribute set changed."""
+        if row.attributes is None:
+            return  # Never shown, collected on first use
+        attributes = self._collect_attributes(row.variable)
+        if attributes == row.attributes:
+            if attributes:
+                self.dataChanged.emit(
+                    self.index(0, 0, parent),
+                    self.index(len(attributes) - 1, self.columnCount() - 1, parent),
+                )
+            return
+
+        if row.attributes:
+            self.beginRemoveRows(parent, 0, len(row.attributes) - 1)
+            row.set_attributes([])
+            self.endRemoveRows()
+        if attributes:
+            self.beginInsertRows(parent, 0, len(attributes) - 1)
+            row.set_attributes(attributes)
+            self.endInsertRows()
@@ -0,0 +1,63 @@
+import shutil
+import sys
+from pathlib import Path
+from typing import Callable, Optional
+
+import pytest
+
+ROOT_DIR = Path(__file__).resolve().parent.parent
+
+# The application imports itself as `src`, like when run from the repository root
+sys.path.insert(0, str(ROOT_DIR))
+
+from loguru import logger  # noqa: E402
+
+from src.fluent_api.FluentAPI import FluentAPI  # noqa: E402
+from src.utils.config_reader import get_config, CacheConfig, LoaderConfig  # noqa: E402
+
+logger.remove()
+
+
+@pytest.fixture
+def locales(tmp_path: Path) -> Path:
+    """A copy of example_locales that tests may edit and save."""
+    return shutil.copytree(ROOT_DIR / "example_locales", tmp_path / "locales")
+
+
+@pytest.fixture
+def cache_config(tmp_path: Path) -> CacheConfig:
+    """Parse cache settings with the database in the test's temporary folder."""
+    return get_config(CacheConfig, root_key="cache").model_copy(
+        update={"enabled": True, "name": str(tmp_path / "cache")}
+    )
+
+
+@pytest.fixture
+def load_api() -> Callable[..., FluentAPI]:
+    """
+    Loads a folder eagerly, without the parse cache unless one is given.
+
+    With start=False the files are not loaded, the test calls load() itself.
+    """
+
+    def load(
+        folder: Path,
+        cache_config: Optional[CacheConfig] = None,
+        start: bool = True,
+        **loader,
+    ) -> FluentAPI:
+        loader_config = get_config(LoaderConfig, root_key="loader").model_copy(
+            update={"lazy": False, "workers": 1, **loader}
+        )
+        if cache_config is None:
+            cache_config = get_config(CacheConfig, root_key="cache").model_copy(
+                update={"enabled": False}
+            )
+        return FluentAPI(
+            folder,
+            load=start,
+            loader_config=loader_config,
+            cache_config=cache_config,
+        )
+
+    return load
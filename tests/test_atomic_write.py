@@ -0,0 +1,86 @@
+import os
+import stat
+
+import pytest
+
+from src.fluent_api.utils.atomic_write import DEFAULT_MODE, write_text_atomic
+
+
+def mode(path) -> int:
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_replaces_the_contents(tmp_path):
+    target = tmp_path / "main.ftl"
+    target.write_text("old = Old\n", encoding="utf-8")
+
+    write_text_atomic(target, "new = New\n")
+
+    assert target.read_text(encoding="utf-8") == "new = New\n"
+    assert os.listdir(tmp_path) == ["main.ftl"]
+
+
+def test_keeps_newlines_as_given(tmp_path):
+    target = tmp_path / "main.ftl"
+
+    write_text_atomic(target, "a = A\r\nb = B\n")
+
+    assert target.read_bytes() == b"a = A\r\nb = B\n"
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+@pytest.mark.parametrize("file_mode", [0o644, 0o640, 0o600])
+def test_keeps_the_permissions(tmp_path, file_mode):
+    target = tmp_path / "main.ftl"
+    target.write_text("old = Old\n", encoding="utf-8")
+    os.chmod(target, file_mode)
+
+    write_text_atomic(target, "new = New\n")
+
+    assert mode(target) == file_mode
+
+
+@pytest.mark.skipif(os.name == "nt", reason="POSIX permissions")
+def test_new_files_get_the_umask_default(tmp_path):
+    target = tmp_path / "main.ftl"
+
+    write_text_atomic(target, "new = New\n")
+
+    assert mode(target) == DEFAULT_MODE
+
+
+def test_writes_through_symlinks(tmp_path):
+    real = tmp_path / "real.ftl"
+    real.write_text("old = Old\n", encoding="utf-8")
+    link = tmp_path / "link.ftl"
+    link.symlink_to(real)
+
+    write_text_atomic(link, "new = New\n")
+
+    assert link.is_symlink()
+    assert real.read_text(encoding="utf-8") == "new = New\n"
+
+
+def test_failed_write_keeps_the_original(tmp_path):
+    target = tmp_path / "main.ftl"
+    target.write_text("old = Old\n", encoding="utf-8")
+
+    with pytest.raises(TypeError):
+        write_text_atomic(target, None)  # type: ignore[arg-type]
+
+    assert target.read_text(encoding="utf-8") == "old = Old\n"
+    assert os.listdir(tmp_path) == ["main.ftl"]
+
+
+def test_saves_only_changed_files_atomically(locales, load_api):
+    fluent_api = load_api(locales)
+    os.chmod(locales / "ru" / "ru1.ftl", 0o640)
+
+    fluent_api.update("logout", "ru", "value", "Выйти")
+    report = fluent_api.save_all_files()
+
+    assert report.files_written == 1
+    assert "logout = Выйти\n" in (locales / "ru" / "ru1.ftl").read_text("utf-8")
+    if os.name != "nt":
+        assert mode(locales / "ru" / "ru1.ftl") == 0o640
+    assert sorted(os.listdir(locales / "ru")) == ["ru1.ftl"]
@@ -0,0 +1,140 @@
+import pytest
+
+from src.fluent_api.consistency import (
+    EMPTY_SIGNATURE,
+    ConsistencyChecker,
+    Inconsistency,
+    _parsed_signature,
+    check_project,
+    check_variable,
+    extract_signature,
+)
+
+# Texts with placeables; plain text never reaches the parser
+PATTERNS = [
+    "Hello, { $name }!",
+    "{ $a } and { $b }",
+    "You are using { -brand-name }.",
+    '{ -brand(case: "genitive") }',
+    'Today: { DATETIME($date, month: "long") }',
+    'Special: { "{" } and { "}" }',
+    '{ "quoted -> arrow" } { $x }',
+    "{ $count ->\n    [one] One { $what }\n   *[other] { $count } items\n}",
+    "{ $gender ->\n    [male] He\n    [female] She\n   *[other] { $count ->\n"
+    "        [one] One\n       *[other] Many\n    }\n}",
+    "{ NUMBER($n, minimumFractionDigits: 2) }",
+    "Nested { { $deep } }",
+]
+
+
+@pytest.mark.parametrize("text", PATTERNS)
+def test_extract_signature_matches_the_parser(text):
+    assert extract_signature(text) == _parsed_signature(text)
+
+
+def test_extract_signature_collects_every_kind():
+    signature = extract_signature(
+        "{ $count ->\n    [one] { -brand } { NUMBER($count) }\n   *[other] { $name }\n}"
+    )
+
+    assert signature.variables == {"count", "name"}
+    assert signature.terms == {"brand"}
+    assert signature.functions == {"NUMBER"}
+    assert signature.keys == {"one", "other"}
+
+
+@pytest.mark.parametrize("text", [None, "", "No placeables"])
+def test_plain_text_has_the_empty_signature(text):
+    assert extract_signature(text) is EMPTY_SIGNATURE
+
+
+def test_invalid_syntax_has_no_signature():
+    assert extract_signature("Broken { $name") is None
+
+
+def problems(source, translation, source_attributes=None, attributes=None):
+    return check_variable(
+        "key",
+        "en",
+        {
+            "en": (source, source_attributes or {}),
+            "de": (translation, attributes or {}),
+        },
+    )
+
+
+def test_same_placeables_are_consistent():
+    assert problems("Hello, { $name }!", "Hallo, { $name }!") == []
+
+
+def test_missing_and_extra_variables():
+    assert problems("{ $a } { $b }", "{ $a } { $c }") == [
+        Inconsistency("key", None, "de", "missing-variable", "b"),
+        Inconsistency("key", None, "de", "extra-variable", "c"),
+    ]
+
+
+def test_plural_categories_and_numbers_are_not_compared():
+    source = "{ $n ->\n    [one] One\n   *[other] Many\n}"
+    translation = "{ $n ->\n    [0] None\n    [few] Few\n   *[many] Many\n}"
+
+    assert problems(source, translation) == []
+
+
+def test_other_variant_keys_are_compared():
+    source = "{ $g ->\n    [male] He\n   *[female] She\n}"
+    translation = "{ $g ->\n    [male] Er\n   *[other] Sie\n}"
+
+    assert problems(source, translation) == [
+        Inconsistency("key", None, "de", "missing-key", "female"),
+    ]
+
+
+def test_attributes_are_compared_by_name():
+    found = problems(
+        "Value",
+        "Wert",
+        source_attributes={".title": "{ $name }"},
+        attributes={".title": "Titel", ".extra": "Mehr"},
+    )
+
+    assert found == [
+        Inconsistency("key", ".title", "de", "missing-variable", "name"),
+        Inconsistency("key", None, "de", "extra-attribute", ".extra"),
+    ]
+
+
+def test_invalid_translation_is_reported():
+    assert problems("{ $a }", "{ $a") == [
+        Inconsistency("key", None, "de", "invalid-syntax", ""),
+    ]
+
+
+def test_without_source_translation_nothing_is_reported():
+    assert check_variable("key", "en", {"de": ("{ $a }", {})}) == []
+
+
+def test_example_project_is_consistent(locales, load_api):
+    assert check_project(load_api(locales), "en") == []
+
+
+def test_checker_follows_edits_and_source_language(locales, load_api):
+    fluent_api = load_api(locales)
+    checker = ConsistencyChecker(fluent_api, "en")
+
+    fluent_api.update("welcome", "ru", "value", "Добро пожаловать!")
+
+    assert checker.variables("ru") == {"welcome"}
+    assert [problem.kind for problem in checker.problems("welcome")] == [
+        "missing-variable"
+    ]
+
+    checker.set_source_language("ru")
+    assert checker.variables("en") == {"welcome"}
+
+    fluent_api.update("welcome", "ru", "value", "Добро пожаловать, { $username }!")
+    assert len(checker) == 0
+
+    checker.close()
+    fluent_api.update("welcome", "ru", "value", "Пока")
+    assert len(checker) == 0
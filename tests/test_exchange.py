@@ -0,0 +1,132 @@
+import io
+
+import pytest
+
+from src.fluent_api import exchange
+
+
+@pytest.fixture
+def fluent_api(locales, load_api):
+    return load_api(locales)
+
+
+def export(fluent_api, write, *args) -> str:
+    file = io.StringIO(newline="")
+    write(exchange.iter_rows(fluent_api), file, *args)
+    return file.getvalue()
+
+
+def test_rows_cover_messages_terms_and_attributes(fluent_api):
+    rows = {row.key: row for row in exchange.iter_rows(fluent_api)}
+
+    assert rows["logout"].values == {"en": "Log out", "ru": "Выйти из системы"}
+    assert rows["-brand-name"].values["en"] == "Product X"
+    assert rows["login-input.placeholder"].values["en"] == "Enter your username"
+    assert rows["login-input.placeholder"].comments == {}
+
+
+@pytest.mark.parametrize(
+    "write, read, args",
+    [
+        (exchange.write_csv, exchange.read_csv, (["en", "ru"],)),
+        (exchange.write_jsonl, exchange.read_jsonl, ()),
+    ],
+)
+def test_round_trip_changes_nothing(fluent_api, write, read, args):
+    text = export(fluent_api, write, *args)
+
+    report = exchange.import_rows(fluent_api, read(io.StringIO(text, newline="")))
+
+    assert report.changed == 0
+    assert report.skipped == 0
+    assert not fluent_api.dirty
+
+
+def test_csv_import_applies_edited_cells(fluent_api):
+    text = export(fluent_api, exchange.write_csv, ["en", "ru"])
+    text = text.replace("Выйти из системы", "Выход")
+
+    report = exchange.import_rows(
+        fluent_api, exchange.read_csv(io.StringIO(text, newline=""))
+    )
+
+    assert report.changed == 1
+    assert fluent_api.translations["logout"]["ru"].value == "Выход"
+
+
+def test_jsonl_import_skips_unknown_keys_and_languages(fluent_api):
+    text = (
+        '{"key": "unknown", "values": {"en": "A"}}\n'
+        '{"key": "logout", "values": {"fr": "Déconnexion"}}\n'
+    )
+
+    report = exchange.import_rows(fluent_api, exchange.read_jsonl(io.StringIO(text)))
+
+    assert (report.rows, report.changed, report.skipped) == (2, 0, 2)
+
+
+def test_jsonl_import_reports_the_invalid_line(fluent_api):
+    with pytest.raises(ValueError, match="line 2"):
+        list(exchange.read_jsonl(io.StringIO('{"key": "a"}\nnot json\n')))
+
+
+def test_xliff_round_trip_keeps_values_and_checks(fluent_api):
+    fluent_api.update("logout", "ru", "check", True)
+    text = export(fluent_api, exchange.write_xliff, "en", "ru")
+
+    rows = {
+        row.key: row for row in exchange.read_xliff(io.BytesIO(text.encode("utf-8")))
+    }
+
+    assert rows["logout"].values == {"ru": "Выйти из системы"}
+    assert rows["logout"].checks == {"ru": True}
+    assert rows["welcome"].checks == {"ru": False}
+
+
+def test_xliff_approved_no_unchecks(fluent_api):
+    fluent_api.update("logout", "ru", "check", True)
+    text = export(fluent_api, exchange.write_xliff, "en", "ru")
+    text = text.replace('approved="yes"', 'approved="no"')
+
+    exchange.import_rows(fluent_api, exchange.read_xliff(io.BytesIO(text.encode())))
+
+    assert fluent_api.translations["logout"]["ru"].check is False
+
+
+def test_xliff_without_approved_keeps_checks(fluent_api):
+    fluent_api.update("logout", "ru", "check", True)
+    text = export(fluent_api, exchange.write_xliff, "en", "ru")
+    # Files from other tools often have no approved attribute at all
+    text = text.replace(' approved="yes"', "").replace(' approved="no"', "")
+
+    report = exchange.import_rows(
+        fluent_api, exchange.read_xliff(io.BytesIO(text.encode()))
+    )
+
+    assert report.changed == 0
+    assert fluent_api.translations["logout"]["ru"].check is True
+
+
+def test_xliff_without_target_language_is_rejected():
+    text = (
+        '<xliff version="1.2" xmlns="urn:oasis:names:tc:xliff:document:1.2">'
+        '<file original="x" source-language="en"><body/></file></xliff>'
+    )
+
+    with pytest.raises(ValueError, match="target-language"):
+        list(exchange.read_xliff(io.BytesIO(text.encode())))
+
+
+def test_import_adds_translations_missing_in_a_language(tmp_path, load_api):
+    for language, text in (("en", "a = A\nb = B\n"), ("de", "a = A-de\n")):
+        (tmp_path / language).mkdir()
+        (tmp_path / language / "main.ftl").write_text(text, encoding="utf-8")
+    fluent_api = load_api(tmp_path)
+
+    exchange.import_rows(
+        fluent_api,
+        exchange.read_jsonl(io.StringIO('{"key": "b", "values": {"de": "B-de"}}\n')),
+    )
+    fluent_api.save_all_files()
+
+    assert "b = B-de\n" in (tmp_path / "de" / "main.ftl").read_text("utf-8")
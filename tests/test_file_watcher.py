@@ -0,0 +1,68 @@
+import time
+from pathlib import Path
+from typing import List
+
+import pytest
+
+QtCore = pytest.importorskip("PyQt6.QtCore")
+
+from src.widgets.file_watcher import FtlFileWatcher  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+
+@pytest.fixture
+def watcher(app, locales, monkeypatch):
+    monkeypatch.setattr(FtlFileWatcher, "DELAY", 20)
+    watcher = FtlFileWatcher(locales)
+    yield watcher
+    watcher.deleteLater()
+
+
+def wait_for_changes(app, watcher: FtlFileWatcher) -> List[Path]:
+    """Collects the reported files until none are reported for a while."""
+    reported: List[Path] = []
+    watcher.files_changed.connect(reported.extend)
+    deadline = time.monotonic() + 5
+    quiet_since, count = time.monotonic(), 0
+    while time.monotonic() < deadline:
+        app.processEvents()
+        if len(reported) != count:
+            quiet_since, count = time.monotonic(), len(reported)
+        elif reported and time.monotonic() - quiet_since > 0.2:
+            break
+        time.sleep(0.01)
+    return reported
+
+
+def test_reports_a_changed_file(app, watcher, locales):
+    ftl_file = locales / "ru" / "ru1.ftl"
+    ftl_file.write_text(ftl_file.read_text("utf-8") + "new = Новое\n", encoding="utf-8")
+
+    assert wait_for_changes(app, watcher) == [ftl_file]
+
+
+def test_reports_added_and_deleted_files(app, watcher, locales):
+    (locales / "en" / "en1.ftl").unlink()
+    added = locales / "de" / "main.ftl"
+    added.parent.mkdir()
+    added.write_text("hello = Hallo\n", encoding="utf-8")
+
+    assert sorted(wait_for_changes(app, watcher)) == [
+        added,
+        locales / "en" / "en1.ftl",
+    ]
+
+
+def test_reported_deletion_reloads(app, watcher, locales, load_api):
+    fluent_api = load_api(locales)
+    (locales / "ru" / "ru1.ftl").unlink()
+
+    for ftl_file in wait_for_changes(app, watcher):
+        fluent_api.reload_file(ftl_file.relative_to(locales))
+
+    assert all("ru" not in languages for languages in fluent_api.translations.values())
+    assert fluent_api.presence.count("ru") == 0
@@ -0,0 +1,47 @@
+import pytest
+
+from src.fluent_api.filter_index import FilterIndex
+
+
+@pytest.fixture
+def fluent_api(locales, load_api):
+    return load_api(locales)
+
+
+@pytest.fixture
+def index(fluent_api):
+    index = FilterIndex(fluent_api)
+    yield index
+    index.close()
+
+
+def test_initial_sets(fluent_api, index):
+    assert index.variables("missing", "en") == set()
+    assert index.variables("unchecked", "ru") == set(fluent_api.translations)
+    assert "logout" in index.variables("commented", "en")
+    assert index.variables("changed", "en") == set()
+
+
+def test_follows_edits(index, fluent_api):
+    fluent_api.update("logout", "ru", "value", "")
+    fluent_api.update("logout", "ru", "check", True)
+    fluent_api.update("welcome", "ru", "comment", "")
+
+    assert index.variables("missing", "ru") == {"logout"}
+    assert "logout" not in index.variables("unchecked", "ru")
+    assert "welcome" not in index.variables("commented", "ru")
+    assert index.variables("changed", "ru") == {"logout", "welcome"}
+    assert index.variables("changed", "en") == set()
+
+
+def test_returned_sets_are_copies(index, fluent_api):
+    changed = index.variables("changed", "ru")
+
+    fluent_api.update("logout", "ru", "check", True)
+
+    assert changed == set()
+
+
+def test_unknown_filter_is_rejected(index):
+    with pytest.raises(ValueError):
+        index.variables("translated", "en")
@@ -0,0 +1,85 @@
+from pathlib import Path
+
+import pytest
+
+FILES = {
+    "a.ftl": "first = First\nsecond = Second\nthird = Third\n",
+    "b.ftl": "other = Other\n",
+}
+
+
+def make_project(root: Path) -> Path:
+    for language in ("en", "de"):
+        for name, text in FILES.items():
+            (root / language).mkdir(parents=True, exist_ok=True)
+            (root / language / name).write_text(text, encoding="utf-8")
+    return root
+
+
+def test_only_files_with_changes_are_written(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    # Changed on disk behind the editor's back: a written file would lose this
+    for path in locales.rglob("*.ftl"):
+        path.write_text(path.read_text("utf-8") + "# untouched\n", encoding="utf-8")
+
+    fluent_api.update("second", "de", "value", "Zweite")
+    report = fluent_api.save_all_files()
+
+    assert report.files_written == 1
+    assert (locales / "de" / "a.ftl").read_text("utf-8") == (
+        "first = First\nsecond = Zweite\nthird = Third\n"
+    )
+    for path in locales.rglob("*.ftl"):
+        if path != locales / "de" / "a.ftl":
+            assert path.read_text("utf-8").endswith("# untouched\n")
+    assert fluent_api.save_all_files().files_written == 0
+
+
+def test_files_keep_their_variables_in_file_order(tmp_path, load_api):
+    for language, text in (
+        ("en", "first = A\nsecond = B\nthird = C\n"),
+        ("de", "third = C\nfirst = A\n"),
+    ):
+        (tmp_path / language).mkdir()
+        (tmp_path / language / "main.ftl").write_text(text, encoding="utf-8")
+    fluent_api = load_api(tmp_path)
+
+    de_file = fluent_api.files[Path("de", "main.ftl")]
+    assert de_file.variables == ["third", "first"]
+
+    # A translation added to the file goes after the existing ones
+    fluent_api.update("second", "de", "value", "B-de")
+    fluent_api.update("first", "de", "value", "A-de")
+    fluent_api.save_all_files()
+
+    assert de_file.variables == ["third", "first", "second"]
+    assert (tmp_path / "de" / "main.ftl").read_text("utf-8") == (
+        "third = C\nfirst = A-de\n\nsecond = B-de\n"
+    )
+
+
+@pytest.mark.parametrize("order", [("a.ftl", "b.ftl"), ("b.ftl", "a.ftl")])
+def test_variable_moved_to_another_file_is_saved_there(tmp_path, load_api, order):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    (locales / "en" / "a.ftl").write_text(
+        "first = First\nthird = Third\n", encoding="utf-8"
+    )
+    (locales / "en" / "b.ftl").write_text(
+        "other = Other\nsecond = Second\n", encoding="utf-8"
+    )
+    for name in order:
+        fluent_api.reload_file(Path("en", name))
+
+    fluent_api.update("second", "en", "value", "Moved")
+    report = fluent_api.save_all_files()
+
+    assert report.files_written == 1
+    assert fluent_api.translations["second"]["en"].filepath == Path("en", "b.ftl")
+    assert (locales / "en" / "a.ftl").read_text("utf-8") == (
+        "first = First\nthird = Third\n"
+    )
+    assert (locales / "en" / "b.ftl").read_text("utf-8") == (
+        "other = Other\nsecond = Moved\n"
+    )
@@ -0,0 +1,131 @@
+from pathlib import Path
+
+FILES = {
+    "en": "hello = Hello\nbye = Bye\nonly-en = Only\n",
+    "de": "hello = Hallo\nbye = Tschuss\n",
+}
+
+
+def make_project(root: Path) -> Path:
+    for language, text in FILES.items():
+        (root / language).mkdir(parents=True)
+        (root / language / "main.ftl").write_text(text, encoding="utf-8")
+    return root
+
+
+def test_new_translation_in_a_pending_file_keeps_its_entries(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+
+    fluent_api.update("only-en", "de", "value", "Nur")
+    fluent_api.save_all_files()
+
+    assert (locales / "de" / "main.ftl").read_text("utf-8") == (
+        "hello = Hallo\nbye = Tschuss\n\nonly-en = Nur\n"
+    )
+
+
+def test_files_are_scanned_but_not_parsed(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+
+    assert set(fluent_api.pending_files) == {
+        Path("en", "main.ftl"),
+        Path("de", "main.ftl"),
+    }
+    assert list(fluent_api.translations) == ["hello", "bye", "only-en"]
+    assert fluent_api.translations["hello"] == {}
+    # Until the file is parsed a scanned message counts as translated
+    assert fluent_api.presence.present("hello", "de")
+
+
+def test_ensure_loaded_parses_only_the_files_of_the_variable(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+
+    fluent_api.ensure_loaded("only-en")
+
+    assert fluent_api.pending_files == [Path("de", "main.ftl")]
+    assert fluent_api.translations["only-en"]["en"].value == "Only"
+    assert "de" not in fluent_api.translations["hello"]
+    assert fluent_api.get_translation("hello", "de").value == "Hallo"
+    assert fluent_api.pending_files == []
+
+
+def test_load_pending_reports_the_file_once(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+    loaded, changed = [], []
+    fluent_api.on_file_loaded = lambda filepath, variables: loaded.append(filepath)
+    fluent_api.change_listeners.append(
+        lambda variables: changed.append(list(variables))
+    )
+
+    assert fluent_api.load_pending(Path("de", "main.ftl")) == ["hello", "bye"]
+    assert fluent_api.load_pending(Path("de", "main.ftl")) == []
+
+    assert loaded == [Path("de", "main.ftl")]
+    assert changed == [["hello", "bye"]]
+    assert fluent_api.files[Path("de", "main.ftl")].variables == ["hello", "bye"]
+
+
+def test_save_leaves_pending_files_alone(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+    (locales / "de" / "main.ftl").write_text("# edited elsewhere\n", encoding="utf-8")
+
+    fluent_api.update("only-en", "en", "value", "Only here")
+    report = fluent_api.save_all_files()
+
+    assert report.files_written == 1
+    assert fluent_api.pending_files == [Path("de", "main.ftl")]
+    assert (locales / "en" / "main.ftl").read_text("utf-8") == (
+        "hello = Hello\nbye = Bye\nonly-en = Only here\n"
+    )
+    assert (locales / "de" / "main.ftl").read_text("utf-8") == "# edited elsewhere\n"
+
+
+def test_save_to_another_folder_parses_pending_files(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales, lazy=True)
+
+    report = fluent_api.save_all_files(str(tmp_path / "copy"))
+
+    assert report.files_written == 2
+    assert fluent_api.pending_files == []
+    for language, text in FILES.items():
+        assert (tmp_path / "copy" / language / "main.ftl").read_text("utf-8") == text
+
+
+def test_edits_made_while_prefetching_are_kept(tmp_path, load_api):
+    locales = tmp_path / "locales"
+    for language in ("en", "de"):
+        (locales / language).mkdir(parents=True)
+        for file_index in range(40):
+            (locales / language / f"file{file_index}.ftl").write_text(
+                "".join(f"key-{file_index}-{key} = Text\n" for key in range(20)),
+                encoding="utf-8",
+            )
+    fluent_api = load_api(locales, lazy=True)
+
+    fluent_api.start_prefetch()
+    try:
+        # Edits load the files they need while the prefetcher loads the others
+        for file_index in reversed(range(40)):
+            fluent_api.update(
+                f"key-{file_index}-0", "de", "value", f"Edited {file_index}"
+            )
+        fluent_api.load_all()
+    finally:
+        fluent_api.stop_prefetch()
+
+    assert fluent_api.pending_files == []
+    assert len(fluent_api.translations) == 800
+    for file_index in range(40):
+        translation = fluent_api.translations[f"key-{file_index}-0"]["de"]
+        assert translation.value == f"Edited {file_index}"
+        assert (
+            fluent_api.files[translation.filepath].variables[0] == f"key-{file_index}-0"
+        )
+    assert len(fluent_api.dirty) == 40
+    assert fluent_api.save_all_files().files_written == 40
@@ -0,0 +1,60 @@
+from pathlib import Path
+
+import pytest
+
+from src.fluent_api.FluentAPI import LoadCancelled
+
+
+def test_progress_is_reported_per_file_and_locale(locales, load_api):
+    fluent_api = load_api(locales, start=False)
+    progress, loaded_locales = [], []
+    fluent_api.on_load_progress = lambda *args: progress.append(args)
+    fluent_api.on_locale_loaded = loaded_locales.append
+
+    fluent_api.load()
+
+    assert [(done, total) for done, total, _ in progress] == [(1, 2), (2, 2)]
+    assert {filepath for _, _, filepath in progress} == {
+        Path("en", "en1.ftl"),
+        Path("ru", "ru1.ftl"),
+    }
+    assert sorted(loaded_locales) == ["en", "ru"]
+
+
+def test_cancel_stops_before_the_next_file(locales, load_api):
+    fluent_api = load_api(locales, start=False)
+    fluent_api.on_load_progress = lambda done, total, filepath: fluent_api.cancel_load()
+
+    with pytest.raises(LoadCancelled):
+        fluent_api.load()
+
+    assert len(fluent_api.files) == 1
+    assert len(fluent_api.get_languages()) == 1
+
+
+def test_cancel_before_load_is_forgotten(locales, load_api):
+    fluent_api = load_api(locales, start=False)
+    fluent_api.cancel_load()
+
+    fluent_api.load()
+
+    assert sorted(fluent_api.get_languages()) == ["en", "ru"]
+
+
+def test_project_loader_reports_cancellation(locales, load_api):
+    QtCore = pytest.importorskip("PyQt6.QtCore")
+    from src.widgets.background import ProjectLoader
+
+    QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    fluent_api = load_api(locales, start=False)
+    loader = ProjectLoader(fluent_api)
+    events = []
+    loader.signals.progress.connect(lambda done, total, path: events.append(done))
+    loader.signals.progress.connect(lambda *args: loader.cancel())
+    loader.signals.cancelled.connect(lambda: events.append("cancelled"))
+    loader.signals.finished.connect(lambda: events.append("finished"))
+
+    loader.run()
+
+    assert events == [1, "cancelled"]
+    assert fluent_api.on_load_progress is None
@@ -0,0 +1,117 @@
+import os
+from pathlib import Path
+
+from src.fluent_api.base_type.translations import Translation
+from src.fluent_api.parse_cache import ParseCache
+
+
+def write(path: Path, text: str) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text, encoding="utf-8")
+    return path
+
+
+def test_put_after_miss_is_returned_on_next_get(tmp_path):
+    ftl_file = write(tmp_path / "en" / "main.ftl", "hello = Hello\n")
+    cache = ParseCache(tmp_path / "cache.db")
+
+    assert cache.get(ftl_file) is None
+    cache.put(ftl_file, [("hello", Translation("Hello"))])
+
+    entries = cache.get(ftl_file)
+    assert [(name, translation.value) for name, translation in entries] == [
+        ("hello", "Hello")
+    ]
+    assert (cache.hits, cache.misses) == (1, 1)
+    cache.close()
+
+
+def test_put_without_a_miss_is_ignored(tmp_path):
+    ftl_file = write(tmp_path / "en" / "main.ftl", "hello = Hello\n")
+    cache = ParseCache(tmp_path / "cache.db")
+
+    cache.put(ftl_file, [("hello", Translation("Hello"))])
+
+    assert cache.get(ftl_file) is None
+    cache.close()
+
+
+def test_changed_content_is_a_miss(tmp_path):
+    ftl_file = write(tmp_path / "en" / "main.ftl", "hello = Hello\n")
+    cache = ParseCache(tmp_path / "cache.db")
+    cache.get(ftl_file)
+    cache.put(ftl_file, [("hello", Translation("Hello"))])
+
+    write(ftl_file, "hello = Hi there\n")
+
+    assert cache.get(ftl_file) is None
+    cache.close()
+
+
+def test_touched_but_unchanged_file_is_a_hit(tmp_path):
+    ftl_file = write(tmp_path / "en" / "main.ftl", "hello = Hello\n")
+    cache = ParseCache(tmp_path / "cache.db")
+    cache.get(ftl_file)
+    cache.put(ftl_file, [("hello", Translation("Hello"))])
+
+    stat = ftl_file.stat()
+    os.utime(ftl_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert cache.get(ftl_file) is not None
+    cache.close()
+
+
+def test_other_salt_clears_the_cache(tmp_path):
+    ftl_file = write(tmp_path / "en" / "main.ftl", "hello = Hello\n")
+    cache = ParseCache(tmp_path / "cache.db", salt="check=check")
+    cache.get(ftl_file)
+    cache.put(ftl_file, [("hello", Translation("Hello"))])
+    cache.close()
+
+    cache = ParseCache(tmp_path / "cache.db", salt="check=done")
+
+    assert cache.get(ftl_file) is None
+    cache.close()
+
+
+def test_prune_removes_deleted_files_under_the_root(tmp_path):
+    kept = write(tmp_path / "locales" / "en" / "kept.ftl", "a = A\n")
+    deleted = write(tmp_path / "locales" / "en" / "deleted.ftl", "b = B\n")
+    # Not under the root, only its name starts with the root's
+    sibling = write(tmp_path / "locales-old" / "en" / "other.ftl", "c = C\n")
+    cache = ParseCache(tmp_path / "cache.db")
+    for ftl_file, name in ((kept, "a"), (deleted, "b"), (sibling, "c")):
+        cache.get(ftl_file)
+        cache.put(ftl_file, [(name, Translation(name.upper()))])
+
+    deleted.unlink()
+    cache.prune(tmp_path / "locales", [kept])
+
+    rows = cache.connection.execute("SELECT path FROM files").fetchall()
+    assert set(rows) == {(str(kept.resolve()),), (str(sibling.resolve()),)}
+    cache.close()
+
+
+def test_cached_files_load_like_parsed_ones(locales, cache_config, load_api):
+    parsed = load_api(locales, cache_config=cache_config)
+    cached = load_api(locales, cache_config=cache_config)
+
+    assert cached.translations.keys() == parsed.translations.keys()
+    for variable, languages in parsed.translations.items():
+        for language, translation in languages.items():
+            assert cached.translations[variable][language] == translation
+
+
+def test_cache_hits_get_paths_relative_to_the_loaded_root(
+    tmp_path, cache_config, load_api
+):
+    # The same file reached through two roots: <a>/en/sub/main.ftl and <b>/en/main.ftl
+    write(tmp_path / "a" / "en" / "sub" / "main.ftl", "hello = Hello\n")
+    (tmp_path / "b").mkdir()
+    (tmp_path / "b" / "en").symlink_to(tmp_path / "a" / "en" / "sub")
+
+    load_api(tmp_path / "a", cache_config=cache_config)
+    fluent_api = load_api(tmp_path / "b", cache_config=cache_config)
+
+    translation = fluent_api.translations["hello"]["en"]
+    assert translation.filepath == Path("en", "main.ftl")
@@ -0,0 +1,83 @@
+import pytest
+
+from src.fluent_api.FluentAPI import FluentAPI
+from src.fluent_api.utils.lru_cache import CacheStats, LRUCache
+
+# Texts the parser returns as they are, taken by the fast path
+PLAIN = ["Hello", "Привет, мир!", "50% off", "x = y", "#hash", "a [b] c", "a\\b"]
+# Texts that have to be parsed: placeables, special first characters, surrounding
+# whitespace, several lines
+PARSED = ["{ $x } items", "[key]", "*star", ".dot", " lead", "trail ", "a\nb"]
+
+
+@pytest.fixture(autouse=True)
+def empty_memos():
+    FluentAPI.AST_MEMO.clear()
+    FluentAPI.BEAUTIFUL_MEMO.clear()
+    yield
+    FluentAPI.AST_MEMO.clear()
+    FluentAPI.BEAUTIFUL_MEMO.clear()
+
+
+def test_lru_cache_evicts_the_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert (cache.get("a"), cache.get("c")) == (1, 3)
+    assert cache.stats() == CacheStats(hits=3, misses=1, size=2, maxsize=2)
+
+
+def test_lru_cache_resize_drops_the_oldest_items():
+    cache = LRUCache(3)
+    for key in "abc":
+        cache.put(key, key.upper())
+
+    cache.resize(1)
+    assert cache.get("c") == "C"
+    assert cache.get("a") is None
+
+    cache.resize(0)
+    cache.put("d", "D")
+    assert cache.stats().size == 0
+
+
+@pytest.mark.parametrize("text", PLAIN + PARSED)
+def test_fast_path_matches_only_text_the_parser_keeps(text):
+    assert bool(FluentAPI.RE_PLAIN_TEXT.fullmatch(text)) == (text in PLAIN)
+
+
+@pytest.mark.parametrize("text", PLAIN + PARSED)
+def test_memoized_results_match_parsing(text):
+    expected = FluentAPI._elements_to_beautiful_str(text)
+
+    assert FluentAPI.elements_to_beautiful_str(text) == expected
+    # Second call: from the memo, or from the fast path again
+    assert FluentAPI.elements_to_beautiful_str(text) == expected
+
+
+def test_plain_text_skips_the_memos():
+    FluentAPI.elements_to_beautiful_str("Plain text")
+    FluentAPI.parse_str_to_ast("Plain text")
+
+    assert FluentAPI.memo_stats()["elements_to_beautiful_str"].size == 0
+    assert FluentAPI.memo_stats()["parse_str_to_ast"].size == 0
+
+
+def test_repeated_values_are_parsed_once():
+    for _ in range(3):
+        FluentAPI.elements_to_beautiful_str("Hello, { $name }!")
+
+    stats = FluentAPI.memo_stats()["elements_to_beautiful_str"]
+    assert (stats.hits, stats.misses) == (2, 1)
+
+
+def test_memoized_elements_are_returned_in_a_new_list():
+    elements = FluentAPI.parse_str_to_ast("{ $a } and { $b }")
+    elements.clear()
+
+    assert len(FluentAPI.parse_str_to_ast("{ $a } and { $b }")) == 3
@@ -0,0 +1,85 @@
+import pytest
+
+from src.fluent_api.presence import PresenceMatrix
+
+
+@pytest.fixture
+def matrix() -> PresenceMatrix:
+    matrix = PresenceMatrix()
+    for variable, languages in (
+        ("a", {"en": True, "de": True}),
+        ("b", {"en": True, "de": False}),
+        ("c", {"en": False, "de": True}),
+    ):
+        for language, present in languages.items():
+            matrix.set(variable, language, present)
+    return matrix
+
+
+def test_counts_and_coverage(matrix):
+    assert len(matrix) == 3
+    assert matrix.count("en") == 2
+    assert matrix.missing_count("de") == 1
+    assert matrix.coverage("en") == pytest.approx(2 / 3)
+    assert matrix.coverage("fr") == 0.0
+
+
+def test_empty_matrix_is_fully_covered():
+    assert PresenceMatrix().coverage("en") == 1.0
+
+
+def test_missing_and_orphans_keep_insertion_order(matrix):
+    assert matrix.missing("de") == ["b"]
+    assert matrix.missing("fr") == ["a", "b", "c"]
+    assert matrix.orphans("en") == ["c"]
+
+
+def test_set_reports_whether_the_count_changed(matrix):
+    assert matrix.set("a", "en", True) is False
+    assert matrix.set("a", "en", False) is True
+    assert matrix.set("a", "en", False) is False
+    assert matrix.set("d", "en", False) is False
+    assert matrix.set("d", "en", True) is True
+    assert matrix.count("en") == 2
+
+
+def test_remove_drops_the_variable_from_every_count(matrix):
+    matrix.remove("a")
+    matrix.remove("a")
+
+    assert len(matrix) == 2
+    assert (matrix.count("en"), matrix.count("de")) == (1, 1)
+    assert not matrix.present("a", "en")
+    assert matrix.missing("en") == ["c"]
+
+    # A removed variable added again gets its row back, empty
+    matrix.set("a", "de", True)
+    assert matrix.present("a", "de") and not matrix.present("a", "en")
+    assert len(matrix) == 3
+
+
+def test_grows_past_the_initial_rows():
+    matrix = PresenceMatrix()
+    for row in range(5000):
+        matrix.set(f"key-{row}", "en", row % 3 != 0)
+    matrix.set("late", "de", True)
+
+    assert matrix.count("en") == 3333
+    assert matrix.missing("en")[:3] == ["key-0", "key-3", "key-6"]
+    assert len(matrix.missing("de")) == 5000
+
+
+def test_follows_loading_and_edits(locales, load_api):
+    fluent_api = load_api(locales)
+    presence = fluent_api.presence
+    assert presence.count("ru") == len(presence) == len(fluent_api.translations)
+
+    changed_languages = []
+    fluent_api.on_coverage_changed = changed_languages.append
+
+    fluent_api.update("logout", "ru", "value", "")
+    fluent_api.update("logout", "ru", "comment", "Later")
+    fluent_api.update("logout", "ru", "value", "Выйти")
+
+    assert changed_languages == ["ru", "ru"]
+    assert presence.missing("ru") == []
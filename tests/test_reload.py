@@ -0,0 +1,116 @@
+from pathlib import Path
+
+FILES = {
+    "en": "hello = Hello\nbye = Bye\nonly-en = Only\n",
+    "de": "hello = Hallo\nbye = Tschuss\nonly-de = Nur\n",
+}
+DE_FILE = Path("de", "main.ftl")
+
+
+def make_project(root: Path) -> Path:
+    for language, text in FILES.items():
+        (root / language).mkdir(parents=True)
+        (root / language / "main.ftl").write_text(text, encoding="utf-8")
+    return root
+
+
+def test_external_changes_are_merged(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    (locales / DE_FILE).write_text(
+        "hello = Hallo\nbye = Auf Wiedersehen\nnew = Neu\n", encoding="utf-8"
+    )
+
+    report = fluent_api.reload_file(DE_FILE)
+
+    assert report.changed == {"bye", "new"}
+    assert report.added == {"new"}
+    assert report.removed == {"only-de"}
+    assert report.conflicts == []
+    assert fluent_api.translations["bye"]["de"].value == "Auf Wiedersehen"
+    assert "only-de" not in fluent_api.translations
+    assert fluent_api.files[DE_FILE].variables == ["hello", "bye", "new"]
+    assert not fluent_api.dirty
+
+
+def test_unsaved_edits_win_over_conflicting_changes(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    fluent_api.update("bye", "de", "value", "Ciao")
+    fluent_api.update("only-de", "de", "value", "Nur hier")
+    (locales / DE_FILE).write_text(
+        "hello = Servus\nbye = Auf Wiedersehen\n", encoding="utf-8"
+    )
+
+    report = fluent_api.reload_file(DE_FILE)
+
+    assert report.changed == {"hello"}
+    assert sorted(report.conflicts) == [("bye", "de"), ("only-de", "de")]
+    assert fluent_api.translations["bye"]["de"].value == "Ciao"
+    assert fluent_api.dirty == {("bye", "de"), ("only-de", "de")}
+
+    fluent_api.save_all_files()
+
+    assert (locales / DE_FILE).read_text("utf-8") == (
+        "hello = Servus\nbye = Ciao\n\nonly-de = Nur hier\n"
+    )
+
+
+def test_deleted_file_removes_its_translations(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    (locales / DE_FILE).unlink()
+
+    report = fluent_api.reload_file(DE_FILE)
+
+    assert report.changed == {"hello", "bye"}
+    assert report.removed == {"only-de"}
+    assert "de" not in fluent_api.translations["hello"]
+    assert not fluent_api.presence.present("hello", "de")
+    assert DE_FILE not in fluent_api.files
+    # The language stays, with nothing translated
+    assert "de" in fluent_api.get_languages()
+
+
+def test_deleted_file_with_unsaved_edits_is_written_again(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    fluent_api.update("bye", "de", "value", "Ciao")
+    (locales / DE_FILE).unlink()
+
+    report = fluent_api.reload_file(DE_FILE)
+
+    assert report.conflicts == [("bye", "de")]
+    assert fluent_api.files[DE_FILE].variables == ["bye"]
+
+    fluent_api.save_all_files()
+
+    assert (locales / DE_FILE).read_text("utf-8") == "bye = Ciao\n"
+
+
+def test_conflicting_edit_is_written_at_the_entry_s_new_place(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    fluent_api.update("bye", "de", "value", "Ciao")
+    (locales / DE_FILE).write_text(
+        "bye = Auf Wiedersehen\nhello = Hallo\n", encoding="utf-8"
+    )
+
+    fluent_api.reload_file(DE_FILE)
+    fluent_api.save_all_files()
+
+    assert (locales / DE_FILE).read_text("utf-8") == "bye = Ciao\nhello = Hallo\n"
+
+
+def test_own_writes_are_told_from_external_changes(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    de_file = locales / DE_FILE
+    assert not fluent_api.is_own_write(de_file)
+
+    fluent_api.update("bye", "de", "value", "Ciao")
+    fluent_api.save_all_files()
+    assert fluent_api.is_own_write(de_file)
+
+    de_file.write_text(de_file.read_text("utf-8") + "extra = Mehr\n", encoding="utf-8")
+    assert not fluent_api.is_own_write(de_file)
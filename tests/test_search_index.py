@@ -0,0 +1,56 @@
+import pytest
+
+from src.fluent_api.search_index import SearchIndex
+
+
+@pytest.fixture
+def fluent_api(locales, load_api):
+    return load_api(locales)
+
+
+@pytest.fixture
+def index(fluent_api):
+    index = SearchIndex(fluent_api)
+    yield index
+    index.close()
+
+
+def test_finds_names_values_attributes_and_comments(index):
+    assert index.search("logout") == {"logout"}
+    assert index.search("выйти") == {"logout"}
+    assert index.search("placeholder") == {"login-input"}
+    assert index.search("explaining") == {"logout"}
+
+
+def test_matches_substrings_of_words_case_insensitively(index):
+    assert index.search("WELC") == {"welcome"}
+    assert index.search("notif") == {"notifications"}
+
+
+def test_whole_query_must_match(index):
+    assert index.search("new notifications") == {"notifications"}
+    assert index.search("notifications new") == set()
+
+
+def test_empty_query_matches_everything(index):
+    assert index.search("   ") is None
+
+
+def test_follows_edits(fluent_api, index):
+    assert index.search("zyxw") == set()
+
+    fluent_api.update("logout", "en", "value", "Zyxwv")
+
+    assert index.search("zyxw") == {"logout"}
+    assert index.search("log out") == set()
+    # Matching words of a query are cached while typing, edits drop them
+    fluent_api.update("logout", "en", "value", "Log out")
+    assert index.search("zyxw") == set()
+
+
+def test_close_stops_following_edits(fluent_api, index):
+    index.close()
+
+    fluent_api.update("logout", "en", "value", "Zyxwv")
+
+    assert index.search("zyxw") == set()
@@ -0,0 +1,134 @@
+from pathlib import Path
+
+SOURCE = """\
+### Resource comment
+
+## Group comment
+
+# Comment of hello
+hello   =   Hello,  { $name }!
+
+standalone = Kept as written
+    .title = Title
+
+oops this is junk
+
+-brand = Fluentus
+bye = Bye
+"""
+
+
+def make_project(root: Path) -> Path:
+    for language in ("en", "de"):
+        (root / language).mkdir(parents=True)
+        (root / language / "main.ftl").write_text(SOURCE, encoding="utf-8")
+    return root
+
+
+def test_unchanged_files_are_written_back_byte_for_byte(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+
+    fluent_api.save_all_files(str(tmp_path / "copy"))
+
+    for language in ("en", "de"):
+        written = (tmp_path / "copy" / language / "main.ftl").read_text("utf-8")
+        assert written == SOURCE
+
+
+def test_edits_are_spliced_into_the_file_text(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+
+    fluent_api.update("bye", "de", "value", "Tschüss")
+    fluent_api.save_all_files()
+
+    assert (locales / "de" / "main.ftl").read_text("utf-8") == SOURCE.replace(
+        "bye = Bye", "bye = Tschüss"
+    )
+    assert (locales / "en" / "main.ftl").read_text("utf-8") == SOURCE
+
+
+def test_edited_entry_keeps_its_comment_and_surroundings(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+
+    fluent_api.update("hello", "de", "value", "Hallo, { $name }!")
+    fluent_api.save_all_files()
+
+    text = (locales / "de" / "main.ftl").read_text("utf-8")
+    assert "# Comment of hello\nhello = Hallo, { $name }!\n" in text
+    assert text.startswith("### Resource comment\n\n## Group comment\n\n")
+    assert "\noops this is junk\n" in text
+    assert text.endswith("-brand = Fluentus\nbye = Bye\n")
+
+
+def test_saved_files_load_back_with_the_edits(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+    fluent_api.update("standalone", "de", "value", "Neu", attribute=".title")
+    fluent_api.update("bye", "de", "comment", "Farewell")
+    fluent_api.save_all_files()
+
+    reloaded = load_api(locales)
+
+    assert reloaded.translations["standalone"]["de"].attributes == {".title": "Neu"}
+    assert reloaded.translations["bye"]["de"].comment == "Farewell"
+    assert (
+        reloaded.translations["hello"]["de"] == fluent_api.translations["hello"]["de"]
+    )
+
+
+def test_repeated_edits_and_saves_change_only_the_edited_entry(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    fluent_api = load_api(locales)
+
+    for run in range(3):
+        assert fluent_api.update("bye", "de", "value", f"Bye {run}")
+        fluent_api.save_all_files()
+
+    assert (locales / "de" / "main.ftl").read_text("utf-8") == SOURCE.replace(
+        "bye = Bye", "bye = Bye 2"
+    )
+
+
+def test_earlier_definitions_of_a_duplicate_id_are_kept_as_text(tmp_path, load_api):
+    source = "# first\na = One\nb = B\n# second\na = Two\n"
+    (tmp_path / "en").mkdir()
+    (tmp_path / "en" / "main.ftl").write_text(source, encoding="utf-8")
+    fluent_api = load_api(tmp_path)
+
+    assert fluent_api.translations["a"]["en"].value == "Two"
+    assert fluent_api.files[Path("en", "main.ftl")].variables == ["b", "a"]
+
+    fluent_api.update("b", "en", "value", "BB")
+    fluent_api.save_all_files()
+
+    assert (tmp_path / "en" / "main.ftl").read_text("utf-8") == source.replace(
+        "b = B", "b = BB"
+    )
+
+
+def test_files_without_messages_are_copied_as_they_are(tmp_path, load_api):
+    locales = make_project(tmp_path / "locales")
+    notes = "### Only comments\n\nnot a message\n"
+    (locales / "de" / "notes.ftl").write_text(notes, encoding="utf-8")
+    fluent_api = load_api(locales)
+
+    fluent_api.save_all_files(str(tmp_path / "copy"))
+
+    assert (tmp_path / "copy" / "de" / "notes.ftl").read_text("utf-8") == notes
+
+
+def test_entry_added_to_a_file_without_messages_follows_its_text(tmp_path, load_api):
+    for language, text in (("en", "a = A\n"), ("de", "# Not translated yet\n")):
+        (tmp_path / language).mkdir()
+        (tmp_path / language / "main.ftl").write_text(text, encoding="utf-8")
+    fluent_api = load_api(tmp_path)
+
+    fluent_api.update("a", "de", "value", "A-de")
+    fluent_api.save_all_files()
+
+    assert (tmp_path / "de" / "main.ftl").read_text("utf-8") == (
+        "# Not translated yet\n\na = A-de\n"
+    )
@@ -0,0 +1,47 @@
+import pytest
+
+
+@pytest.fixture
+def fluent_api(locales, load_api):
+    return load_api(locales)
+
+
+def value(fluent_api) -> str:
+    return fluent_api.translations["logout"]["en"].value
+
+
+def test_values_are_normalized(fluent_api):
+    assert fluent_api.update("logout", "en", "value", "Bye {$name}")
+    assert value(fluent_api) == "Bye { $name }"
+
+    assert not fluent_api.update("logout", "en", "value", "Bye { $name }")
+
+
+def test_without_normalize_the_text_is_stored_as_typed(fluent_api):
+    assert fluent_api.update("logout", "en", "value", "Bye {$name}", normalize=False)
+    assert value(fluent_api) == "Bye {$name}"
+    assert ("logout", "en") in fluent_api.dirty
+
+    # Normalising later is a change of its own
+    assert fluent_api.update("logout", "en", "value", "Bye {$name}")
+    assert value(fluent_api) == "Bye { $name }"
+
+
+def test_without_normalize_continuation_lines_are_still_unindented(fluent_api):
+    fluent_api.update("logout", "en", "value", "Line\n one", normalize=False)
+
+    assert value(fluent_api) == "Line\none"
+
+
+def test_invalid_text_is_kept_as_typed(fluent_api):
+    fluent_api.update("logout", "en", "value", "Broken {", normalize=False)
+
+    assert not fluent_api.update("logout", "en", "value", "Broken {")
+    assert value(fluent_api) == "Broken {"
+
+
+def test_text_stored_as_typed_is_saved_normalized(fluent_api, locales):
+    fluent_api.update("logout", "en", "value", "Bye {$name}", normalize=False)
+    fluent_api.save_all_files()
+
+    assert "logout = Bye { $name }\n" in (locales / "en" / "en1.ftl").read_text("utf-8")